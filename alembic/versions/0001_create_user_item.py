@@ -0,0 +1,46 @@
+"""create user and item tables
+
+init_db의 create_all로 만들던 스키마입니다. 이미 create_all로 만든 DB는
+`alembic stamp 0001` 후 upgrade 하세요.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("hashed_password", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+    )
+    op.create_index("ix_user_id", "user", ["id"])
+    op.create_index("ix_user_email", "user", ["email"], unique=True)
+
+    op.create_table(
+        "item",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("user.id"), nullable=True),
+    )
+    op.create_index("ix_item_id", "item", ["id"])
+    op.create_index("ix_item_title", "item", ["title"])
+    op.create_index("ix_item_description", "item", ["description"])
+
+
+def downgrade():
+    op.drop_table("item")
+    op.drop_table("user")
@@ -0,0 +1,26 @@
+"""add composite index for keyset pagination of items
+
+판매자별 상품 목록(owner_id = ? AND id > ? ORDER BY id LIMIT n)을 인덱스 범위 조회 한 번으로 처리합니다.
+전체 목록의 keyset 조회(id > ?)는 기본 키로 처리되므로 별도 인덱스가 필요 없습니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_all로 만든 DB에는 이미 있을 수 있습니다.
+    op.create_index("ix_item_owner_id_id", "item", ["owner_id", "id"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_item_owner_id_id", table_name="item")
@@ -0,0 +1,44 @@
+"""replace description b-tree index with trigram search indexes
+
+ix_item_description은 길이 제한 없는 본문에 건 b-tree 인덱스라 등록마다 비용만 늘리고
+부분 일치 검색(ILIKE '%q%')에는 쓰이지 않으므로 삭제합니다.
+PostgreSQL에서는 pg_trgm 확장과 title/description GIN 인덱스를 만들어 GET /items?q= 검색에 사용합니다.
+owner_id는 0002의 (owner_id, id) 복합 인덱스가 선두 컬럼으로 이미 처리하므로 단일 인덱스를 추가하지 않습니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# 이름 → 컬럼 (app.models.item.TRIGRAM_INDEXES와 같아야 합니다)
+TRIGRAM_INDEXES = {
+    "ix_item_title_trgm": "title",
+    "ix_item_description_trgm": "description",
+}
+
+
+def upgrade():
+    op.drop_index("ix_item_description", table_name="item", if_exists=True)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES.items():
+        op.create_index(
+            name, "item", [column],
+            postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}, if_not_exists=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        for name in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name="item")
+    op.create_index("ix_item_description", "item", ["description"])
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from .endpoints import users, items, auth, test, index, crawl, search
+from .endpoints import users, items, auth, test, index, crawl, search, metrics
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -9,3 +9,4 @@ api_router.include_router(test.router, prefix="/test", tags=["test data"])
 api_router.include_router(index.router, prefix="/index", tags=["index single item"])
 api_router.include_router(crawl.router, prefix="/crawl", tags=["crawl single item"])
 api_router.include_router(search.router, prefix="/search", tags=["Search Items"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
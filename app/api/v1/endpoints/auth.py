@@ -1,7 +1,7 @@
 # api/v1/endpoints/auth.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from app.schemas.user import UserCreate, UserLogin, Token, UserDelete
-from app.services.auth import create_user, login_user, delete_user
+from app.services.auth import create_user, login_user, delete_user, get_current_user_record
 from app.utils.security import get_current_user
 
 router = APIRouter()
@@ -21,3 +21,7 @@ async def login(user: UserLogin):
 @router.get("/protected")
 async def protected_route(current_user: str = Depends(get_current_user)):
     return {"message": f"Hello, {current_user}"}
+
+@router.get("/me")
+async def read_me(user: dict = Depends(get_current_user_record)):
+    return {"id": user["id"], "username": user["username"]}
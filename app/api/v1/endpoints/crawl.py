@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import List
 from app.services.crawl_service import CrawlService
+from app.services.crawl_pipeline import StreamingCrawlPipeline
 from app.dependencies import get_crawl_service  # 의존성 주입 함수 import
 import logging
 
@@ -19,6 +20,8 @@ class ItemOption(BaseModel):
 
 class CrawlRequest(BaseModel):
     items_options: List[ItemOption]
+    backend: str = Field("selenium", regex="^(selenium|http)$", description="페이지 수집 방식 (selenium: 브라우저 렌더링, http: 검색 API 직접 호출)")
+    stream: bool = Field(False, description="크롤링하면서 일정 크기 배치로 바로 저장 (단계별 처리량 반환)")
 
 @router.post("/", summary="Bunjang 크롤링 실행")
 def crawl_endpoint(request: CrawlRequest, crawl_service: CrawlService = Depends(get_crawl_service)):
@@ -33,7 +36,11 @@ def crawl_endpoint(request: CrawlRequest, crawl_service: CrawlService = Depends(
     ]
     
     try:
-        result = crawl_service.run_scraper(items_options=items_options, num_workers=8)
+        if request.stream:
+            pipeline = StreamingCrawlPipeline(crawl_service, index_name='items')
+            return pipeline.run(items_options, num_workers=8, backend=request.backend)
+
+        result = crawl_service.run_scraper(items_options=items_options, num_workers=8, backend=request.backend, include_sold=True)
         status = crawl_service.save_item(result, index_name='items')
         return status
     except Exception as e:
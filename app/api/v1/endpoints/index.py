@@ -1,18 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app import models
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import schemas
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.services.item_service import create_item, get_items
 
 router = APIRouter()
 
 @router.post("/index_item", response_model=schemas.Item)
-def index_item(item_in: schemas.ItemCreate, db: Session = Depends(get_db)):
-    item = create_item(db=db, item_in=item_in)
+async def index_item(item_in: schemas.ItemCreate, db: AsyncSession = Depends(get_async_db)):
+    item = await create_item(db=db, item_in=item_in)
     return item
 
 @router.get("/index_items", response_model=list[schemas.Item])
-def index_items(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    items = get_items(db=db, skip=skip, limit=limit)
+async def index_items(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_async_db)):
+    items = await get_items(db=db, skip=skip, limit=limit)
     return items
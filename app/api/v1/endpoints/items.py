@@ -1,18 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app import models
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import schemas
-from app.db.session import get_db
-from app.services.item_service import create_item, get_items
+from app.db.session import get_async_db
+from app.services.item_service import create_item, create_items_bulk, get_items_page
 
 router = APIRouter()
 
+# 다음 페이지 cursor를 전달하는 응답 헤더 (본문은 기존과 같은 상품 목록)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 @router.post("/", response_model=schemas.Item)
-def create_new_item(item_in: schemas.ItemCreate, db: Session = Depends(get_db)):
-    item = create_item(db=db, item_in=item_in)
+async def create_new_item(item_in: schemas.ItemCreate, db: AsyncSession = Depends(get_async_db)):
+    item = await create_item(db=db, item_in=item_in)
     return item
 
+@router.post("/bulk", response_model=schemas.ItemBulkResult)
+async def create_items_in_bulk(bulk_in: schemas.ItemBulkCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    상품을 한 번에 최대 ITEMS_BULK_MAX_ITEMS개 등록합니다.
+    ITEMS_BULK_CHUNK_SIZE개씩 INSERT 한 번과 트랜잭션 하나로 처리하며, 실패한 청크가 있어도 나머지는 등록합니다.
+    """
+    return await create_items_bulk(db=db, items_in=bulk_in.items)
+
 @router.get("/", response_model=list[schemas.Item])
-def read_items(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    items = get_items(db=db, skip=skip, limit=limit)
+async def read_items(
+    response: Response,
+    skip: int = Query(0, ge=0, description="건너뛸 상품 수 (offset 방식, 얕은 페이지용)"),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값 (keyset 방식)"),
+    owner_id: Optional[int] = Query(None, description="판매자 id 필터"),
+    order: str = Query("asc", regex="^(asc|desc)$", description="id 정렬 방향"),
+    q: Optional[str] = Query(
+        None, min_length=3, max_length=100,
+        description="title/description 부분 일치 검색어 (trigram 인덱스를 쓰도록 3자 이상)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    상품 목록을 id 순으로 조회합니다.
+    페이지가 가득 차면 X-Next-Cursor 헤더로 다음 페이지 cursor를 반환하며,
+    cursor로 요청하면 OFFSET 없이 마지막 id 다음부터 읽어 깊은 페이지도 첫 페이지와 비용이 같습니다.
+    q를 주면 title 또는 description에 검색어가 포함된 상품만 DB에서 찾으며, cursor 페이지네이션과 함께 쓸 수 있습니다.
+    """
+    try:
+        items, next_cursor = await get_items_page(
+            db=db, skip=skip, limit=limit, cursor=cursor, owner_id=owner_id, order=order, q=q
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return items
@@ -0,0 +1,28 @@
+# app/api/v1/endpoints/metrics.py
+
+from fastapi import APIRouter
+from app.db.database import database
+from app.services.auth import user_cache
+from app.services.password_hasher import password_hasher
+from app.services.search_cache import search_cache
+from app.services.service_container import service_container
+from app.utils.security import token_cache
+
+router = APIRouter()
+
+@router.get("/", summary="서비스 내부 캐시/풀 지표 조회")
+async def read_metrics():
+    return {
+        "search_cache": search_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "auth": {"tokens": token_cache.stats(), "users": user_cache.stats()},
+        "db_pool": database.stats(),
+        "suggest": (
+            service_container.suggest_service.stats()
+            if service_container.suggest_service else None
+        ),
+        "crawl_page_load": (
+            service_container.crawl_service.page_metrics.summary()
+            if service_container.crawl_service else None
+        ),
+    }
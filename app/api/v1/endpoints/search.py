@@ -1,36 +1,49 @@
 # routers/search.py
 
-from fastapi import APIRouter, HTTPException, Depends
-from elasticsearch import Elasticsearch
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List
-from app.schemas.search import SearchRequest, SearchResponse
-from app.services.search_service import SearchService
+from app.core.config import settings
+from app.schemas.search import SearchRequest, SearchResponse, SuggestResponse
+from app.services.search_service import AsyncSearchService
+from app.services.suggest_service import SuggestService
+from app.dependencies import get_async_search_service, get_suggest_service  # 공유 클라이언트 기반 의존성 주입
 
 router = APIRouter(
-    tags=["Search"]
+    tags=["Search"],
+    default_response_class=ORJSONResponse,
 )
 
-# Elasticsearch 클라이언트 초기화 함수 (es_client.py로 분리할 수도 있음)
-def get_elasticsearch_client(host: str = "http://localhost:9200") -> Elasticsearch:
-    es = Elasticsearch(host)
-    if not es.ping():
-        raise HTTPException(status_code=500, detail="Elasticsearch에 연결할 수 없습니다.")
-    return es
-
-# SearchService 의존성 주입
-def get_search_service(es: Elasticsearch = Depends(get_elasticsearch_client)) -> SearchService:
-    return SearchService(es=es, index_name="items")
-
 @router.post("/", response_model=SearchResponse)
-def search_items(
+async def search_items(
     request: SearchRequest,
-    search_service: SearchService = Depends(get_search_service)
+    search_service: AsyncSearchService = Depends(get_async_search_service)
 ):
     """
     Elasticsearch에서 '제목' 필드로 검색을 수행하는 엔드포인트입니다.
+    스레드풀을 거치지 않고 이벤트 루프에서 AsyncElasticsearch로 검색합니다.
+    결과는 SearchService가 응답 형태로 만들어 두므로 response_model 재검증 없이 orjson으로 바로 직렬화합니다.
+    (response_model은 OpenAPI 문서용으로 유지합니다)
     """
     try:
-        result = search_service.search_items(request)
-        return result
+        result = await search_service.search_items(request)
+        return ORJSONResponse(result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail="검색 중 오류가 발생했습니다.")
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest_titles(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어"),
+    size: int = Query(10, ge=1, le=settings.SUGGEST_TOP_K, description="최대 제안 수"),
+    suggest_service: SuggestService = Depends(get_suggest_service)
+):
+    """
+    검색창 자동완성 엔드포인트입니다. 키 입력마다 호출되는 것을 전제로,
+    인기 제목의 접두어는 메모리 trie에서, 나머지는 title.suggest 필드 검색으로 응답합니다.
+    """
+    try:
+        return await suggest_service.suggest(q, size)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="자동완성 중 오류가 발생했습니다.")
@@ -1,20 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app import models
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.schemas import schemas
-from app.db.session import get_db
+from app.db.session import get_async_db
+from app.services.password_hasher import PasswordHasherBusy
 from app.services.user_service import create_user, get_user
 
 router = APIRouter()
 
 @router.post("/", response_model=schemas.User)
-def create_new_user(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
-    user = create_user(db=db, user_in=user_in)
+async def create_new_user(user_in: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        user = await create_user(db=db, user_in=user_in)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many requests, please retry",
+            headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+        )
     return user
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user(user_id: int, db: Session = Depends(get_db)):
-    user = get_user(db=db, user_id=user_id)
+async def read_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    user = await get_user(db=db, user_id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
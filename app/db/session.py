@@ -1,14 +1,48 @@
+from typing import Any, AsyncIterator, Dict
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
 engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 같은 DB의 비동기 드라이버 URL로 바꿉니다. (sqlite → aiosqlite, postgresql → asyncpg)"""
+    for sync_prefix, async_prefix in (("sqlite://", "sqlite+aiosqlite://"), ("postgresql://", "postgresql+asyncpg://")):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+def async_engine_options(url: str) -> Dict[str, Any]:
+    """asyncpg 풀(app/db/database.py)과 같은 DB_POOL_* 설정으로 비동기 엔진의 커넥션 풀을 구성합니다."""
+    if ":memory:" in url:
+        # 메모리 SQLite는 커넥션마다 DB가 따로 생기므로 풀 설정을 적용하지 않습니다.
+        return {}
+    options = {
+        "pool_size": settings.DB_POOL_MIN_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_SIZE - settings.DB_POOL_MIN_SIZE,
+        "pool_timeout": settings.DB_POOL_ACQUIRE_TIMEOUT,
+    }
+    if url.startswith("sqlite"):
+        # SQLAlchemy 1.4는 파일 SQLite에 NullPool(요청마다 새 커넥션)을 쓰므로 큐 풀을 직접 지정합니다.
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return options
+
+ASYNC_DATABASE_URL = async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **async_engine_options(ASYNC_DATABASE_URL))
+AsyncSessionLocal = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """요청마다 AsyncSession을 열고 응답 후 닫습니다. (이벤트 루프에서 DB I/O를 기다립니다)"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,10 +1,43 @@
 # app/dependencies.py
 
 from fastapi import Depends, HTTPException
+from elasticsearch import Elasticsearch, AsyncElasticsearch
 from app.services.service_container import service_container
 from app.services.crawl_service import CrawlService
+from app.services.search_service import SearchService, AsyncSearchService
+from app.services.search_cache import search_cache
+from app.services.suggest_service import SuggestService
+from app.core.config import settings
 
 def get_crawl_service() -> CrawlService:
     if not service_container.crawl_service:
         raise HTTPException(status_code=500, detail="CrawlService 인스턴스가 초기화되지 않았습니다.")
     return service_container.crawl_service
+
+def get_elasticsearch_client() -> Elasticsearch:
+    """startup에서 생성한 공유 클라이언트를 반환합니다. 상태는 백그라운드 health probe 결과로 판단합니다."""
+    if not service_container.es_client:
+        raise HTTPException(status_code=500, detail="Elasticsearch 클라이언트가 초기화되지 않았습니다.")
+    if service_container.es_health and not service_container.es_health.healthy:
+        raise HTTPException(status_code=503, detail="Elasticsearch에 연결할 수 없습니다.")
+    return service_container.es_client
+
+def get_search_service(es: Elasticsearch = Depends(get_elasticsearch_client)) -> SearchService:
+    return SearchService(es=es, index_name="items", cache=search_cache if settings.SEARCH_CACHE_ENABLED else None)
+
+def get_async_elasticsearch_client() -> AsyncElasticsearch:
+    """startup에서 생성한 공유 AsyncElasticsearch 클라이언트를 반환합니다."""
+    if not service_container.async_es_client:
+        raise HTTPException(status_code=500, detail="Elasticsearch 클라이언트가 초기화되지 않았습니다.")
+    if service_container.es_health and not service_container.es_health.healthy:
+        raise HTTPException(status_code=503, detail="Elasticsearch에 연결할 수 없습니다.")
+    return service_container.async_es_client
+
+def get_async_search_service(es: AsyncElasticsearch = Depends(get_async_elasticsearch_client)) -> AsyncSearchService:
+    return AsyncSearchService(es=es, index_name="items", cache=search_cache if settings.SEARCH_CACHE_ENABLED else None)
+
+def get_suggest_service(es: AsyncElasticsearch = Depends(get_async_elasticsearch_client)) -> SuggestService:
+    """자동완성 trie를 요청 간에 공유하도록 첫 요청에서 만든 SuggestService를 재사용합니다."""
+    if service_container.suggest_service is None:
+        service_container.suggest_service = SuggestService(es=es, index_name="items")
+    return service_container.suggest_service
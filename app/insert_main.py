@@ -1,8 +1,12 @@
 import os
+import argparse
 from dotenv import load_dotenv
-from elasticsearch import Elasticsearch, NotFoundError, helpers
+from elasticsearch import Elasticsearch, NotFoundError
 import pandas as pd
-from datetime import datetime, timedelta
+from app.services.bulk_indexer import BulkIndexer
+from app.services.crawl_service import item_document_id
+from app.services.es_service import EsService
+from app.services.item_fingerprint import content_fingerprint
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
@@ -20,95 +24,79 @@ def check_es_connection():
         return False
 
 def create_index_if_not_exists(index_name):
-    """인덱스가 없으면 기본 설정으로 생성하는 함수"""
+    """인덱스가 없으면 app/config/items_mapping.json 매핑으로 생성하는 함수"""
     if not es.indices.exists(index=index_name):
-        # 기본 설정
-        settings = {
-            "index": {
-                "number_of_shards": 1,
-                "number_of_replicas": 1
-            }
-        }
-        mappings = {
-            "properties": {
-                "img_src": {"type": "text"},  # img src 필드 추가
-                "category": {"type": "text"},
-                "subject": {"type": "text"},  # subject 필드 추가
-                "price": {"type": "integer"},
-                "date": {"type": "date"},
-                "location": {"type": "text"},
-                "link": {"type": "text"},
-                "status": {"type": "text"}
-            }
-        }
-        
-        # 인덱스 생성
-        es.indices.create(index=index_name, body={
-            "settings": settings,
-            "mappings": mappings
-        })
+        # 인덱스 생성 (재색인과 같은 매핑 파일 사용)
+        es.indices.create(index=index_name, body=EsService(client=es).load_mapping())
         
         print(f"인덱스 '{index_name}'가 생성되었습니다.")
     else:
         print(f"인덱스 '{index_name}'가 이미 존재합니다.")
 
-def insert_data(index_name):
-    df = pd.read_excel('./bunjang.xlsx')
-    
-    def generate_actions():
-        for index, row in df.iterrows():
-            try:
-                doc = {
-                    "img_src": str(row['src']),
-                    "category": str(row['category']),
-                    "subject": str(row['제목']),
-                    "subject_suggest": str(row['제목']),
-                    "price": int(row['price']) if pd.notna(row['price']) else 0,
-                    "date": parse_date(str(row['등록일시'])),
-                    "location": str(row['위치']) if pd.notna(row['위치']) else "",
-                    "link": str(row['링크']) if pd.notna(row['링크']) else "",
-                    "status": str(row['상태']) if pd.notna(row['상태']) else ""
-                }
-                
-                # None 값 제거
-                doc = {k: v for k, v in doc.items() if v is not None}
-                
-                yield {
-                    "_index": index_name,
-                    "_source": doc
-                }
-            except Exception as e:
-                print(f"Error processing document {index}: {e}")
-                print(f"Problematic row: {row}")
+def generate_actions(df, index_name):
+    """
+    bunjang.xlsx의 각 행을 크롤러 저장 문서와 같은 형식의 bulk 인덱싱 액션으로 변환하는 함수.
+    크롤러와 같은 고정 _id(상품 링크 해시)를 사용하므로 같은 상품은 한 문서로 저장됩니다.
+    """
+    for index, row in df.iterrows():
+        try:
+            doc = {
+                "category": str(row['category']),
+                "title": str(row['제목']),
+                "price": int(row['price']) if pd.notna(row['price']) else 0,
+                "registration_date": str(row['등록일시']) if pd.notna(row['등록일시']) else None,
+                "location": str(row['위치']) if pd.notna(row['위치']) else "",
+                "link": str(row['링크']) if pd.notna(row['링크']) else "",
+                "src": str(row['src']) if pd.notna(row['src']) else "",
+                "status": str(row['상태']) if pd.notna(row['상태']) else ""
+            }
+
+            # None 값 제거
+            doc = {k: v for k, v in doc.items() if v is not None}
+            # 크롤러 저장 문서처럼 내용 fingerprint를 함께 넣어 다음 크롤링에서 변경 여부를 비교할 수 있게 합니다.
+            doc["fingerprint"] = content_fingerprint(doc)
+
+            yield {
+                "_index": index_name,
+                "_id": item_document_id(doc),
+                "_source": doc
+            }
+        except Exception as e:
+            print(f"Error processing document {index}: {e}")
+            print(f"Problematic row: {row}")
+
+def insert_data(index_name, path='./bunjang.xlsx', bulk_load=True, indexer=None):
+    """
+    엑셀 데이터를 BulkIndexer로 병렬 적재하는 함수.
+    bulk_load가 True이면 적재하는 동안 refresh를 끄고 replica를 0으로 낮춘 뒤 원래 설정으로 되돌립니다.
+    """
+    df = pd.read_excel(path)
+    indexer = indexer or BulkIndexer(es)
 
     try:
-        # bulk 작업 실행
-        success, failed = helpers.bulk(es, generate_actions(), stats_only=True)
-        print(f"Successfully indexed {success} documents")
-        if failed:
-            print(f"Failed to index {failed} documents")
+        if bulk_load:
+            with indexer.bulk_load_mode(index_name):
+                result = indexer.index(generate_actions(df, index_name))
+        else:
+            result = indexer.index(generate_actions(df, index_name))
+        print(f"Successfully indexed {result.succeeded} documents "
+              f"({result.elapsed:.2f}s, {result.chunks} chunks, {result.retries} retries)")
+        if result.failed:
+            print(f"Failed to index {result.failed} documents, e.g. {result.errors[:3]}")
     except Exception as e:
         print(f"Error during bulk indexing: {e}")
 
     print("Indexing completed.")
 
-def parse_date(date_str):
-    try:
-        if '일 전' in date_str:
-            days_ago = int(date_str.replace('일 전', '').strip())
-            return (datetime.now() - timedelta(days=days_ago)).strftime('%Y-%m-%d')
-        elif '시간 전' in date_str:
-            hours_ago = int(date_str.replace('시간 전', '').strip())
-            return (datetime.now() - timedelta(hours=hours_ago)).strftime('%Y-%m-%d')
-        elif '분 전' in date_str:
-            minutes_ago = int(date_str.replace('분 전', '').strip())
-            return (datetime.now() - timedelta(minutes=minutes_ago)).strftime('%Y-%m-%d')
-        else:
-            # 다른 날짜 형식에 대한 처리를 추가할 수 있습니다.
-            return date_str
-    except ValueError:
-        print(f"날짜 파싱 오류: {date_str}")
-        return None
+def reindex_data(alias, path='./bunjang.xlsx'):
+    """
+    서비스 중인 별칭을 그대로 둔 채 새 버전 인덱스(alias_vN)에 전체 데이터를 적재하고 별칭을 교체하는 함수.
+    적재하는 동안에도 검색은 기존 인덱스를 사용하고, 그동안 크롤러가 저장한 문서는 교체 직전에 새 인덱스로 옮깁니다.
+    """
+    df = pd.read_excel(path)
+    result = EsService(client=es).reindex(alias, lambda index_name: generate_actions(df, index_name))
+    print(f"Reindexed {result['bulk']['succeeded']} documents into '{result['index']}' "
+          f"(caught up: {result['caught_up']}, previous: {result['previous']}, deleted: {result['deleted']}, timings: {result['timings']})")
 
 def delete_index(es, index_name):
     """
@@ -130,18 +118,21 @@ def delete_index(es, index_name):
 
     print(f"'{index_name}'와 관련된 모든 요소의 삭제 작업이 완료되었습니다.")
 
-# 사용 예시
+# 사용 예시 (프로젝트 루트에서 python -m app.insert_main 으로 실행)
 if __name__ == "__main__":
-    # Elasticsearch 연결 설정
-    es_host = os.getenv('ELASTICSEARCH_HOST', 'http://localhost:9200')
-    es = Elasticsearch([es_host], verify_certs=False)
+    parser = argparse.ArgumentParser(description="bunjang.xlsx 데이터를 Elasticsearch에 적재합니다.")
+    parser.add_argument("--in-place", action="store_true", help="새 버전 인덱스 대신 기존 인덱스에 바로 적재")
+    parser.add_argument("--no-bulk-load", action="store_true", help="refresh/replica 설정을 바꾸지 않고 적재 (--in-place)")
+    args = parser.parse_args()
+
     index_name = "items"
-    # 인덱스 삭제
-    
-    # delete_index(es, "items")
-    
-    # 새 인덱스 생성
-    create_index_if_not_exists(index_name)
-    
-    # 데이터 삽입
-    insert_data(index_name)
+
+    if args.in_place:
+        # 새 인덱스 생성
+        create_index_if_not_exists(index_name)
+
+        # 데이터 삽입
+        insert_data(index_name, bulk_load=not args.no_bulk_load)
+    else:
+        # items_vN 인덱스에 적재 후 items 별칭 교체 (delete_index 없이 전체 재적재)
+        reindex_data(index_name)
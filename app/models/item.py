@@ -1,11 +1,25 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
+# 마이그레이션(0003)이 PostgreSQL에서만 만드는 pg_trgm GIN 인덱스 (이름 → 컬럼)
+# 방언 전용이라 모델에는 선언하지 않으며, alembic env.py의 autogenerate 비교에서 제외합니다.
+TRIGRAM_INDEXES = {
+    "ix_item_title_trgm": "title",
+    "ix_item_description_trgm": "description",
+}
+
 class Item(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
-    description = Column(String, index=True)
+    # 길이 제한 없는 본문이라 b-tree 인덱스는 두지 않습니다. (검색은 TRIGRAM_INDEXES 사용)
+    description = Column(String)
     owner_id = Column(Integer, ForeignKey("user.id"))
 
     owner = relationship("User", back_populates="items")
+
+    __table_args__ = (
+        # 판매자별 목록의 keyset 페이지네이션 (owner_id = ? AND id > ? ORDER BY id)
+        # owner_id가 선두 컬럼이라 외래 키 조인/필터도 이 인덱스를 사용합니다.
+        Index("ix_item_owner_id_id", "owner_id", "id"),
+    )
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from app.core.config import settings
 
 class UserBase(BaseModel):
     email: str
@@ -22,11 +23,28 @@ class ItemCreate(ItemBase):
 
 class Item(ItemBase):
     id: int
-    owner_id: int
+    owner_id: int | None = None
 
     class Config:
         orm_mode = True
 
+class ItemBulkEntry(ItemCreate):
+    owner_id: int | None = None
+
+class ItemBulkCreate(BaseModel):
+    items: list[ItemBulkEntry] = Field(..., min_items=1, max_items=settings.ITEMS_BULK_MAX_ITEMS)
+
+class ItemBulkError(BaseModel):
+    start: int  # 실패한 청크의 첫 상품 위치 (요청 items 기준)
+    count: int
+    error: str
+
+class ItemBulkResult(BaseModel):
+    created: int
+    failed: int
+    ids: list[int | None]  # 요청 items와 같은 순서, 실패한 청크의 상품은 None
+    errors: list[ItemBulkError]
+
 class Token(BaseModel):
     access_token: str
     token_type: str
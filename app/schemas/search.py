@@ -1,12 +1,16 @@
 # schemas/search.py
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Union
 from pydantic import BaseModel, Field, validator
+from app.core.config import settings
 
 class SearchRequest(BaseModel):
     query: str = Field(..., min_length=1, example="프라다", description="검색할 제목 키워드")
     min_price: Optional[int] = Field(None, ge=0, example=200000, description="최소 가격")
     max_price: Optional[int] = Field(None, ge=0, example=5000000, description="최대 가격")
+    category: Optional[List[str]] = Field(None, example=["프라다"], description="카테고리 필터 (여러 개면 OR)")
+    status: Optional[str] = Field(None, regex="^(판매중|판매완료)$", description="판매 상태 필터")
+    facets: bool = Field(False, description="카테고리별 결과 수(facet)를 함께 반환")
     sort: Optional[str] = Field(
         "price",
         regex="^(price)$",  # '등록일시'를 제외하고 'price'만 허용
@@ -17,12 +21,20 @@ class SearchRequest(BaseModel):
         regex="^(asc|desc)$",
         description="정렬 순서 (asc 또는 desc)"
     )
-    page: Optional[int] = Field(1, ge=1, description="페이지 번호")
+    page: Optional[int] = Field(1, ge=1, description="페이지 번호 (얕은 페이지 전용, from/size 사용)")
     size: int = Field(10, ge=1, le=100, description="페이지당 항목 수")
-    search_after: Optional[List[int]] = Field(
+    search_after: Optional[List[Union[int, str]]] = Field(
         None,
         description="search_after 값 (sort 기준으로 전달)"
     )
+    cursor_mode: bool = Field(
+        False,
+        description="첫 페이지부터 point-in-time 스냅샷으로 조회하고 next_cursor를 반환 (깊은 페이지 탐색 시작)"
+    )
+    cursor: Optional[str] = Field(
+        None,
+        description="이전 응답의 next_cursor 값 (깊은 페이지 탐색용)"
+    )
 
     @validator('search_after', always=True)
     def check_search_after(cls, v, values):
@@ -30,6 +42,22 @@ class SearchRequest(BaseModel):
             raise ValueError("search_after는 페이지 1이 아닐 때만 사용 가능합니다.")
         return v
 
+    @validator('cursor', always=True)
+    def check_cursor(cls, v, values):
+        cursor_mode = v or values.get('cursor_mode')
+        if cursor_mode and ('page' in values and values['page'] != 1):
+            raise ValueError("cursor는 page와 함께 사용할 수 없습니다.")
+        if cursor_mode and values.get('search_after'):
+            raise ValueError("cursor와 search_after는 함께 사용할 수 없습니다.")
+        # from/size 방식은 얕은 페이지에서만 허용합니다.
+        page = values.get('page') or 1
+        size = values.get('size') or 0
+        if not cursor_mode and page * size > settings.SEARCH_MAX_RESULT_WINDOW:
+            raise ValueError(
+                f"page * size는 {settings.SEARCH_MAX_RESULT_WINDOW}를 넘을 수 없습니다. 깊은 페이지는 cursor_mode를 사용하세요."
+            )
+        return v
+
 class SearchResponseItem(BaseModel):
     category: Optional[str]
     title: Optional[str]
@@ -40,9 +68,21 @@ class SearchResponseItem(BaseModel):
     src: Optional[str]
     status: Optional[str]
 
+class FacetBucket(BaseModel):
+    key: str
+    count: int
+
 class SearchResponse(BaseModel):
     total: int
-    page: Optional[int] = None  # search_after 사용 시 페이지 정보가 필요 없을 수 있음
+    total_relation: str = "eq"  # total이 SEARCH_TRACK_TOTAL_HITS 상한에 걸리면 gte
+    facets: Optional[Dict[str, List[FacetBucket]]] = None  # facets 요청 시 카테고리별 결과 수
+    page: Optional[int] = None  # search_after/cursor 사용 시 페이지 정보가 필요 없을 수 있음
     size: int
-    last_sort: Optional[List[int]] = None  # search_after에 사용되는 sort 값
+    last_sort: Optional[List[Union[int, str]]] = None  # search_after에 사용되는 sort 값
+    next_cursor: Optional[str] = None  # 다음 페이지 요청에 그대로 전달하는 opaque cursor
     results: List[SearchResponseItem]
+
+class SuggestResponse(BaseModel):
+    query: str
+    suggestions: List[str]
+    source: str  # trie (메모리 캐시), trie+es (trie 결과를 es로 보충) 또는 es
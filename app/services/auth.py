@@ -1,23 +1,67 @@
+from app.core.config import settings
 from app.db.database import database
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.services.password_hasher import password_hasher, PasswordHasherBusy
+from app.utils.security import create_access_token, get_current_user
+from app.utils.ttl_cache import TTLCache, MISSING
 from app.schemas.user import UserCreate, UserDelete, UserLogin
 from app.sql import user_queries  # 쿼리 모듈 임포트
 from typing import Optional
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
+
+# 토큰 검증용 사용자 레코드 캐시 (키: username, 값에는 hashed_password를 넣지 않습니다)
+# 로그인/탈퇴의 비밀번호 검증은 항상 DB를 새로 읽습니다. 탈퇴 시 delete_user가 이 워커의 항목만 바로 지우므로,
+# 다른 워커에서는 탈퇴한 사용자의 토큰이 최대 AUTH_USER_CACHE_TTL 동안 더 통과할 수 있습니다.
+user_cache = TTLCache(max_entries=settings.AUTH_USER_CACHE_SIZE, ttl=settings.AUTH_USER_CACHE_TTL)
 
 async def get_user_by_username(username: str) -> Optional[dict]:
+    """DB에서 사용자 레코드(hashed_password 포함)를 조회합니다. 캐시를 거치지 않습니다."""
     query = user_queries.GET_USER_BY_USERNAME
-    user = await database.pool.fetchrow(query, username)
+    user = await database.fetchrow(query, username)
+    return dict(user) if user is not None else None
+
+async def get_cached_user(username: str) -> Optional[dict]:
+    """토큰 검증에 필요한 사용자 레코드(hashed_password 제외)를 캐시에서, 없으면 DB에서 조회합니다."""
+    user = user_cache.get(username)
+    if user is not MISSING:
+        return user
+    user = await get_user_by_username(username)
+    if user is None:
+        # 없는 사용자는 캐시하지 않습니다. (가입 직후 조회가 바로 보이도록)
+        return None
+    user = {key: value for key, value in user.items() if key != 'hashed_password'}
+    user_cache.set(username, user)
     return user
 
+async def get_current_user_record(username: str = Depends(get_current_user)) -> dict:
+    """토큰의 사용자 레코드를 반환하는 의존성입니다. 탈퇴한 사용자의 토큰은 401로 거절합니다."""
+    user = await get_cached_user(username)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+async def _run_hasher(operation, *args):
+    """비밀번호 해시/검증을 프로세스 풀에서 실행합니다. 풀이 가득 차면 503으로 요청을 거절합니다."""
+    try:
+        return await operation(*args)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests, please retry",
+            headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+        )
+
 async def create_user(user: UserCreate):
     existing_user = await get_user_by_username(user.username)
     if existing_user:
         raise HTTPException(status_code=400, detail="Username already exists")
     
-    hashed_pwd = hash_password(user.password)
+    hashed_pwd = await _run_hasher(password_hasher.hash, user.password)
     query = user_queries.CREATE_USER
-    await database.pool.execute(query, user.username, hashed_pwd)
+    await database.execute(query, user.username, hashed_pwd)
     return {"message": "User created successfully"}
 
 async def delete_user(user: UserDelete):
@@ -29,11 +73,12 @@ async def delete_user(user: UserDelete):
     if user.password != user.double_check_password:
         raise HTTPException(status_code=400, detail="Passwords do not match")
     
-    if not verify_password(user.password, existing_user['hashed_password']):
+    if not await _run_hasher(password_hasher.verify, user.password, existing_user['hashed_password']):
         raise HTTPException(status_code=401, detail="Incorrect password")
     
     query = user_queries.DELETE_USER
-    await database.pool.execute(query, existing_user['id'])
+    await database.execute(query, existing_user['id'])
+    user_cache.delete(user.username)
     return {"message": "User deleted successfully"}
 
 
@@ -41,7 +86,7 @@ async def authenticate_user(username: str, password: str):
     user = await get_user_by_username(username)
     if not user:
         return None
-    if not verify_password(password, user['hashed_password']):
+    if not await _run_hasher(password_hasher.verify, password, user['hashed_password']):
         return None
     return user
 
@@ -0,0 +1,210 @@
+# app/services/bulk_indexer.py
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+import orjson
+from elasticsearch import ApiError, Elasticsearch, TransportError
+from elasticsearch.helpers import expand_action
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 클러스터가 바쁠 때 돌려주는 상태 코드 (재시도 대상)
+RETRY_STATUSES = {429, 502, 503, 504}
+
+@dataclass
+class BulkResult:
+    """bulk 작업 결과입니다. 문서별 결과 수와 실패한 문서 목록을 담습니다."""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    results: Dict[str, int] = field(default_factory=dict)  # created/updated/noop/deleted 등
+    failed_ids: List[str] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retries": self.retries,
+            "chunks": self.chunks,
+            "elapsed": round(self.elapsed, 3),
+            "docs_per_sec": round(self.total / self.elapsed, 1) if self.elapsed else None,
+            "results": dict(self.results),
+            "errors": self.errors,
+        }
+
+class BulkIndexer:
+    """
+    helpers.bulk 대신 사용하는 재사용 가능한 bulk 인덱서입니다.
+
+    - 문서 수(chunk_size)와 요청 크기(max_chunk_bytes) 중 먼저 닿는 기준으로 요청을 나눕니다.
+    - workers개의 스레드가 동시에 bulk 요청을 보내며, 대기 중인 청크는 workers × 2개로 제한합니다.
+    - 429/503 등 거절된 요청과 문서는 지수 backoff 후 다시 보냅니다.
+    - 최종 실패한 문서는 _id, 상태 코드, 오류 내용을 문서별로 보고합니다.
+
+    Args:
+        es (Elasticsearch): Elasticsearch 클라이언트
+        chunk_size (int): 요청당 최대 문서 수
+        max_chunk_bytes (int): 요청당 최대 바이트 수
+        workers (int): 동시 bulk 요청 수
+        max_retries (int): 거절된 문서의 최대 재시도 횟수
+        initial_backoff (float): 첫 재시도 대기 시간 (초), 재시도마다 두 배
+        max_backoff (float): 최대 재시도 대기 시간 (초)
+        max_errors (int): 보고할 최대 오류 수
+    """
+
+    def __init__(
+        self,
+        es: Elasticsearch,
+        chunk_size: int = None,
+        max_chunk_bytes: int = None,
+        workers: int = None,
+        max_retries: int = None,
+        initial_backoff: float = None,
+        max_backoff: float = None,
+        max_errors: int = 100,
+    ):
+        self.es = es
+        # 429 등은 transport가 즉시 재시도하지 않게 하고 여기서 backoff를 적용합니다.
+        self._bulk_client = es.options(retry_on_status=())
+        self.chunk_size = chunk_size or settings.ES_BULK_CHUNK_SIZE
+        self.max_chunk_bytes = max_chunk_bytes or settings.ES_BULK_MAX_CHUNK_BYTES
+        self.workers = max(1, workers or settings.ES_BULK_WORKERS)
+        self.max_retries = settings.ES_BULK_MAX_RETRIES if max_retries is None else max_retries
+        self.initial_backoff = settings.ES_BULK_INITIAL_BACKOFF if initial_backoff is None else initial_backoff
+        self.max_backoff = settings.ES_BULK_MAX_BACKOFF if max_backoff is None else max_backoff
+        self.max_errors = max_errors
+        self._lock = threading.Lock()
+
+    def _chunks(self, actions: Iterable[Dict]) -> Iterator[List[Tuple[Dict, Optional[Dict]]]]:
+        """액션을 (header, body) 쌍으로 펼쳐 문서 수/바이트 기준으로 나눕니다."""
+        chunk: List[Tuple[Dict, Optional[Dict]]] = []
+        size = 0
+        for action in actions:
+            header, body = expand_action(action)
+            # NDJSON 한 줄마다 개행 문자 1바이트가 붙습니다.
+            action_size = len(orjson.dumps(header)) + 1 + (len(orjson.dumps(body)) + 1 if body is not None else 0)
+            if chunk and (len(chunk) >= self.chunk_size or size + action_size > self.max_chunk_bytes):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append((header, body))
+            size += action_size
+        if chunk:
+            yield chunk
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.max_backoff, self.initial_backoff * (2 ** attempt)) * (1 + random.random() * 0.1)
+
+    def _record_failure(self, result: BulkResult, doc_id: Optional[str], status: Optional[int], error: Any):
+        with self._lock:
+            result.failed += 1
+            result.failed_ids.append(doc_id)
+            if len(result.errors) < self.max_errors:
+                result.errors.append({"_id": doc_id, "status": status, "error": error})
+
+    def _send(self, chunk: List[Tuple[Dict, Optional[Dict]]], result: BulkResult):
+        pending = chunk
+        attempt = 0
+        while pending:
+            operations: List[Dict] = []
+            for header, body in pending:
+                operations.append(header)
+                if body is not None:
+                    operations.append(body)
+
+            retry: List[Tuple[Dict, Optional[Dict]]] = []
+            try:
+                response = self._bulk_client.bulk(operations=operations)
+            except (ApiError, TransportError) as e:
+                status = getattr(e, "status_code", None) if isinstance(e, ApiError) else None
+                if (status is None or status in RETRY_STATUSES) and attempt < self.max_retries:
+                    # 요청 전체가 거절되었거나 연결 오류이면 청크 전체를 다시 보냅니다.
+                    retry = pending
+                else:
+                    for header, _ in pending:
+                        self._record_failure(result, _action_id(header), status, str(e))
+            else:
+                for (header, body), item in zip(pending, response["items"]):
+                    op, info = next(iter(item.items()))
+                    status = info.get("status", 200)
+                    if "error" not in info and status < 300:
+                        with self._lock:
+                            result.succeeded += 1
+                            key = info.get("result", op)
+                            result.results[key] = result.results.get(key, 0) + 1
+                    elif status in RETRY_STATUSES and attempt < self.max_retries:
+                        retry.append((header, body))
+                    else:
+                        self._record_failure(result, info.get("_id"), status, info.get("error"))
+
+            if retry:
+                delay = self._backoff(attempt)
+                logger.warning(f"bulk 거절 {len(retry)}건 재시도 {attempt + 1}/{self.max_retries}, {delay:.2f}초 후")
+                with self._lock:
+                    result.retries += len(retry)
+                time.sleep(delay)
+                attempt += 1
+            pending = retry
+
+    def index(self, actions: Iterable[Dict]) -> BulkResult:
+        """
+        helpers.bulk 형식의 액션(_op_type, _index, _id, _source/doc ...)을 저장합니다.
+
+        Args:
+            actions (Iterable[Dict]): bulk 액션 (generator 가능)
+
+        Returns:
+            BulkResult: 문서별 결과 수, 재시도 수, 실패 문서 목록
+        """
+        result = BulkResult()
+        started = time.perf_counter()
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk") as executor:
+            for chunk in self._chunks(actions):
+                if len(in_flight) >= self.workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                result.total += len(chunk)
+                result.chunks += 1
+                in_flight.add(executor.submit(self._send, chunk, result))
+            for future in in_flight:
+                future.result()
+        result.elapsed = time.perf_counter() - started
+        logger.info(f"bulk 완료: {result.as_dict()}")
+        return result
+
+    @contextmanager
+    def bulk_load_mode(self, index_name: str):
+        """
+        대량 적재 동안 refresh를 끄고 replica를 0으로 낮춘 뒤, 끝나면 원래 설정으로 되돌리고 refresh 합니다.
+        원래 명시적인 값이 없던 설정은 null로 되돌려 클러스터 기본값을 따르게 합니다.
+        """
+        response = self.es.indices.get_settings(index=index_name)
+        current = next(iter(response.values()))["settings"]["index"]
+        original = {
+            "refresh_interval": current.get("refresh_interval"),
+            "number_of_replicas": current.get("number_of_replicas"),
+        }
+        self.es.indices.put_settings(index=index_name, settings={"index": {"refresh_interval": "-1", "number_of_replicas": 0}})
+        logger.info(f"인덱스 '{index_name}' 대량 적재 모드 시작 (원래 설정: {original})")
+        try:
+            yield self
+        finally:
+            self.es.indices.put_settings(index=index_name, settings={"index": original})
+            self.es.indices.refresh(index=index_name)
+            logger.info(f"인덱스 '{index_name}' 대량 적재 모드 종료, 설정 복원")
+
+def _action_id(header: Dict) -> Optional[str]:
+    return next(iter(header.values())).get("_id")
@@ -0,0 +1,194 @@
+# app/services/crawl_extractor.py
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List
+from bs4 import BeautifulSoup, Tag
+import logging
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_IMAGE_ALT = "상품 이미지"
+SOLD_OUT_ALT = "판매 완료"
+# get_text로 정보 영역의 제목/가격/날짜를 이어 붙일 때 사용하는 구분자
+INFO_SEPARATOR = ";;;"
+BASE_URL = "https://m.bunjang.co.kr"
+
+def clean_info(parts: List[str]) -> List[str]:
+    """정보 영역의 텍스트 조각에서 앞뒤 공백을 제거하고, 들여쓰기 등 공백뿐인 조각은 버립니다."""
+    return [part.strip() for part in parts if part.strip()]
+
+def build_record(category: str, info: List[str], location: str, href: str, src: str, status: str) -> Dict:
+    """추출한 값으로 crawl_item 레코드를 만듭니다. 어떤 파서를 쓰더라도 같은 규칙을 적용합니다."""
+    info = clean_info(info)
+    location = location.strip()
+    return {
+        "category": category,
+        "title": info[0] if len(info) > 0 else 'None',
+        "price": info[1] if len(info) > 1 else 'None',
+        "registration_date": info[2] if len(info) > 2 else 'None',
+        "location": location if location else 'None',
+        "link": f"{BASE_URL}{href}",
+        "src": src,
+        "status": status,
+    }
+
+def error_record(category: str) -> Dict:
+    """추출에 실패한 상품도 기본값으로 남깁니다."""
+    return {
+        "category": category,
+        "title": 'None',
+        "price": 'None',
+        "registration_date": 'None',
+        "location": 'None',
+        "link": 'None',
+        "src": 'None',
+        "status": 'None',
+    }
+
+class ProductExtractor(ABC):
+    """
+    검색 결과 페이지 HTML에서 상품 레코드를 추출합니다.
+    상품 이미지(img[alt="상품 이미지"])의 조부모 <a>를 상품 카드로 보고,
+    카드의 첫 번째 자식에서 이미지/판매 상태, 두 번째에서 제목/가격/날짜, 세 번째에서 지역을 읽습니다.
+    자식은 요소만 세며, 요소 사이의 텍스트(공백, 줄바꿈)와 주석은 파서와 관계없이 건너뜁니다.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def extract(self, html: str, category: str) -> Iterator[Dict]:
+        """
+        상품 레코드를 페이지 순서대로 하나씩 생성합니다.
+
+        Args:
+            html (str): 페이지 HTML
+            category (str): 검색 카테고리
+
+        Returns:
+            Iterator[Dict]: 상품 레코드 generator
+        """
+
+class BeautifulSoupExtractor(ProductExtractor):
+    """기존 html.parser 기반 BeautifulSoup 추출기입니다. (순수 Python)"""
+
+    name = "bs4"
+
+    def extract(self, html: str, category: str) -> Iterator[Dict]:
+        html_parser = BeautifulSoup(html, "html.parser")
+        for item in html_parser.find_all(attrs={'alt': PRODUCT_IMAGE_ALT}):
+            aTag = item.parent.parent
+            # .children은 텍스트/주석 노드도 포함하므로 요소만 남깁니다.
+            children = [child for child in aTag.children if isinstance(child, Tag)]
+
+            try:
+                img_tag = children[0].find('img')
+                src = img_tag['src'] if img_tag else 'None'
+                status = '판매중'
+                for img in children[0].find_all('img'):
+                    if img.get('alt') == SOLD_OUT_ALT:
+                        status = '판매완료'
+                        break
+
+                info = children[1].get_text(separator=INFO_SEPARATOR).split(INFO_SEPARATOR)
+                location = children[2].get_text()
+                record = build_record(category, info, location, aTag.get('href', ''), src, status)
+            except Exception as e:
+                logger.error(f"데이터 추출 오류: {e}")
+                record = error_record(category)
+            yield record
+
+class LxmlExtractor(ProductExtractor):
+    """lxml(libxml2) 파서와 XPath로 상품 카드만 찾아 읽는 추출기입니다."""
+
+    name = "lxml"
+
+    def __init__(self):
+        try:
+            import lxml.html
+        except ImportError as e:
+            raise RuntimeError("lxml 추출기를 사용하려면 lxml 패키지가 필요합니다.") from e
+        self._fromstring = lxml.html.fromstring
+
+    def extract(self, html: str, category: str) -> Iterator[Dict]:
+        if not html or not html.strip():
+            # lxml은 빈 문서를 파싱하면 예외를 발생시킵니다.
+            return
+        root = self._fromstring(html)
+        for item in root.iterfind(f'.//img[@alt="{PRODUCT_IMAGE_ALT}"]'):
+            aTag = item.getparent().getparent()
+            # lxml은 텍스트를 .text/.tail로 두지만 주석은 자식으로 남기므로 요소만 남깁니다.
+            children = [child for child in aTag if isinstance(child.tag, str)]
+
+            try:
+                img_tag = children[0].find('.//img')
+                src = img_tag.get('src') if img_tag is not None else 'None'
+                status = '판매중'
+                for img in children[0].iterfind('.//img'):
+                    if img.get('alt') == SOLD_OUT_ALT:
+                        status = '판매완료'
+                        break
+
+                info = INFO_SEPARATOR.join(children[1].itertext()).split(INFO_SEPARATOR)
+                location = children[2].text_content()
+                record = build_record(category, info, location, aTag.get('href', ''), src, status)
+            except Exception as e:
+                logger.error(f"데이터 추출 오류: {e}")
+                record = error_record(category)
+            yield record
+
+class SelectolaxExtractor(ProductExtractor):
+    """selectolax(lexbor) 파서와 CSS selector로 상품 카드만 찾아 읽는 추출기입니다."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as e:
+            raise RuntimeError("selectolax 추출기를 사용하려면 selectolax 패키지가 필요합니다.") from e
+        self._parser = LexborHTMLParser
+
+    def extract(self, html: str, category: str) -> Iterator[Dict]:
+        tree = self._parser(html)
+        for item in tree.css(f'img[alt="{PRODUCT_IMAGE_ALT}"]'):
+            aTag = item.parent.parent
+            # iter()는 텍스트는 건너뛰지만 주석은 포함하므로 요소만 남깁니다.
+            children = [child for child in aTag.iter() if child.is_element_node]
+
+            try:
+                images = children[0].css('img')
+                src = images[0].attributes.get('src') if images else 'None'
+                status = '판매중'
+                for img in images:
+                    if img.attributes.get('alt') == SOLD_OUT_ALT:
+                        status = '판매완료'
+                        break
+
+                info = children[1].text(separator=INFO_SEPARATOR).split(INFO_SEPARATOR)
+                location = children[2].text()
+                record = build_record(category, info, location, aTag.attributes.get('href') or '', src, status)
+            except Exception as e:
+                logger.error(f"데이터 추출 오류: {e}")
+                record = error_record(category)
+            yield record
+
+EXTRACTORS = {
+    BeautifulSoupExtractor.name: BeautifulSoupExtractor,
+    LxmlExtractor.name: LxmlExtractor,
+    SelectolaxExtractor.name: SelectolaxExtractor,
+}
+
+def create_extractor(name: str = None) -> ProductExtractor:
+    """
+    Settings.CRAWL_HTML_PARSER에 맞는 추출기를 생성합니다.
+    C 기반 파서 패키지가 설치되어 있지 않으면 BeautifulSoup 추출기로 대체합니다.
+    """
+    name = name or settings.CRAWL_HTML_PARSER
+    if name not in EXTRACTORS:
+        raise ValueError(f"지원하지 않는 HTML 파서입니다: {name}")
+    try:
+        return EXTRACTORS[name]()
+    except RuntimeError as e:
+        logger.warning(f"{e} BeautifulSoup 추출기를 사용합니다.")
+        return BeautifulSoupExtractor()
@@ -0,0 +1,202 @@
+# app/services/crawl_fetcher.py
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+import httpx
+import logging
+from app.core.config import settings
+from app.services.crawl_scheduler import CrawlTask
+
+logger = logging.getLogger(__name__)
+
+class FetchBackend(ABC):
+    """
+    크롤러가 (카테고리, 페이지) 작업을 상품 레코드 목록으로 바꾸는 방법입니다.
+    어떤 백엔드를 쓰더라도 레코드 형식은 crawl_item 결과와 같습니다.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def page_url(self, category: str, page: int) -> str:
+        pass
+
+    @abstractmethod
+    def create_worker(self) -> Any:
+        """CrawlScheduler 스레드 하나가 전용으로 사용할 워커를 생성합니다. (실행 후 close 됨)"""
+
+    @abstractmethod
+    def default_worker(self) -> Any:
+        """순차 크롤링에 사용할 워커를 반환합니다. (close 하지 않음)"""
+
+    @abstractmethod
+    def fetch_records(self, worker: Any, task: CrawlTask) -> List[Dict]:
+        """페이지를 가져와 상품 레코드 목록을 반환합니다. 상품이 없으면 빈 리스트를 반환합니다."""
+
+    def close(self):
+        pass
+
+class BrowserWorker:
+    """CrawlScheduler 워커 하나가 전용으로 사용하는 Selenium 브라우저입니다."""
+
+    def __init__(self, browser, fetch_page: Callable[[Any, str], str]):
+        self.browser = browser
+        self._fetch_page = fetch_page
+
+    def fetch(self, url: str) -> str:
+        return self._fetch_page(self.browser, url)
+
+    def close(self):
+        self.browser.quit()
+
+class SeleniumFetchBackend(FetchBackend):
+    """headless Chrome으로 모바일 검색 페이지를 렌더링해서 HTML을 파싱하는 백엔드입니다."""
+
+    name = "selenium"
+
+    def __init__(self, crawl_service):
+        self.crawl_service = crawl_service
+
+    def page_url(self, category: str, page: int) -> str:
+        return f"https://m.bunjang.co.kr/search/products?order=date&page={page}&q={category}"
+
+    def create_worker(self):
+        return BrowserWorker(self.crawl_service._create_browser(), self.crawl_service._fetch_page)
+
+    def default_worker(self):
+        if not self.crawl_service.browser:
+            raise Exception("Selenium WebDriver가 초기화되지 않았습니다. 먼저 init_selenium을 호출하세요.")
+        return BrowserWorker(self.crawl_service.browser, self.crawl_service._fetch_page)
+
+    def fetch_records(self, worker, task: CrawlTask) -> List[Dict]:
+        return self.crawl_service._parse_page(worker.fetch(task.url), task.category)
+
+def relative_time(timestamp: int, now: Optional[float] = None) -> str:
+    """UNIX 타임스탬프를 검색 페이지와 같은 'N분 전/N시간 전/N일 전' 형식으로 변환합니다."""
+    elapsed = max(0, int((now or time.time()) - int(timestamp)))
+    if elapsed < 3600:
+        return f"{max(1, elapsed // 60)}분 전"
+    if elapsed < 86400:
+        return f"{elapsed // 3600}시간 전"
+    return f"{elapsed // 86400}일 전"
+
+class _NoopWorker:
+    """HTTP 백엔드는 모든 스레드가 같은 커넥션 풀을 공유하므로 워커가 가진 자원이 없습니다."""
+
+    def close(self):
+        pass
+
+class HttpFetchBackend(FetchBackend):
+    """
+    브라우저 없이 번개장터 검색 API(JSON)를 직접 호출하는 백엔드입니다.
+    커넥션 풀을 가진 httpx.AsyncClient를 전용 이벤트 루프 스레드에서 실행하고,
+    CrawlScheduler 워커 스레드들은 이 루프에 요청을 제출해 같은 풀을 공유합니다.
+
+    Args:
+        base_url (str): 검색 API 주소 (테스트에서는 로컬 스텁 서버 주소)
+        page_size (int): 페이지당 상품 수
+        max_connections (int): 최대 동시 커넥션 수
+        timeout (float): 요청 타임아웃 (초)
+    """
+
+    name = "http"
+    # 판매 완료 상태 코드 (0: 판매중, 1: 예약중)
+    SOLD_STATUSES = {"2", "3"}
+
+    def __init__(self, base_url: str = None, page_size: int = None, max_connections: int = None, timeout: float = None):
+        self.base_url = (base_url or settings.CRAWL_HTTP_BASE_URL).rstrip("/")
+        self.page_size = page_size or settings.CRAWL_HTTP_PAGE_SIZE
+        self.max_connections = max_connections or settings.CRAWL_HTTP_MAX_CONNECTIONS
+        self.timeout = timeout or settings.CRAWL_HTTP_TIMEOUT
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    def page_url(self, category: str, page: int) -> str:
+        # API 페이지는 0부터 시작합니다.
+        return f"{self.base_url}/api/1/find_v2.json?q={quote(category)}&order=date&page={page - 1}&n={self.page_size}"
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="crawl-http", daemon=True)
+            self._thread.start()
+
+            async def create_client():
+                return httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+                    timeout=self.timeout,
+                    headers={"User-Agent": "Mozilla/5.0 (Linux; Android 10) AppleWebKit/537.36 Mobile"},
+                )
+
+            self._client = asyncio.run_coroutine_threadsafe(create_client(), self._loop).result()
+
+    async def _get_json(self, url: str) -> Dict:
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_json(self, url: str) -> Dict:
+        """이벤트 루프 스레드에서 요청을 실행하고 결과를 기다립니다. (스레드 안전)"""
+        self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._get_json(url), self._loop).result(self.timeout * 2)
+
+    def create_worker(self):
+        return _NoopWorker()
+
+    def default_worker(self):
+        return _NoopWorker()
+
+    def fetch_records(self, worker, task: CrawlTask) -> List[Dict]:
+        return self.parse(self.fetch_json(task.url), task.category)
+
+    def parse(self, payload: Dict, category: str, now: Optional[float] = None) -> List[Dict]:
+        """
+        검색 API 응답을 crawl_item과 같은 형식의 레코드로 변환합니다.
+
+        Args:
+            payload (Dict): find_v2 응답 JSON
+            category (str): 검색 카테고리
+
+        Returns:
+            List[Dict]: 상품 레코드 리스트
+        """
+        records = []
+        for product in payload.get("list") or []:
+            if product.get("ad"):
+                continue
+            try:
+                src = (product.get("product_image") or "None").replace("{cnt}", "1").replace("{res}", "w266")
+                # 0원(나눔) 상품도 있으므로 값이 없을 때만 "None"으로 기록합니다.
+                price = product.get("price")
+                records.append({
+                    "category": category,
+                    "title": product.get("name") or "None",
+                    "price": "None" if price is None else str(price),
+                    "registration_date": relative_time(product["update_time"], now) if product.get("update_time") else "None",
+                    "location": product.get("location") or "지역정보 없음",
+                    "link": f"https://m.bunjang.co.kr/products/{product['pid']}",
+                    "src": src,
+                    "status": "판매완료" if str(product.get("status")) in self.SOLD_STATUSES else "판매중",
+                })
+            except Exception as e:
+                logger.error(f"데이터 추출 오류: {e}")
+        return records
+
+    def close(self):
+        with self._lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._client = None
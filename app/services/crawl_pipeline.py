@@ -0,0 +1,277 @@
+# app/services/crawl_pipeline.py
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import logging
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 큐에서 단계의 끝을 알리는 표시
+_DONE = object()
+
+def shift_registration_date(date_str: str) -> str:
+    """'N주 전', 'N달 전'을 'N일 전' 형식으로 바꿉니다."""
+    if '주' in date_str:
+        return f"{int(date_str.split('주')[0]) * 7}일 전"
+    elif '달' in date_str:
+        return f"{int(date_str.split('달')[0]) * 30}일 전"
+    return date_str
+
+def parse_price(price: Any) -> Optional[int]:
+    """'1,000' 같은 가격 문자열을 정수로 변환합니다. 숫자가 아니면('연락요망' 등) None을 반환합니다."""
+    if isinstance(price, int):
+        return price
+    try:
+        return int(str(price).replace(';', '').replace(',', ''))
+    except ValueError:
+        return None
+
+@dataclass
+class StageStats:
+    """파이프라인 단계별 처리량 지표입니다."""
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "in": self.items_in,
+            "out": self.items_out,
+            "seconds": round(self.seconds, 3),
+            "per_sec": round(self.items_in / self.seconds, 1) if self.seconds else None,
+        }
+
+class PipelineCancelled(Exception):
+    """하위 단계가 실패해 크롤링을 중단할 때 워커 스레드에서 발생합니다."""
+
+class StreamingCrawlPipeline:
+    """
+    크롤링 결과를 모아 두지 않고 parse → normalize → dedupe → filter → bulk-index 단계로 흘려보내는 파이프라인입니다.
+
+    - parse: 크롤링 워커가 페이지를 가져와 레코드로 변환하고 크기가 제한된 페이지 큐에 넣습니다.
+    - normalize/dedupe/filter: 페이지 큐를 읽는 스레드에서 레코드 단위 generator로 처리합니다.
+    - index: batch_size개씩 모은 문서를 배치 큐에 넣고, 인덱싱 스레드가 크롤링과 동시에 bulk 저장합니다.
+
+    큐가 가득 차면 앞 단계가 기다리므로(backpressure) 메모리 사용량은 크롤링 규모와 관계없이
+    대략 (queue_size × 페이지 크기 + queue_size × batch_size) 문서로 제한됩니다.
+
+    Args:
+        crawl_service: 페이지를 수집할 CrawlService
+        index_name (str): 저장할 Elasticsearch 인덱스 이름
+        batch_size (int): bulk 저장 단위 문서 수
+        queue_size (int): 페이지 큐와 배치 큐의 최대 크기
+        indexer (Callable[[List[Dict]], Any]): 배치 저장 함수 (기본값: crawl_service.save_item)
+        include_sold (bool): 판매완료 상품도 인덱싱 단계로 넘김 (save_item이 판매완료 변경을 감지하는 데 사용)
+    """
+
+    def __init__(
+        self,
+        crawl_service,
+        index_name: str = "items",
+        batch_size: int = None,
+        queue_size: int = None,
+        indexer: Optional[Callable[[List[Dict]], Any]] = None,
+        include_sold: bool = True,
+    ):
+        self.crawl_service = crawl_service
+        self.index_name = index_name
+        self.batch_size = batch_size or settings.CRAWL_STREAM_BATCH_SIZE
+        self.queue_size = queue_size or settings.CRAWL_STREAM_QUEUE_SIZE
+        self.indexer = indexer or (lambda batch: crawl_service.save_item(batch, index_name=index_name))
+        self.include_sold = include_sold
+        self.stages = {name: StageStats(name) for name in ("parse", "normalize", "dedupe", "filter", "index")}
+        self.batches_indexed = 0
+        self.batches_failed = 0
+        # save_item이 보고하는 문서별 결과 수
+        self.documents = {"created": 0, "updated": 0, "noop": 0, "failed": 0, "skipped": 0}
+        self.changelog: Dict[str, Any] = {}
+        self.errors: List[str] = []
+        self._pages: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._batches: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._seen_src = set()
+
+    def _put(self, q: queue.Queue, item: Any):
+        """큐에 넣을 때까지 기다리되, 파이프라인이 중단되면 PipelineCancelled를 발생시킵니다."""
+        while True:
+            if self._cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    # parse 단계 (크롤링 워커 스레드)
+    def _on_page(self, task, records: List[Dict]):
+        stats = self.stages["parse"]
+        with self._lock:
+            stats.items_in += 1
+            stats.items_out += len(records)
+        self._put(self._pages, (task, records))
+
+    def _produce(self, items_options: List[Dict[str, Any]], num_workers: int, backend: str):
+        started = time.perf_counter()
+        try:
+            self.crawl_service.stream_pages(items_options, on_page=self._on_page, num_workers=num_workers, backend=backend)
+        except PipelineCancelled:
+            pass
+        except Exception as e:
+            logger.error(f"스트리밍 크롤링 실패: {e}")
+            self.errors.append(f"parse: {e}")
+        finally:
+            self.stages["parse"].seconds = time.perf_counter() - started
+            try:
+                self._put(self._pages, _DONE)
+            except PipelineCancelled:
+                pass
+
+    # normalize/dedupe/filter 단계 (페이지 큐를 읽는 스레드)
+    def _timed(self, name: str, records: Iterable[Dict], fn: Callable[[Dict], Optional[Dict]]) -> Iterator[Dict]:
+        stats = self.stages[name]
+        for record in records:
+            started = time.perf_counter()
+            stats.items_in += 1
+            result = fn(record)
+            stats.seconds += time.perf_counter() - started
+            if result is not None:
+                stats.items_out += 1
+                yield result
+
+    @staticmethod
+    def normalize(record: Dict) -> Dict:
+        """가격을 정수로, 등록일을 'N일 전' 형식으로 바꿉니다."""
+        record = dict(record)
+        record["price"] = parse_price(record["price"])
+        record["registration_date"] = shift_registration_date(record["registration_date"])
+        return record
+
+    def dedupe(self, record: Dict) -> Optional[Dict]:
+        """이미 나온 이미지(src)의 상품은 버립니다. (배치 모드의 drop_duplicates와 같은 기준)"""
+        if record["src"] in self._seen_src:
+            return None
+        self._seen_src.add(record["src"])
+        return record
+
+    @staticmethod
+    def make_filter(option: Dict[str, Any], include_sold: bool = False) -> Callable[[Dict], Optional[Dict]]:
+        """판매완료(include_sold가 아니면)/가격 미정 상품과 옵션의 가격 범위를 벗어난 상품을 버리는 함수를 만듭니다."""
+        min_price = int(option["min_price"])
+        max_price = int(option["max_price"])
+
+        def keep(record: Dict) -> Optional[Dict]:
+            if record["price"] is None or (record["status"] == '판매완료' and not include_sold):
+                return None
+            if not min_price <= record["price"] <= max_price:
+                return None
+            return record
+
+        return keep
+
+    def _process(self, items_options: List[Dict[str, Any]]):
+        filters = [self.make_filter(option, include_sold=self.include_sold) for option in items_options]
+        batch: List[Dict] = []
+        while True:
+            item = self._pages.get()
+            if item is _DONE:
+                break
+            task, records = item
+            stream = self._timed("normalize", records, self.normalize)
+            stream = self._timed("dedupe", stream, self.dedupe)
+            stream = self._timed("filter", stream, filters[task.option_index])
+            for record in stream:
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    self._put(self._batches, batch)
+                    batch = []
+        if batch:
+            self._put(self._batches, batch)
+
+    # index 단계 (인덱싱 스레드)
+    def _consume(self):
+        stats = self.stages["index"]
+        while True:
+            batch = self._batches.get()
+            if batch is _DONE:
+                return
+            started = time.perf_counter()
+            stats.items_in += len(batch)
+            try:
+                status = self.indexer(batch)
+                if isinstance(status, dict):
+                    if status.get("status") == "error":
+                        raise RuntimeError(status.get("message") or f"{status.get('failed', len(batch))}개 문서 저장 실패")
+                    for key in self.documents:
+                        self.documents[key] += status.get(key, 0)
+                    self._merge_changelog(status.get("changelog"))
+                stats.items_out += len(batch)
+                self.batches_indexed += 1
+            except Exception as e:
+                logger.error(f"배치 인덱싱 실패: {e}")
+                self.batches_failed += 1
+                self.errors.append(f"index: {e}")
+            stats.seconds += time.perf_counter() - started
+
+    def _merge_changelog(self, changelog: Optional[Dict[str, Any]]):
+        """배치별 changelog의 개수는 더하고, 상품 목록은 CRAWL_CHANGELOG_LIMIT개까지 이어 붙입니다."""
+        if not changelog:
+            return
+        for key, value in changelog.items():
+            if key == "items":
+                merged = self.changelog.setdefault("items", {})
+                for kind, entries in value.items():
+                    merged[kind] = (merged.get(kind, []) + entries)[:settings.CRAWL_CHANGELOG_LIMIT]
+            else:
+                self.changelog[key] = self.changelog.get(key, 0) + value
+
+    def run(self, items_options: List[Dict[str, Any]], num_workers: int = 1, backend: str = "selenium") -> Dict[str, Any]:
+        """
+        크롤링과 인덱싱을 동시에 실행하고 단계별 처리량을 반환합니다.
+
+        Args:
+            items_options (List[Dict[str, Any]]): 각 아이템의 옵션 딕셔너리 리스트
+            num_workers (int): 병렬 크롤링 워커 수
+            backend (str): 페이지 수집 백엔드 (selenium 또는 http)
+
+        Returns:
+            Dict[str, Any]: 저장 문서 수, 배치 수, 단계별 처리량 등 실행 결과
+        """
+        started = time.perf_counter()
+        producer = threading.Thread(target=self._produce, args=(items_options, num_workers, backend), name="crawl-stream-parse", daemon=True)
+        indexer = threading.Thread(target=self._consume, name="crawl-stream-index", daemon=True)
+        producer.start()
+        indexer.start()
+        try:
+            self._process(items_options)
+        except BaseException:
+            # 크롤링 워커가 큐에서 기다리다 멈추지 않도록 파이프라인을 중단합니다.
+            self._cancelled.set()
+            raise
+        finally:
+            producer.join()
+            self._batches.put(_DONE)
+            indexer.join()
+
+        elapsed = time.perf_counter() - started
+        indexed = self.stages["index"].items_out
+        result = {
+            "status": "success" if not (self.errors or self.documents["failed"]) else "partial",
+            "indexed": indexed,
+            "batches": self.batches_indexed,
+            "failed_batches": self.batches_failed,
+            "documents": self.documents,
+            "changelog": self.changelog or None,
+            "elapsed": round(elapsed, 3),
+            "docs_per_sec": round(indexed / elapsed, 1) if elapsed else None,
+            "stages": {name: stats.as_dict() for name, stats in self.stages.items()},
+            "crawl": self.crawl_service.last_crawl_stats if num_workers > 1 else None,
+            "errors": self.errors[:20],
+        }
+        logger.info(f"스트리밍 크롤링 완료: {result}")
+        return result
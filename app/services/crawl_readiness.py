@@ -0,0 +1,131 @@
+# app/services/crawl_readiness.py
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, List
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 검색 결과 상품 이미지 (crawl_item이 파싱하는 요소)
+PRODUCT_IMAGE_SELECTOR = 'img[alt="상품 이미지"]'
+
+class ReadinessStrategy(ABC):
+    """페이지 이동 후 HTML을 읽어도 되는 시점까지 기다리는 전략입니다."""
+
+    name = "base"
+
+    @abstractmethod
+    def wait(self, browser) -> str:
+        """
+        페이지가 준비될 때까지 기다립니다.
+
+        Returns:
+            str: 준비 판정에 사용된 전략 이름 (지표 기록용)
+        """
+
+class SelectorReadiness(ReadinessStrategy):
+    """
+    지정한 CSS selector의 요소가 나타날 때까지 기다립니다.
+    시간 안에 나타나지 않으면 TimeoutException을 발생시킵니다.
+
+    Args:
+        selector (str): 기다릴 요소의 CSS selector
+        timeout (float): 최대 대기 시간 (초)
+        poll_frequency (float): 확인 주기 (초)
+    """
+
+    name = "selector"
+
+    def __init__(self, selector: str = PRODUCT_IMAGE_SELECTOR, timeout: float = 5.0, poll_frequency: float = 0.1):
+        self.selector = selector
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+
+    def wait(self, browser) -> str:
+        WebDriverWait(browser, self.timeout, poll_frequency=self.poll_frequency).until(
+            expected_conditions.presence_of_element_located((By.CSS_SELECTOR, self.selector))
+        )
+        return self.name
+
+class PollingReadiness(ReadinessStrategy):
+    """
+    document.readyState가 complete가 될 때까지 주기적으로 확인합니다.
+    상품이 없는 마지막 페이지처럼 selector가 나타나지 않는 경우의 대체 전략입니다.
+
+    Args:
+        timeout (float): 최대 대기 시간 (초)
+        interval (float): 확인 주기 (초)
+    """
+
+    name = "polling"
+
+    def __init__(self, timeout: float = 2.0, interval: float = 0.25):
+        self.timeout = timeout
+        self.interval = interval
+
+    def wait(self, browser) -> str:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if browser.execute_script("return document.readyState") == "complete":
+                    return self.name
+            except WebDriverException as e:
+                logger.warning(f"readyState 확인 실패: {e}")
+            if time.monotonic() >= deadline:
+                return "timeout"
+            time.sleep(self.interval)
+
+class FallbackReadiness(ReadinessStrategy):
+    """먼저 primary 전략으로 기다리고, 시간 초과 시 fallback 전략으로 넘어갑니다."""
+
+    def __init__(self, primary: ReadinessStrategy, fallback: ReadinessStrategy):
+        self.primary = primary
+        self.fallback = fallback
+
+    def wait(self, browser) -> str:
+        try:
+            return self.primary.wait(browser)
+        except TimeoutException:
+            return self.fallback.wait(browser)
+
+class PageLoadMetrics:
+    """페이지별 로딩 시간과 준비 판정 전략을 기록하는 스레드 안전한 지표입니다."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._samples: List[float] = []
+        self._outcomes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, outcome: str):
+        with self._lock:
+            self._samples.append(seconds)
+            if len(self._samples) > self.max_samples:
+                del self._samples[0]
+            self._outcomes[outcome] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            outcomes = dict(self._outcomes)
+        if not samples:
+            return {"pages": 0, "outcomes": outcomes}
+
+        def percentile(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))], 3)
+
+        return {
+            "pages": sum(outcomes.values()),
+            "mean": round(sum(samples) / len(samples), 3),
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "max": round(samples[-1], 3),
+            "outcomes": outcomes,
+        }
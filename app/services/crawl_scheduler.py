@@ -0,0 +1,240 @@
+# app/services/crawl_scheduler.py
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class CrawlTask:
+    """크롤링할 (카테고리, 페이지) 단위 작업입니다."""
+    option_index: int
+    category: str
+    page: int
+    url: str
+
+@dataclass
+class CrawlStats:
+    pages_fetched: int = 0
+    pages_empty: int = 0
+    pages_skipped: int = 0
+    pages_failed: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "pages_fetched": self.pages_fetched,
+            "pages_empty": self.pages_empty,
+            "pages_skipped": self.pages_skipped,
+            "pages_failed": self.pages_failed,
+            "retries": self.retries,
+            "elapsed": round(self.elapsed, 3),
+            "errors": self.errors[:20],
+        }
+
+class HostRateLimiter:
+    """
+    호스트별 최소 요청 간격을 보장하는 rate limiter입니다.
+    여러 워커가 같은 호스트로 요청하더라도 초당 `rate`개를 넘지 않도록 요청 시작 시각을 예약합니다.
+
+    Args:
+        rate (float): 호스트당 초당 최대 요청 수 (0 이하이면 제한하지 않음)
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str):
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+class CrawlScheduler:
+    """
+    (카테고리, 페이지) 작업을 N개의 워커에 분배하는 크롤링 스케줄러입니다.
+
+    - 워커는 스레드마다 하나씩 `worker_factory`로 생성되고 실행이 끝나면 `close()` 됩니다.
+    - 요청 전 호스트별 rate limit을 적용하고, 실패하면 지수 backoff로 재시도합니다.
+    - 어떤 카테고리의 페이지가 비어 있으면 그보다 뒤 페이지 작업은 건너뜁니다.
+    - 결과는 (옵션 순서, 페이지) 순으로 병합하므로 워커 수와 관계없이 순차 크롤링과 같은 순서가 됩니다.
+    - on_page 스트리밍도 카테고리별 페이지 순서대로 전달하고, 빈 페이지 뒤의 페이지는 병합 방식과 같이 버립니다.
+
+    Args:
+        worker_factory (Callable[[], Any]): 워커(브라우저 등)를 생성하는 함수
+        handler (Callable[[Any, CrawlTask], List[Dict]]): 워커로 페이지를 가져와 레코드 목록을 반환하는 함수
+        num_workers (int): 동시 워커 수
+        rate_limiter (HostRateLimiter): 호스트별 rate limiter
+        max_retries (int): 페이지당 최대 재시도 횟수
+        backoff (float): 첫 재시도 대기 시간 (초), 재시도마다 두 배
+    """
+
+    def __init__(
+        self,
+        worker_factory: Callable[[], Any],
+        handler: Callable[[Any, CrawlTask], List[Dict]],
+        num_workers: int = 4,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_retries: int = 2,
+        backoff: float = 1.0,
+    ):
+        self.worker_factory = worker_factory
+        self.handler = handler
+        self.num_workers = max(1, num_workers)
+        self.rate_limiter = rate_limiter or HostRateLimiter(0)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats = CrawlStats()
+        self._local = threading.local()
+        self._workers: List[Any] = []
+        self._lock = threading.Lock()
+        self._exhausted: Dict[int, int] = {}
+        self._emit_lock = threading.Lock()
+        self._waiting: Dict[int, List[CrawlTask]] = {}
+        self._done: Dict[CrawlTask, Optional[List[Dict]]] = {}
+
+    @staticmethod
+    def plan(tasks: List[CrawlTask]) -> List[CrawlTask]:
+        """앞 페이지부터 카테고리를 번갈아 처리하도록 작업 순서를 정합니다. (빈 페이지를 빨리 발견하기 위함)"""
+        return sorted(tasks, key=lambda t: (t.page, t.option_index))
+
+    def _get_worker(self) -> Any:
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = self.worker_factory()
+            self._local.worker = worker
+            with self._lock:
+                self._workers.append(worker)
+        return worker
+
+    def _is_exhausted(self, task: CrawlTask) -> bool:
+        with self._lock:
+            empty_page = self._exhausted.get(task.option_index)
+            return empty_page is not None and task.page > empty_page
+
+    def _mark_exhausted(self, task: CrawlTask):
+        with self._lock:
+            current = self._exhausted.get(task.option_index)
+            if current is None or task.page < current:
+                self._exhausted[task.option_index] = task.page
+
+    def _release(self, task: CrawlTask, records: Optional[List[Dict]]) -> List[Tuple[CrawlTask, List[Dict]]]:
+        """
+        완료된 페이지를 기록하고, 같은 카테고리의 앞 페이지가 모두 끝나 전달할 수 있게 된 페이지를 순서대로 반환합니다.
+        빈 페이지보다 뒤 페이지는 먼저 완료되었더라도 반환하지 않습니다.
+        """
+        ready = []
+        with self._lock:
+            self._done[task] = records
+            waiting = self._waiting[task.option_index]
+            while waiting and waiting[0] in self._done:
+                head = waiting.pop(0)
+                head_records = self._done.pop(head)
+                empty_page = self._exhausted.get(head.option_index)
+                if head_records and (empty_page is None or head.page < empty_page):
+                    ready.append((head, head_records))
+        return ready
+
+    def _run_task(self, task: CrawlTask) -> Optional[List[Dict]]:
+        if self._is_exhausted(task):
+            with self._lock:
+                self.stats.pages_skipped += 1
+            return None
+
+        worker = self._get_worker()
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.rate_limiter.acquire(task.url)
+                records = self.handler(worker, task)
+                with self._lock:
+                    self.stats.pages_fetched += 1
+                if not records:
+                    with self._lock:
+                        self.stats.pages_empty += 1
+                    self._mark_exhausted(task)
+                return records
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    logger.error(f"크롤링 실패: 카테고리={task.category}, 페이지={task.page}, 오류={e}")
+                    with self._lock:
+                        self.stats.pages_failed += 1
+                        self.stats.errors.append(f"{task.category}:{task.page}: {e}")
+                    return None
+                delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.1)
+                logger.warning(f"크롤링 재시도 {attempt + 1}/{self.max_retries}: 카테고리={task.category}, 페이지={task.page}, {delay:.1f}초 후")
+                with self._lock:
+                    self.stats.retries += 1
+                time.sleep(delay)
+
+    def run(self, tasks: List[CrawlTask], on_page: Optional[Callable[[CrawlTask, List[Dict]], None]] = None) -> List[Dict]:
+        """
+        작업을 병렬로 실행하고 결과 레코드를 결정적인 순서로 병합하여 반환합니다.
+        on_page가 주어지면 레코드를 모으지 않고 페이지가 수집되는 대로 워커 스레드에서 on_page를 호출합니다.
+        (on_page가 블로킹되면 해당 워커도 멈추므로 하위 단계의 backpressure가 크롤링까지 전달됩니다.)
+        이때 페이지는 카테고리별 앞 페이지가 모두 끝난 뒤 순서대로 전달되므로 병합 방식과 같은 레코드만 전달됩니다.
+
+        Args:
+            tasks (List[CrawlTask]): 실행할 작업 목록
+            on_page (Callable[[CrawlTask, List[Dict]], None]): 비어 있지 않은 페이지마다 호출할 함수
+
+        Returns:
+            List[Dict]: (옵션 순서, 페이지, 페이지 내 순서)로 정렬된 레코드 목록 (on_page 사용 시 빈 리스트)
+        """
+        started = time.perf_counter()
+        ordered = self.plan(tasks)
+        results: Dict[CrawlTask, List[Dict]] = {}
+        self._waiting = {}
+        self._done = {}
+        for task in sorted(ordered, key=lambda t: (t.option_index, t.page)):
+            self._waiting.setdefault(task.option_index, []).append(task)
+
+        def run_task(task: CrawlTask) -> Optional[List[Dict]]:
+            records = self._run_task(task)
+            if on_page is None:
+                return records
+            # 먼저 끝난 뒤 페이지가 앞 페이지보다 먼저 전달되거나, 아직 발견되지 않은 빈 페이지 뒤에서 전달되지 않도록
+            # 전달 가능한 페이지를 고르고 호출하는 동안 다른 워커의 전달을 막습니다.
+            with self._emit_lock:
+                for ready_task, ready_records in self._release(task, records):
+                    on_page(ready_task, ready_records)
+            return None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="crawl") as executor:
+                for task, records in zip(ordered, executor.map(run_task, ordered)):
+                    if records:
+                        results[task] = records
+        finally:
+            for worker in self._workers:
+                try:
+                    worker.close()
+                except Exception as e:
+                    logger.warning(f"크롤링 워커 종료 실패: {e}")
+            self._workers.clear()
+        self.stats.elapsed = time.perf_counter() - started
+
+        merged: List[Dict] = []
+        for task in sorted(results, key=lambda t: (t.option_index, t.page)):
+            # 빈 페이지 뒤에서 이미 가져온 페이지는 순차 크롤링과 같도록 버립니다.
+            empty_page = self._exhausted.get(task.option_index)
+            if empty_page is not None and task.page > empty_page:
+                continue
+            merged.extend(results[task])
+        logger.info(f"병렬 크롤링 완료: {self.stats.as_dict()}")
+        return merged
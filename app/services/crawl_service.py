@@ -3,32 +3,73 @@
 import os
 import pandas as pd
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.ui import WebDriverWait
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 import time
-from elasticsearch import Elasticsearch, helpers
+from urllib.parse import urlsplit, urlunsplit
+from elasticsearch import Elasticsearch
 import logging
+from app.core.config import settings
+from app.services.bulk_indexer import BulkIndexer
+from app.services.crawl_scheduler import CrawlScheduler, CrawlTask, HostRateLimiter
+from app.services.crawl_readiness import (
+    FallbackReadiness, PageLoadMetrics, PollingReadiness, SelectorReadiness, PRODUCT_IMAGE_SELECTOR
+)
+from app.services.crawl_extractor import create_extractor
+from app.services.crawl_fetcher import FetchBackend, SeleniumFetchBackend, HttpFetchBackend
+from app.services.crawl_pipeline import shift_registration_date
+from app.services.item_fingerprint import ChangeDetector
+from app.services.search_cache import search_cache
+from app.utils.string_util import generate_hash
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def canonical_link(link: str) -> str:
+    """검색어(q)나 유입 경로(ref) 같은 쿼리스트링을 떼어 낸 상품 링크를 반환합니다."""
+    parts = urlsplit(link)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), "", ""))
+
+def item_document_id(item: Dict[str, Any]) -> str:
+    """
+    상품 문서의 고정 _id를 만듭니다.
+    같은 상품은 어떤 검색어로 크롤링해도 같은 링크이므로 링크 해시를 사용하고, 링크가 없으면 이미지 주소를 사용합니다.
+    """
+    link = item.get("link")
+    if link and link != 'None':
+        return generate_hash(canonical_link(link))
+    return generate_hash(str(item.get("src")))
+
 class CrawlService:
     def __init__(self, chromedriver_path: str=None, elasticsearch_url: str = "http://localhost:9200"):
         self.chromedriver_path = chromedriver_path
         self.elasticsearch_url = elasticsearch_url
         self.browser = None
         self.es = None
+        self.last_crawl_stats = None
+        # 상품 이미지가 나타날 때까지 기다리고, 없으면 readyState 폴링으로 대체합니다.
+        self.readiness = FallbackReadiness(
+            SelectorReadiness(PRODUCT_IMAGE_SELECTOR, timeout=settings.CRAWL_READY_TIMEOUT),
+            PollingReadiness(timeout=settings.CRAWL_READY_POLL_TIMEOUT),
+        )
+        self.page_metrics = PageLoadMetrics()
+        self.extractor = create_extractor()
+        self.change_detector = ChangeDetector()
+        # 요청마다 선택할 수 있는 페이지 수집 백엔드
+        self.backends: Dict[str, FetchBackend] = {
+            "selenium": SeleniumFetchBackend(self),
+            "http": HttpFetchBackend(),
+        }
+
+    def _create_browser(self) -> webdriver.Chrome:
+        """headless Chrome WebDriver를 생성합니다."""
+        options = webdriver.ChromeOptions()
+        options.add_argument("headless")
+        return webdriver.Chrome(options=options)
 
     def init_selenium(self):
         """Selenium WebDriver 초기화 및 bunjang.co.kr 접속"""
-        self.options = webdriver.ChromeOptions()
-        self.options.add_argument("headless")
-        self.browser = webdriver.Chrome(options=self.options)
+        self.browser = self._create_browser()
         self.browser.get('https://m.bunjang.co.kr/')
         logger.info("Selenium WebDriver 초기화 완료 및 bunjang.co.kr 접속")
 
@@ -38,113 +79,165 @@ class CrawlService:
             self.init_selenium()
         return self.browser
     
-    def run_scraper(self, items_options: List[List[str]], num_workers: int = 1) -> List[Dict]:
+    def get_backend(self, name: str) -> FetchBackend:
+        if name not in self.backends:
+            raise ValueError(f"지원하지 않는 크롤링 백엔드입니다: {name}")
+        return self.backends[name]
+
+    def close(self):
+        """브라우저와 HTTP 커넥션 풀 등 크롤러 자원을 정리합니다."""
+        if self.browser:
+            self.browser.quit()
+            self.browser = None
+        for backend in self.backends.values():
+            backend.close()
+
+    def run_scraper(
+        self,
+        items_options: List[Dict[str, Any]],
+        num_workers: int = 1,
+        backend: str = "selenium",
+        include_sold: bool = False,
+    ) -> List[Dict]:
         """
-        크롤러 실행 메서드. 기존의 crawl_item 메서드를 호출합니다.
+        크롤러 실행 메서드. num_workers가 1이면 crawl_item을 그대로 호출하고,
+        2 이상이면 (카테고리, 페이지) 작업을 CrawlScheduler로 여러 워커에 분배합니다.
         
         Args:
-            items_options (List[List[str]]): 각 아이템의 옵션 리스트 [category, min_price, max_price, page_limit]
-            num_workers (int): 병렬 작업 수 (현재는 단일 스레드로 동작)
+            items_options (List[Dict[str, Any]]): 각 아이템의 옵션 딕셔너리 리스트 (category, min_price, max_price, page_limit)
+            num_workers (int): 병렬 워커 수
+            backend (str): 페이지 수집 백엔드 (selenium 또는 http)
+            include_sold (bool): 판매완료 상품도 결과에 포함 (save_item의 판매완료 변경 감지용)
         
         Returns:
             List[Dict]: 크롤링된 데이터 리스트
         """
-        return self.crawl_item(items_options)
-    
-    def crawl_item(self, items_options: List[Dict[str, Any]]) -> List[Dict]:
+        if num_workers <= 1:
+            return self.crawl_item(items_options, backend=backend, include_sold=include_sold)
+
+        fetch_backend = self.get_backend(backend)
+        scheduler = self._create_scheduler(fetch_backend, num_workers)
+        records = scheduler.run(self._build_tasks(items_options, fetch_backend))
+        self.last_crawl_stats = scheduler.stats.as_dict()
+        return self._to_result(records, items_options, include_sold=include_sold)
+
+    def stream_pages(
+        self,
+        items_options: List[Dict[str, Any]],
+        on_page: Callable[[CrawlTask, List[Dict]], None],
+        num_workers: int = 1,
+        backend: str = "selenium",
+    ):
+        """
+        페이지를 수집하는 대로 on_page(task, records)를 호출합니다. 결과를 모아 두지 않습니다.
+        병렬 모드에서는 페이지 완료 순서대로 호출되며, 상품이 없는 페이지 이후는 요청하지 않습니다.
+
+        Args:
+            items_options (List[Dict[str, Any]]): 각 아이템의 옵션 딕셔너리 리스트
+            on_page (Callable[[CrawlTask, List[Dict]], None]): 비어 있지 않은 페이지마다 호출할 함수
+            num_workers (int): 병렬 워커 수
+            backend (str): 페이지 수집 백엔드 (selenium 또는 http)
+        """
+        fetch_backend = self.get_backend(backend)
+        tasks = self._build_tasks(items_options, fetch_backend)
+
+        if num_workers > 1:
+            scheduler = self._create_scheduler(fetch_backend, num_workers)
+            scheduler.run(tasks, on_page=on_page)
+            self.last_crawl_stats = scheduler.stats.as_dict()
+            return
+
+        worker = fetch_backend.default_worker()
+        exhausted = set()
+        for task in tasks:
+            if task.option_index in exhausted:
+                continue
+            logger.info(f"크롤링 중: 카테고리={task.category}, 페이지={task.page}")
+            page_records = fetch_backend.fetch_records(worker, task)
+            if not page_records:
+                exhausted.add(task.option_index)  # 더 이상 페이지가 없으면 종료
+                continue
+            on_page(task, page_records)
+
+    def _create_scheduler(self, fetch_backend: FetchBackend, num_workers: int) -> CrawlScheduler:
+        return CrawlScheduler(
+            worker_factory=fetch_backend.create_worker,
+            handler=fetch_backend.fetch_records,
+            num_workers=num_workers,
+            rate_limiter=HostRateLimiter(settings.CRAWL_HOST_RATE_LIMIT),
+            max_retries=settings.CRAWL_MAX_RETRIES,
+            backoff=settings.CRAWL_RETRY_BACKOFF,
+        )
+
+    def _build_tasks(self, items_options: List[Dict[str, Any]], fetch_backend: FetchBackend) -> List[CrawlTask]:
+        """옵션 목록을 (카테고리, 페이지) 작업 목록으로 펼칩니다."""
+        return [
+            CrawlTask(
+                option_index=i,
+                category=option["category"],
+                page=page,
+                url=fetch_backend.page_url(option["category"], page),
+            )
+            for i, option in enumerate(items_options)
+            for page in range(1, int(option["page_limit"]) + 1)
+        ]
+
+    def _fetch_page(self, browser, url: str) -> str:
+        """페이지를 열고 상품 요소가 렌더링될 때까지 기다린 뒤 HTML을 반환합니다."""
+        started = time.perf_counter()
+        browser.get(url)
+        outcome = self.readiness.wait(browser)
+        self.page_metrics.record(time.perf_counter() - started, outcome)
+        return browser.page_source
+
+    def _parse_page(self, html: str, category: str) -> List[Dict]:
+        """
+        검색 결과 페이지 HTML에서 상품 레코드를 추출합니다.
+
+        Args:
+            html (str): 페이지 HTML
+            category (str): 검색 카테고리
+
+        Returns:
+            List[Dict]: 상품 레코드 리스트 (상품이 없으면 빈 리스트)
+        """
+        return list(self.extractor.extract(html, category))
+
+    def crawl_item(self, items_options: List[Dict[str, Any]], backend: str = "selenium", include_sold: bool = False) -> List[Dict]:
         """
         요청에 따라 번개장터에서 아이템을 크롤링합니다.
 
         Args:
             items_options (List[Dict[str, Any]]): 각 아이템의 옵션 딕셔너리 리스트
+            backend (str): 페이지 수집 백엔드 (selenium 또는 http)
+            include_sold (bool): 판매완료 상품도 결과에 포함
 
         Returns:
             List[Dict]: 크롤링된 데이터 리스트
         """
-        if not self.browser:
-            raise Exception("Selenium WebDriver가 초기화되지 않았습니다. 먼저 init_selenium을 호출하세요.")
-
-        # 데이터 수집 리스트 초기화
-        Datas = {
-            "category": [],
-            "title": [],
-            "price": [],
-            "registration_date": [],
-            "location": [],
-            "link": [],
-            "src": [],
-            "status": []
-        }
+        records = []
+        self.stream_pages(items_options, on_page=lambda task, page_records: records.extend(page_records), backend=backend)
+        return self._to_result(records, items_options, include_sold=include_sold)
 
+    def _to_result(self, records: List[Dict], items_options: List[Dict[str, Any]], include_sold: bool = False) -> List[Dict]:
+        """
+        수집한 레코드의 중복 제거, 판매완료/가격 필터, 가격/날짜 변환을 적용합니다.
 
-        for item_option in items_options:
-            category = item_option["category"]
-            min_price = int(item_option["min_price"])
-            max_price = int(item_option["max_price"])
-            page_limit = int(item_option["page_limit"])
-            page = 1
-
-            while page <= page_limit:
-                url = f"https://m.bunjang.co.kr/search/products?order=date&page={page}&q={category}"
-                self.browser.get(url)
-                logger.info(f"크롤링 중: 카테고리={category}, 페이지={page}")
-                time.sleep(3)  # 페이지 로딩 대기
-
-                html = self.browser.page_source
-                html_parser = BeautifulSoup(html, "html.parser")
-                _list = html_parser.find_all(attrs={'alt': '상품 이미지'})
-
-                if not _list:
-                    break  # 더 이상 페이지가 없으면 종료
-
-                for item in _list:
-                    aTag = item.parent.parent
-                    children = list(aTag.children)
-
-                    try:
-                        # 데이터 추출
-                        img_tag = children[0].find('img')
-                        src = img_tag['src'] if img_tag else 'None'
-                        status = '판매중'
-                        for img in children[0].find_all('img'):
-                            if img.get('alt') == '판매 완료':
-                                status = '판매완료'
-                                break
-
-                        info = children[1].get_text(separator=';;;').split(';;;')
-                        location = children[2].get_text()
-
-                        title = info[0] if len(info) > 0 else 'None'
-                        price = info[1] if len(info) > 1 else 'None'
-                        date = info[2] if len(info) > 2 else 'None'
-
-                        # 데이터 수집
-                        Datas["category"].append(category)
-                        Datas["title"].append(title)
-                        Datas["price"].append(price)
-                        Datas["registration_date"].append(date)
-                        Datas["location"].append(location if location else 'None')
-                        Datas["link"].append(f"https://m.bunjang.co.kr{aTag.get('href', '')}")
-                        Datas["src"].append(src)
-                        Datas["status"].append(status)
-                    except Exception as e:
-                        logger.error(f"데이터 추출 오류: {e}")
-                        # 누락된 데이터라도 기본값으로 추가
-                        Datas["category"].append(category)
-                        Datas["title"].append('None')
-                        Datas["price"].append('None')
-                        Datas["registration_date"].append('None')
-                        Datas["location"].append('None')
-                        Datas["link"].append('None')
-                        Datas["src"].append('None')
-                        Datas["status"].append('None')
-                        continue
-                page += 1
-
-
-        df = pd.DataFrame(Datas)
+        Args:
+            records (List[Dict]): 페이지 순서대로 수집한 레코드 리스트
+            items_options (List[Dict[str, Any]]): 각 아이템의 옵션 딕셔너리 리스트
+            include_sold (bool): 판매완료 상품을 걸러내지 않음
+
+        Returns:
+            List[Dict]: 크롤링된 데이터 리스트
+        """
+        if not records:
+            return []
+
+        df = pd.DataFrame(records)
         df.drop_duplicates(subset=['src'], inplace=True)
-        df = df[df['status'] != '판매완료']
+        if not include_sold:
+            df = df[df['status'] != '판매완료']
         df = df[df['price'] != '연락요망']
 
         try:
@@ -153,20 +246,7 @@ class CrawlService:
             logger.error(f"가격 변환 오류: {ve}")
             df['price'] = pd.to_numeric(df['price'].str.replace(';', '').str.replace(',', ''), errors='coerce')
 
-        # 날짜 변환 함수
-        def date_shifter(df):
-            def custom_convert(date_str):
-                if '주' in date_str:
-                    return f"{int(date_str.split('주')[0]) * 7}일 전"
-                elif '달' in date_str:
-                    return f"{int(date_str.split('달')[0]) * 30}일 전"
-                else:
-                    return date_str
-
-            df['registration_date'] = df['registration_date'].apply(custom_convert)
-            return df
-
-        df = date_shifter(df)
+        df['registration_date'] = df['registration_date'].apply(shift_registration_date)
         # 가격 필터 적용
         filtered_dfs = []
         for item_option in items_options:
@@ -189,80 +269,74 @@ class CrawlService:
 
         return result
 
-    def save_item(self, data: List[Dict], index_name: str = "items"):
+    def _get_es(self) -> Elasticsearch:
+        if not self.es:
+            self.es = Elasticsearch([self.elasticsearch_url])
+            if not self.es.ping():
+                raise ValueError("Elasticsearch에 연결할 수 없습니다.")
+        return self.es
+
+    def save_item(self, data: List[Dict], index_name: str = "items") -> Dict[str, Any]:
         """
         크롤링한 데이터를 Elasticsearch에 저장합니다.
+        상품 링크로 만든 고정 _id에 bulk update(doc_as_upsert)를 보내므로,
+        다시 크롤링하면 기존 문서를 삭제하지 않고 그 자리에서 갱신합니다.
+        내용 fingerprint가 이전과 같은 상품과 처음 보는 판매완료 상품은 저장하지 않습니다.
 
         Args:
             data (List[Dict]): 저장할 데이터 리스트
             index_name (str): Elasticsearch 인덱스 이름
+
+        Returns:
+            Dict[str, Any]: 생성(created)/갱신(updated)/변경 없음(noop)/실패(failed)/건너뜀(skipped) 문서 수와
+                새 상품/가격 인하/판매완료 변경 내역(changelog)
         """
-        if not self.es:
-            self.es = Elasticsearch([self.elasticsearch_url])
-            if not self.es.ping():
-                raise ValueError("Elasticsearch에 연결할 수 없습니다.")
+        es = self._get_es()
 
         # 인덱스가 존재하지 않으면 생성
-        if not self.es.indices.exists(index=index_name):
-            self.es.indices.create(index=index_name)
+        if not es.indices.exists(index=index_name):
+            es.indices.create(index=index_name)
             logger.info(f"Elasticsearch 인덱스 '{index_name}' 생성 완료")
 
-        # 중복 데이터 검색을 위한 link와 src 리스트 생성
-        links = [item['link'] for item in data]
-        srcs = [item['src'] for item in data]
-        # 중복 문서 검색 (link 또는 src가 일치하는 문서)
-        search_query = {
-            "query": {
-                "bool": {
-                    "should": [
-                        {"terms": {"link": links}},
-                        {"terms": {"src": srcs}}
-                    ],
-                    "minimum_should_match": 1
-                }
-            },
-            "_source": False  # 소스 필드를 가져올 필요 없으므로 비활성화
-        }
+        index_uuid = self.change_detector.index_uuid(es, index_name)
+        doc_ids = [item_document_id(item) for item in data]
+        changes = self.change_detector.detect(es, index_name, index_uuid, data, doc_ids)
 
-        try:
-            response = self.es.search(index=index_name, body=search_query, size=10000)  # size는 최대 10000까지
-            hits = response['hits']['hits']
-            if hits:
-                # 삭제할 문서 ID 리스트 생성
-                delete_ids = [hit['_id'] for hit in hits]
-                logger.info(f"삭제할 중복 문서 수: {len(delete_ids)}")
-
-                # Bulk 삭제 요청 준비
-                delete_actions = [
-                    {
-                        "_op_type": "delete",
-                        "_index": index_name,
-                        "_id": doc_id
-                    }
-                    for doc_id in delete_ids
-                ]
-
-                # Bulk 삭제 실행
-                helpers.bulk(self.es, delete_actions)
-                logger.info(f"중복 문서 삭제 완료: {len(delete_ids)}개")
-            else:
-                logger.info("삭제할 중복 문서가 없습니다.")
-
-        except Exception as e:
-            logger.error(f"중복 문서 검색 또는 삭제 중 오류 발생: {e}")
-            return {"status": "error", "message": f"중복 문서 처리 중 오류 발생: {e}"}
-
-    
-        # 데이터 삽입
-        actions = [
+        # indexed_at: 재색인(EsService.reindex)이 적재하는 동안 저장된 문서를 찾아 새 인덱스로 옮길 때 사용합니다.
+        indexed_at = int(time.time() * 1000)
+        actions = (
             {
+                "_op_type": "update",
                 "_index": index_name,
-                "_source": item
+                "_id": write["_id"],
+                "doc": dict(write["doc"], indexed_at=indexed_at),
+                "doc_as_upsert": True,
             }
-            for item in data
-        ]
-
-        logger.info(f"물건 {len(actions)}개 저장 시도")
-
-        helpers.bulk(self.es, actions)
-        logger.info(f"데이터가 Elasticsearch 인덱스 '{index_name}'에 저장되었습니다.")
+            for write in changes.writes
+        )
+
+        logger.info(f"물건 {len(data)}개 중 새 상품/변경된 상품 {len(changes.writes)}개 저장 시도")
+
+        result = BulkIndexer(es).index(actions)
+        counts = {key: result.results.get(key, 0) for key in ("created", "updated", "noop")}
+        counts["failed"] = result.failed
+
+        self.change_detector.commit(index_name, index_uuid, changes, result.failed_ids)
+        logger.info(f"데이터가 Elasticsearch 인덱스 '{index_name}'에 저장되었습니다: {counts}")
+        if result.errors:
+            logger.error(f"저장 실패 문서 {result.failed}개, 예: {result.errors[:3]}")
+
+        # 문서가 바뀐 경우에만 같은 인덱스의 검색 캐시를 무효화합니다.
+        if counts["created"] or counts["updated"]:
+            search_cache.invalidate(index_name)
+
+        if not counts["failed"]:
+            status = "success"
+        else:
+            status = "error" if counts["failed"] == len(changes.writes) else "partial"
+        return {
+            "status": status,
+            **counts,
+            "skipped": changes.unchanged + changes.skipped_sold,
+            "changelog": changes.changelog(),
+        }
@@ -1,7 +1,11 @@
 # es_client.py
 
-from elasticsearch import Elasticsearch
+import asyncio
+import time
+from typing import Optional
+from elasticsearch import Elasticsearch, AsyncElasticsearch
 import logging
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -12,3 +16,90 @@ def get_elasticsearch_client(host: str = "localhost", port: int = 9200) -> Elast
         raise ConnectionError("Elasticsearch에 연결할 수 없습니다.")
     logger.info("Elasticsearch 클라이언트 초기화 완료")
     return es
+
+def create_shared_client(host: Optional[str] = None) -> Elasticsearch:
+    """
+    앱 전체에서 공유하는 Elasticsearch 클라이언트를 생성합니다.
+    커넥션 풀 크기와 타임아웃은 Settings에서 읽으며 생성 시 ping 하지 않습니다.
+    커넥션은 transport의 노드별 풀(connections_per_node)에 보관되어 요청 간에 재사용(keep-alive)됩니다.
+
+    Args:
+        host (Optional[str]): Elasticsearch 주소 (기본값: settings.ES_HOST)
+
+    Returns:
+        Elasticsearch: 커넥션 풀을 가진 클라이언트
+    """
+    client = Elasticsearch(
+        host or settings.ES_HOST,
+        connections_per_node=settings.ES_CONNECTIONS_PER_NODE,
+        request_timeout=settings.ES_REQUEST_TIMEOUT,
+        max_retries=settings.ES_MAX_RETRIES,
+        retry_on_timeout=True,
+    )
+    logger.info(f"공유 Elasticsearch 클라이언트 생성 완료 (pool={settings.ES_CONNECTIONS_PER_NODE})")
+    return client
+
+def create_shared_async_client(host: Optional[str] = None) -> AsyncElasticsearch:
+    """
+    이벤트 루프에서 사용하는 공유 AsyncElasticsearch 클라이언트를 생성합니다.
+    스레드풀을 거치지 않으므로 커넥션 풀 크기만큼 동시에 요청을 보낼 수 있습니다.
+
+    Args:
+        host (Optional[str]): Elasticsearch 주소 (기본값: settings.ES_HOST)
+
+    Returns:
+        AsyncElasticsearch: aiohttp 커넥션 풀을 가진 비동기 클라이언트
+    """
+    client = AsyncElasticsearch(
+        host or settings.ES_HOST,
+        connections_per_node=settings.ES_ASYNC_CONNECTIONS_PER_NODE,
+        request_timeout=settings.ES_REQUEST_TIMEOUT,
+        max_retries=settings.ES_MAX_RETRIES,
+        retry_on_timeout=True,
+    )
+    logger.info(f"공유 AsyncElasticsearch 클라이언트 생성 완료 (pool={settings.ES_ASYNC_CONNECTIONS_PER_NODE})")
+    return client
+
+class EsHealthProbe:
+    """
+    백그라운드 태스크로 Elasticsearch를 주기적으로 ping 하여 상태를 기록합니다.
+    요청 경로에서는 ping 대신 `healthy` 값만 확인합니다.
+    """
+
+    def __init__(self, es: Elasticsearch, interval: float = None):
+        self.es = es
+        self.interval = interval or settings.ES_HEALTHCHECK_INTERVAL
+        self.healthy = False
+        self.last_checked: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self) -> bool:
+        """ping을 스레드에서 실행하여 이벤트 루프를 막지 않고 상태를 갱신합니다."""
+        try:
+            healthy = await asyncio.to_thread(self.es.ping)
+        except Exception as e:
+            logger.error(f"Elasticsearch health probe 실패: {e}")
+            healthy = False
+        if healthy != self.healthy:
+            logger.info(f"Elasticsearch 상태 변경: healthy={healthy}")
+        self.healthy = healthy
+        self.last_checked = time.time()
+        return healthy
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -1,16 +1,49 @@
 import json
+import re
+import time
 from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
 import logging
 import os
-from elasticsearch import Elasticsearch, helpers
+from elasticsearch import Elasticsearch, NotFoundError, helpers
+from app.core.config import settings
+from app.services.bulk_indexer import BulkIndexer
+from app.schemas.search import SearchRequest
+from app.services.search_cache import search_cache
+from app.services.search_query import build_query
+from app.services.search_service import TIEBREAKER_FIELD
 logger = logging.getLogger(__name__)
 
+# 별칭 뒤에서 교체되는 버전 인덱스 이름 (예: items_v3)
+VERSION_PATTERN = re.compile(r"^(?P<alias>.+)_v(?P<version>\d+)$")
+
+# 별칭을 넘기기 전에 새 인덱스에 보내는 검색 요청 (정렬 방향, 가격/상태 필터, 카테고리 facet)
+WARM_REQUESTS = (
+    SearchRequest(query="가방", order="desc"),
+    SearchRequest(query="가방", order="asc", min_price=0, status="판매중"),
+    SearchRequest(query="가방", facets=True),
+)
+
+def warm_queries(requests: Iterable[SearchRequest] = WARM_REQUESTS) -> List[Dict]:
+    """
+    검색 API와 같은 build_query로 warm-up 검색 본문을 만듭니다.
+    실제 검색과 쿼리 모양이 같아야 filter 캐시와 doc values를 미리 읽어 두는 효과가 있습니다.
+    """
+    bodies = []
+    for request in requests:
+        body = build_query(request)
+        body["sort"] = [{request.sort: {"order": request.order}}, {TIEBREAKER_FIELD: {"order": "asc"}}]
+        body["size"] = request.size
+        bodies.append(body)
+    return bodies
+
 
 class EsService:
-    def __init__(self, host: str = "http://localhost:9200", mapping_path: str = "app/config/items_mapping.json"):
+    def __init__(self, host: str = "http://localhost:9200", mapping_path: str = "app/config/items_mapping.json", client: Elasticsearch = None):
         self.host = host
         self.mapping_path = mapping_path
-        self.client = self._create_client()
+        # 공유 클라이언트가 주어지면 재사용하고, 없으면 새로 생성합니다.
+        self.client = client or self._create_client()
     
     def _create_client(self) -> Elasticsearch:
         """Elasticsearch 클라이언트를 생성하고 반환합니다."""
@@ -18,19 +51,8 @@ class EsService:
         print(f"Connected to Elasticsearch at {self.host}")
         return client
 
-    def create_index(self, index_name: str = "items"):
-        """
-        `items_mapping.json` 파일을 기반으로 Elasticsearch 인덱스를 생성합니다.
-        인덱스가 이미 존재하면 생성을 건너뜁니다.
-        
-        Args:
-            index_name (str): 생성할 인덱스 이름
-        """
-        # 인덱스가 이미 존재하는지 확인
-        if self.client.indices.exists(index=index_name):
-            logger.info(f"Index '{index_name}' already exists.")
-            return
-
+    def load_mapping(self) -> Dict[str, Any]:
+        """`items_mapping.json` 파일을 읽어 인덱스 생성 요청 본문(settings/mappings)을 반환합니다."""
         # 매핑 파일 경로 확인
         if not os.path.exists(self.mapping_path):
             logger.error(f"매핑 파일을 찾을 수 없습니다: {self.mapping_path}")
@@ -41,18 +63,249 @@ class EsService:
             with open(self.mapping_path, 'r', encoding='utf-8') as file:
                 mapping = json.load(file)
                 logger.info(f"매핑 파일 '{self.mapping_path}' 로드 완료.")
+                return mapping
         except Exception as e:
             logger.error(f"매핑 파일 로드 중 오류 발생: {e}")
             raise e
 
+    def create_index(self, index_name: str = "items"):
+        """
+        `items_mapping.json` 파일을 기반으로 첫 번째 버전 인덱스(`{index_name}_v1`)를 만들고
+        `index_name` 별칭을 연결합니다. 별칭이나 같은 이름의 인덱스가 이미 존재하면 생성을 건너뜁니다.
+        기존 인덱스에는 바뀐 매핑(서브필드, 분석기)이 적용되지 않으므로, 매핑 버전이 파일보다 낮으면
+        `reindex`(insert_main.reindex_data)로 재색인하라는 경고를 남깁니다.
+        
+        Args:
+            index_name (str): 검색/저장에 사용하는 별칭 이름
+        """
+        # 인덱스(또는 별칭)가 이미 존재하는지 확인
+        if self.client.indices.exists(index=index_name):
+            logger.info(f"Index '{index_name}' already exists.")
+            current, expected = self.mapping_version(index_name), self.load_mapping()["mappings"]["_meta"]["mapping_version"]
+            if current < expected:
+                logger.warning(f"'{index_name}'의 매핑 버전 {current}이 items_mapping.json({expected})보다 낮습니다. "
+                               f"reindex_data로 재색인해야 새 매핑이 적용됩니다.")
+            return
+
+        mapping = self.load_mapping()
+        versioned = f"{index_name}_v1"
+
         # 인덱스 생성
         try:
-            self.client.indices.create(index=index_name, body=mapping)
-            logger.info(f"Index '{index_name}' created successfully with provided mapping.")
+            self.client.indices.create(index=versioned, body={**mapping, "aliases": {index_name: {}}})
+            logger.info(f"Index '{versioned}' created successfully with provided mapping (alias '{index_name}').")
         except Exception as e:
             logger.error(f"인덱스 생성 중 오류 발생: {e}")
             raise e
 
+    def mapping_version(self, index_name: str) -> int:
+        """인덱스(별칭) 매핑의 _meta.mapping_version을 반환합니다. 버전 기록 전의 인덱스는 0입니다."""
+        response = self.client.indices.get_mapping(index=index_name)
+        mappings = next(iter(response.values()), {}).get("mappings", {})
+        return mappings.get("_meta", {}).get("mapping_version", 0)
+
+    def versioned_indices(self, alias: str) -> List[str]:
+        """`{alias}_vN` 형식의 인덱스를 버전 순서대로 반환합니다."""
+        response = self.client.indices.get_alias(index=f"{alias}_v*")
+        versions = []
+        for name in response:
+            match = VERSION_PATTERN.match(name)
+            if match and match.group("alias") == alias:
+                versions.append((int(match.group("version")), name))
+        return [name for _, name in sorted(versions)]
+
+    def alias_target(self, alias: str) -> Optional[str]:
+        """별칭이 가리키는 인덱스를 반환합니다. 별칭이 없으면 None을 반환합니다."""
+        try:
+            response = self.client.indices.get_alias(name=alias)
+        except NotFoundError:
+            return None
+        return next(iter(response), None)
+
+    def next_index_name(self, alias: str) -> str:
+        versions = self.versioned_indices(alias)
+        latest = int(VERSION_PATTERN.match(versions[-1]).group("version")) if versions else 0
+        return f"{alias}_v{latest + 1}"
+
+    def warm(self, index_name: str, queries: Optional[Iterable[Dict]] = None):
+        """새 인덱스에 검색을 보내 세그먼트와 doc values를 미리 읽어 둡니다. 실패해도 교체는 계속합니다."""
+        for body in warm_queries() if queries is None else queries:
+            try:
+                self.client.search(index=index_name, body=body, request_cache=False)
+            except Exception as e:
+                logger.warning(f"인덱스 '{index_name}' warm-up 검색 실패: {e}")
+
+    def swap_alias(self, alias: str, index_name: str) -> Optional[str]:
+        """
+        별칭을 index_name으로 한 번의 `_aliases` 요청으로 옮깁니다. (검색은 교체 전후 어느 한쪽만 봅니다)
+        별칭 도입 전의 같은 이름 실제 인덱스가 남아 있으면 같은 요청에서 삭제합니다.
+
+        Returns:
+            Optional[str]: 이전에 별칭이 가리키던 인덱스
+        """
+        previous = self.alias_target(alias)
+        actions: List[Dict] = []
+        if previous:
+            actions.append({"remove": {"index": previous, "alias": alias}})
+        elif self.client.indices.exists(index=alias):
+            logger.warning(f"별칭이 아닌 인덱스 '{alias}'를 삭제하고 별칭으로 교체합니다.")
+            actions.append({"remove_index": {"index": alias}})
+        actions.append({"add": {"index": index_name, "alias": alias}})
+        self.client.indices.update_aliases(actions=actions)
+        logger.info(f"별칭 '{alias}': {previous} → {index_name}")
+        return previous
+
+    def write_target(self, alias: str) -> Optional[str]:
+        """지금 크롤러 쓰기를 받는 인덱스(별칭이 가리키는 인덱스 또는 별칭 도입 전의 실제 인덱스)를 반환합니다."""
+        target = self.alias_target(alias)
+        if target is None and self.client.indices.exists(index=alias):
+            return alias
+        return target
+
+    def set_write_block(self, index_name: str, blocked: bool):
+        """인덱스 쓰기를 막거나 다시 허용합니다. (막힌 동안의 bulk 쓰기는 문서별 403으로 실패합니다)"""
+        self.client.indices.put_settings(index=index_name, settings={"index": {"blocks.write": True if blocked else None}})
+
+    def catch_up(self, source: str, index_name: str, since_ms: int) -> int:
+        """
+        source에 since_ms 이후 저장(indexed_at)된 문서를 index_name으로 복사합니다. 같은 _id는 덮어씁니다.
+
+        Returns:
+            int: 복사한 문서 수
+        """
+        response = self.client.options(request_timeout=settings.ES_REINDEX_TIMEOUT).reindex(
+            source={"index": source, "query": {"range": {"indexed_at": {"gte": since_ms}}}},
+            dest={"index": index_name},
+            refresh=True,
+            wait_for_completion=True,
+        )
+        if response.get("failures"):
+            raise RuntimeError(f"변경 문서 복사 실패: {response['failures'][:3]}")
+        return response.get("total", 0)
+
+    def gc_versions(self, alias: str, keep: int = None) -> List[str]:
+        """
+        최근 keep개의 버전만 남기고 이전 버전 인덱스를 삭제합니다. 별칭이 가리키는 인덱스는 항상 남깁니다.
+
+        Returns:
+            List[str]: 삭제한 인덱스 목록
+        """
+        keep = settings.ES_REINDEX_KEEP_VERSIONS if keep is None else keep
+        current = self.alias_target(alias)
+        versions = self.versioned_indices(alias)
+        stale = [name for name in versions[:max(0, len(versions) - keep)] if name != current]
+        for name in stale:
+            self.client.indices.delete(index=name)
+            logger.info(f"이전 버전 인덱스 '{name}' 삭제")
+        return stale
+
+    def reindex(
+        self,
+        alias: str,
+        build_actions: Callable[[str], Iterable[Dict]],
+        indexer: Optional[BulkIndexer] = None,
+        keep: int = None,
+        max_failed: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        서비스 중인 별칭을 유지한 채 전체 데이터를 새 버전 인덱스로 다시 적재합니다.
+
+        1. 매핑 파일로 `{alias}_vN` 인덱스 생성
+        2. refresh 끄기/replica 0 상태로 bulk 적재 후 설정 복원
+        3. forcemerge로 세그먼트를 하나로 합친 뒤 replica 할당 대기
+        4. warm-up 검색
+        5. 이전 인덱스 쓰기를 막고, 적재하는 동안 크롤러가 이전 인덱스에 저장한 문서(indexed_at)를 새 인덱스로 복사
+        6. 별칭을 한 번에 교체하고 검색 캐시 무효화, 이전 인덱스 쓰기 허용
+        7. 오래된 버전 삭제
+
+        크롤러는 적재 중에도 별칭(이전 인덱스)에 저장하므로, 5단계가 없으면 그 문서들은 교체 후 사라집니다.
+        쓰기를 막는 5~6단계 동안의 크롤러 저장은 실패로 응답되며, 실패한 문서는 fingerprint에 기록되지 않아
+        다음 크롤링에서 다시 저장됩니다.
+
+        적재 실패 문서가 max_failed개를 넘거나 복사에 실패하면 새 인덱스를 삭제하고 기존 별칭을 그대로 둡니다.
+
+        Args:
+            alias (str): 검색/저장에 사용하는 별칭 이름
+            build_actions (Callable[[str], Iterable[Dict]]): 새 인덱스 이름을 받아 bulk 액션을 생성하는 함수
+            indexer (BulkIndexer): 적재에 사용할 bulk 인덱서
+            keep (int): 남겨 둘 버전 수 (이전 버전으로 되돌릴 수 있도록 기본 2개)
+            max_failed (int): 허용할 적재 실패 문서 수
+
+        Returns:
+            Dict[str, Any]: 새 인덱스, 이전 인덱스, 적재 결과, 복사한 변경 문서 수, 삭제한 인덱스, 단계별 소요 시간
+        """
+        indexer = indexer or BulkIndexer(self.client)
+        index_name = self.next_index_name(alias)
+        mapping = self.load_mapping()
+        timings = {}
+
+        # 적재를 시작한 시각 이후 크롤러가 저장한 문서를 마지막에 옮깁니다. (서버 간 시계 차이만큼 여유를 둡니다)
+        source = self.write_target(alias)
+        since_ms = int((time.time() - settings.ES_REINDEX_CATCHUP_MARGIN) * 1000)
+        if source:
+            # 이전 버전 매핑에 indexed_at이 없으면 범위 검색이 되지 않으므로 먼저 추가합니다. (필드 추가는 기존 인덱스에도 가능)
+            self.client.indices.put_mapping(index=source, properties={"indexed_at": mapping["mappings"]["properties"]["indexed_at"]})
+
+        started = time.perf_counter()
+        self.client.indices.create(index=index_name, body=mapping)
+        try:
+            with indexer.bulk_load_mode(index_name):
+                result = indexer.index(build_actions(index_name))
+            if result.failed > max_failed:
+                raise RuntimeError(f"적재 실패 문서 {result.failed}개: {result.errors[:3]}")
+        except Exception:
+            logger.error(f"인덱스 '{index_name}' 적재 실패, 삭제하고 별칭을 유지합니다.")
+            self.client.indices.delete(index=index_name)
+            raise
+        timings["load"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        maintenance = self.client.options(request_timeout=settings.ES_REINDEX_TIMEOUT)
+        maintenance.indices.forcemerge(index=index_name, max_num_segments=1)
+        maintenance.cluster.health(
+            index=index_name,
+            wait_for_status=settings.ES_REINDEX_WAIT_FOR_STATUS,
+            timeout=f"{int(settings.ES_REINDEX_TIMEOUT)}s",
+        )
+        timings["optimize"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.warm(index_name)
+        timings["warm"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        caught_up = 0
+        swapped = False
+        if source:
+            self.set_write_block(source, True)
+        try:
+            if source:
+                caught_up = self.catch_up(source, index_name, since_ms)
+            previous = self.swap_alias(alias, index_name)
+            swapped = True
+        except Exception:
+            logger.error(f"인덱스 '{index_name}' 교체 실패, 삭제하고 별칭을 유지합니다.")
+            self.client.indices.delete(index=index_name)
+            raise
+        finally:
+            # 별칭 도입 전의 실제 인덱스는 교체 요청에서 삭제되므로 되돌릴 설정이 없습니다.
+            if source and not (swapped and source == alias):
+                self.set_write_block(source, False)
+        timings["swap"] = time.perf_counter() - started
+        logger.info(f"적재 중 저장된 문서 {caught_up}개를 '{index_name}'로 복사하고 별칭을 교체했습니다.")
+
+        search_cache.invalidate(alias)
+        deleted = self.gc_versions(alias, keep)
+
+        return {
+            "index": index_name,
+            "previous": previous,
+            "bulk": result.as_dict(),
+            "caught_up": caught_up,
+            "deleted": deleted,
+            "timings": {name: round(seconds, 3) for name, seconds in timings.items()},
+        }
+
 # EsService 클래스를 사용하여 Elasticsearch에 연결하고 인덱스 생성
 if __name__ == "__main__":
     es_service = EsService()
@@ -0,0 +1,233 @@
+# app/services/item_fingerprint.py
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from elasticsearch import Elasticsearch
+import logging
+from app.core.config import settings
+from app.utils.string_util import generate_hash
+
+logger = logging.getLogger(__name__)
+
+# 내용이 바뀌었는지 판단하는 필드 (registration_date는 'N일 전' 형식이라 크롤링할 때마다 바뀌므로 제외)
+FINGERPRINT_FIELDS = ("price", "status", "title", "src")
+SOLD_OUT = '판매완료'
+
+# price/status는 타입을 선언하지 않아 크롤러의 문자열과 엑셀 적재의 정수를 그대로 보관합니다.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS docs (id TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, price, status);
+"""
+
+def content_fingerprint(item: Dict[str, Any]) -> str:
+    """상품의 가격/상태/제목/이미지로 내용 fingerprint를 만듭니다."""
+    return generate_hash("|".join(str(item.get(name)) for name in FINGERPRINT_FIELDS))
+
+class FingerprintIndex:
+    """
+    인덱스별로 {문서 _id: fingerprint, 가격, 상태}를 로컬 SQLite 파일에 보관합니다.
+    배치마다 바뀐 행만 INSERT OR REPLACE 하므로 저장 비용은 전체 기록이 아닌 배치 크기에 비례합니다.
+    Elasticsearch 인덱스 uuid를 함께 저장하여, 인덱스가 다시 만들어지면 이전 기록을 버립니다.
+
+    Args:
+        directory (str): fingerprint 파일을 저장할 디렉터리
+    """
+
+    # SQLite 바인드 변수 수 제한(기본 999)보다 작게 나눠서 조회합니다.
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or settings.CRAWL_FINGERPRINT_DIR
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._uuids: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def _path(self, index_name: str) -> str:
+        return os.path.join(self.directory, f"{index_name}.sqlite3")
+
+    def _open(self, index_name: str) -> sqlite3.Connection:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(index_name)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            conn.executescript(SCHEMA)
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"fingerprint 파일을 읽을 수 없어 새로 만듭니다: {path}, {e}")
+            conn.close()
+            os.remove(path)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.executescript(SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'uuid'").fetchone()
+        if row is not None:
+            self._uuids[index_name] = row[0]
+        return conn
+
+    def _connect(self, index_name: str, index_uuid: str) -> sqlite3.Connection:
+        conn = self._connections.get(index_name)
+        if conn is None:
+            conn = self._connections[index_name] = self._open(index_name)
+        if self._uuids.get(index_name) != index_uuid:
+            if index_name in self._uuids:
+                logger.info(f"인덱스 '{index_name}'가 다시 생성되어 fingerprint 기록을 초기화합니다.")
+            with conn:
+                conn.execute("DELETE FROM docs")
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('uuid', ?)", (index_uuid,))
+            self._uuids[index_name] = index_uuid
+        return conn
+
+    def get_many(self, index_name: str, index_uuid: str, doc_ids: List[str]) -> Dict[str, Dict]:
+        doc_ids = list(dict.fromkeys(doc_ids))
+        found = {}
+        with self._lock:
+            conn = self._connect(index_name, index_uuid)
+            for start in range(0, len(doc_ids), self.LOOKUP_CHUNK_SIZE):
+                chunk = doc_ids[start:start + self.LOOKUP_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT id, fingerprint, price, status FROM docs WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for doc_id, fingerprint, price, status in rows:
+                    found[doc_id] = {"fingerprint": fingerprint, "price": price, "status": status}
+        return found
+
+    def update(self, index_name: str, index_uuid: str, entries: Dict[str, Dict]):
+        if not entries:
+            return
+        with self._lock:
+            conn = self._connect(index_name, index_uuid)
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO docs (id, fingerprint, price, status) VALUES (?, ?, ?, ?)",
+                    [(doc_id, e["fingerprint"], e.get("price"), e.get("status")) for doc_id, e in entries.items()],
+                )
+
+    def clear(self):
+        """열린 파일을 닫습니다. 기록은 파일에 남아 다음 조회 때 다시 엽니다."""
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+            self._uuids.clear()
+
+def fingerprint_entry(item: Dict[str, Any], fingerprint: str) -> Dict[str, Any]:
+    return {"fingerprint": fingerprint, "price": item.get("price"), "status": item.get("status")}
+
+@dataclass
+class ChangeSet:
+    """재크롤링 결과 중 실제로 저장해야 하는 문서와 변경 내역입니다."""
+    writes: List[Dict] = field(default_factory=list)  # {"_id", "doc"} 목록
+    entries: Dict[str, Dict] = field(default_factory=dict)  # 저장 성공 시 로컬 인덱스에 기록할 값
+    warmed: Dict[str, Dict] = field(default_factory=dict)  # Elasticsearch에서 읽어 온 기존 fingerprint
+    unchanged: int = 0
+    skipped_sold: int = 0
+    new_listings: List[Dict] = field(default_factory=list)
+    price_drops: List[Dict] = field(default_factory=list)
+    sold_out: List[Dict] = field(default_factory=list)
+    changed: int = 0
+
+    def changelog(self, limit: int = None) -> Dict[str, Any]:
+        limit = settings.CRAWL_CHANGELOG_LIMIT if limit is None else limit
+        return {
+            "new_listings": len(self.new_listings),
+            "price_drops": len(self.price_drops),
+            "sold_out": len(self.sold_out),
+            "other_changes": self.changed,
+            "unchanged": self.unchanged,
+            "items": {
+                "new_listings": self.new_listings[:limit],
+                "price_drops": self.price_drops[:limit],
+                "sold_out": self.sold_out[:limit],
+            },
+        }
+
+class ChangeDetector:
+    """
+    크롤링한 상품을 이전에 저장한 fingerprint와 비교해 새 상품과 바뀐 상품만 골라냅니다.
+    로컬 기록에 없는 문서는 Elasticsearch 문서에 저장된 fingerprint를 한 번의 mget으로 읽어 채웁니다.
+    (fingerprint 필드가 없는 문서는 _source의 가격/상태/제목/이미지로 계산합니다)
+
+    Args:
+        index (FingerprintIndex): 로컬 fingerprint 기록
+    """
+
+    def __init__(self, index: FingerprintIndex = None):
+        self.index = index or FingerprintIndex()
+
+    @staticmethod
+    def index_uuid(es: Elasticsearch, index_name: str) -> str:
+        response = es.indices.get_settings(index=index_name)
+        # 별칭으로 조회하면 실제 인덱스 이름이 키가 되므로 첫 번째 값을 사용합니다.
+        return next(iter(response.values()))["settings"]["index"]["uuid"]
+
+    def _fetch_stored(self, es: Elasticsearch, index_name: str, doc_ids: List[str]) -> Dict[str, Dict]:
+        if not doc_ids:
+            return {}
+        response = es.mget(index=index_name, ids=doc_ids, source_includes=["fingerprint", *FINGERPRINT_FIELDS])
+        stored = {}
+        for doc in response["docs"]:
+            source = doc.get("_source") if doc.get("found") else None
+            if source is None:
+                continue
+            # fingerprint 필드 없이 적재된 문서(이전 버전 엑셀 적재 등)는 저장된 내용으로 계산합니다.
+            stored[doc["_id"]] = fingerprint_entry(source, source.get("fingerprint") or content_fingerprint(source))
+        return stored
+
+    def detect(self, es: Elasticsearch, index_name: str, index_uuid: str, items: List[Dict], doc_ids: List[str]) -> ChangeSet:
+        """
+        Args:
+            es (Elasticsearch): 기존 fingerprint 조회용 클라이언트
+            index_name (str): 인덱스 이름
+            index_uuid (str): 인덱스 uuid (로컬 기록 유효성 확인용)
+            items (List[Dict]): 크롤링한 상품 목록
+            doc_ids (List[str]): 각 상품의 문서 _id
+
+        Returns:
+            ChangeSet: 저장할 문서와 변경 내역
+        """
+        known = self.index.get_many(index_name, index_uuid, doc_ids)
+        missing = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id not in known]
+        changes = ChangeSet()
+        changes.warmed = self._fetch_stored(es, index_name, missing)
+        known.update(changes.warmed)
+
+        for item, doc_id in zip(items, doc_ids):
+            fingerprint = content_fingerprint(item)
+            previous = known.get(doc_id)
+            if previous is None and item.get("status") == SOLD_OUT:
+                # 처음 보는 상품이 이미 판매완료이면 저장하지 않습니다.
+                changes.skipped_sold += 1
+                continue
+            if previous is not None and previous["fingerprint"] == fingerprint:
+                changes.unchanged += 1
+                continue
+
+            summary = {"link": item.get("link"), "title": item.get("title"), "price": item.get("price")}
+            if previous is None:
+                changes.new_listings.append(summary)
+            elif item.get("status") == SOLD_OUT and previous.get("status") != SOLD_OUT:
+                changes.sold_out.append(summary)
+            elif _is_price_drop(previous.get("price"), item.get("price")):
+                changes.price_drops.append(dict(summary, old_price=previous.get("price")))
+            else:
+                changes.changed += 1
+
+            changes.writes.append({"_id": doc_id, "doc": dict(item, fingerprint=fingerprint)})
+            entry = fingerprint_entry(item, fingerprint)
+            known[doc_id] = entry
+            changes.entries[doc_id] = entry
+        return changes
+
+    def commit(self, index_name: str, index_uuid: str, changes: ChangeSet, failed_ids: List[str] = ()):
+        """저장에 성공한 문서와 Elasticsearch에서 읽어 온 기록을 로컬 fingerprint 인덱스에 반영합니다."""
+        failed = set(failed_ids)
+        entries = dict(changes.warmed)
+        entries.update({doc_id: entry for doc_id, entry in changes.entries.items() if doc_id not in failed})
+        self.index.update(index_name, index_uuid, entries)
+
+def _is_price_drop(old_price: Optional[Any], new_price: Optional[Any]) -> bool:
+    try:
+        return new_price is not None and old_price is not None and int(new_price) < int(old_price)
+    except (TypeError, ValueError):
+        return False
@@ -1,13 +1,171 @@
-from sqlalchemy.orm import Session
-from app import models 
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+from sqlalchemy import insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.models import user  # noqa: F401 (relationship 대상 모델을 매퍼에 등록)
+from app.core.config import settings
+from app.models.item import Item
 from app.schemas import schemas
 
-def create_item(db: Session, item_in: schemas.ItemCreate, user_id: int):
-    item = models.Item(**item_in.dict(), owner_id=user_id)
+logger = logging.getLogger(__name__)
+
+def encode_item_cursor(last_id: int, order: str) -> str:
+    """마지막 상품 id와 정렬 방향을 클라이언트에 전달할 opaque cursor로 인코딩합니다."""
+    payload = json.dumps({"id": last_id, "order": order}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+def decode_item_cursor(cursor: str, order: str) -> int:
+    """cursor에서 마지막 상품 id를 꺼냅니다. 형식이 잘못되었거나 정렬 방향이 다르면 ValueError를 발생시킵니다."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        last_id = payload["id"]
+        if not isinstance(last_id, int):
+            raise ValueError("id 값이 없습니다.")
+    except Exception as e:
+        raise ValueError(f"잘못된 cursor입니다: {e}")
+    if payload.get("order") != order:
+        raise ValueError("cursor의 정렬 방향이 요청과 다릅니다.")
+    return last_id
+
+def like_pattern(q: str) -> str:
+    """검색어를 부분 일치 LIKE 패턴으로 바꿉니다. (검색어 안의 %, _는 와일드카드가 아닌 문자로 취급)"""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def items_query(
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    owner_id: Optional[int] = None,
+    order: str = "asc",
+    q: Optional[str] = None,
+) -> Select:
+    """
+    상품 목록 조회 쿼리를 만듭니다.
+
+    cursor가 있으면 keyset(seek) 방식으로 마지막 id 다음부터 limit개를 읽어 페이지 깊이와 무관하게 비용이 일정합니다.
+    cursor가 없으면 기존처럼 OFFSET/LIMIT을 사용합니다. (skip이 클수록 건너뛸 행을 모두 읽음)
+    owner_id로 거르는 경우 (owner_id, id) 복합 인덱스로 필터와 정렬을 함께 처리합니다.
+    q가 있으면 title 또는 description에 q가 포함된 상품만 대소문자 구분 없이 찾습니다.
+    PostgreSQL에서는 pg_trgm GIN 인덱스(마이그레이션 0003)가 ILIKE '%q%'를 처리합니다.
+
+    Raises:
+        ValueError: cursor가 잘못되었거나 skip과 함께 사용한 경우
+    """
+    stmt = select(Item)
+    if owner_id is not None:
+        stmt = stmt.where(Item.owner_id == owner_id)
+    if q:
+        pattern = like_pattern(q)
+        stmt = stmt.where(or_(Item.title.ilike(pattern, escape="\\"), Item.description.ilike(pattern, escape="\\")))
+    stmt = stmt.order_by(Item.id.desc() if order == "desc" else Item.id)
+    if cursor:
+        if skip:
+            raise ValueError("cursor와 skip은 함께 사용할 수 없습니다.")
+        last_id = decode_item_cursor(cursor, order)
+        stmt = stmt.where(Item.id < last_id if order == "desc" else Item.id > last_id)
+    elif skip:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+def next_item_cursor(items: List[Item], limit: int, order: str = "asc") -> Optional[str]:
+    """페이지가 limit만큼 채워졌으면 다음 페이지 cursor를 반환합니다."""
+    if items and len(items) == limit:
+        return encode_item_cursor(items[-1].id, order)
+    return None
+
+async def create_item(db: AsyncSession, item_in: schemas.ItemCreate, user_id: Optional[int] = None) -> Item:
+    item = Item(**item_in.dict(), owner_id=user_id)
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await db.refresh(item)
     return item
 
-def get_items(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.Item).offset(skip).limit(limit).all()
+# INSERT ... RETURNING을 지원하는 최소 SQLite 버전
+SQLITE_RETURNING_VERSION = (3, 35)
+
+async def _insert_chunk(db: AsyncSession, rows: List[Dict[str, Any]]) -> List[Optional[int]]:
+    """
+    상품 여러 개를 INSERT 한 번으로 넣고 생성된 id를 입력 순서대로 반환합니다.
+
+    PostgreSQL은 INSERT ... VALUES (...), (...) RETURNING id를 사용합니다.
+    SQLAlchemy 1.4의 SQLite 방언은 RETURNING을 컴파일하지 못하므로, 같은 INSERT 문에 RETURNING id를 붙여
+    드라이버로 직접 실행합니다. (SQLite 3.35 이상, 그 미만이면 id 없이 None을 반환합니다)
+    RETURNING 행 순서는 보장되지 않지만 한 문장 안의 id는 VALUES 순서대로 증가하므로 정렬해서 돌려줍니다.
+    """
+    conn = await db.connection()
+    stmt = insert(Item).values(rows)
+    if conn.dialect.implicit_returning:
+        result = await db.execute(stmt.returning(Item.id))
+        return sorted(result.scalars().all())
+    if conn.dialect.name == "sqlite" and conn.dialect.server_version_info >= SQLITE_RETURNING_VERSION:
+        compiled = stmt.compile(dialect=conn.dialect)
+        values = compiled.params  # 접근할 때마다 새로 만드는 속성이므로 한 번만 읽습니다.
+        params = tuple(values[name] for name in compiled.positiontup)
+        result = await conn.exec_driver_sql(f"{compiled} RETURNING id", params)
+        return sorted(row[0] for row in result.fetchall())
+    await db.execute(stmt)
+    return [None] * len(rows)
+
+async def create_items_bulk(
+    db: AsyncSession,
+    items_in: Sequence[schemas.ItemBulkEntry],
+    chunk_size: int = None,
+) -> Dict[str, Any]:
+    """
+    상품을 chunk_size개씩 나눠 청크마다 INSERT 한 번과 트랜잭션 하나로 등록합니다.
+    실패한 청크는 롤백하고 오류를 기록한 뒤 다음 청크를 계속 처리합니다.
+
+    Args:
+        db (AsyncSession): DB 세션
+        items_in (Sequence[schemas.ItemBulkEntry]): 등록할 상품 목록
+        chunk_size (int): 청크당 상품 수 (기본값: ITEMS_BULK_CHUNK_SIZE)
+
+    Returns:
+        Dict[str, Any]: 생성/실패 수, 입력 순서의 id 목록(실패한 상품과 RETURNING이 없는 DB는 None), 청크별 오류
+    """
+    chunk_size = chunk_size or settings.ITEMS_BULK_CHUNK_SIZE
+    ids: List[Optional[int]] = []
+    errors: List[Dict[str, Any]] = []
+    for start in range(0, len(items_in), chunk_size):
+        chunk = items_in[start:start + chunk_size]
+        rows = [item_in.dict() for item_in in chunk]
+        try:
+            chunk_ids = await _insert_chunk(db, rows)
+            await db.commit()
+            ids.extend(chunk_ids)
+        except Exception as e:
+            await db.rollback()
+            # IntegrityError 등의 문자열에는 SQL과 전체 파라미터가 들어가므로 드라이버 오류 메시지만 남깁니다.
+            message = str(getattr(e, "orig", None) or e)
+            logger.warning(f"상품 일괄 등록 청크 실패 (start={start}, count={len(chunk)}): {message}")
+            errors.append({"start": start, "count": len(chunk), "error": message})
+            ids.extend([None] * len(chunk))
+    failed = sum(error["count"] for error in errors)
+    return {"created": len(items_in) - failed, "failed": failed, "ids": ids, "errors": errors}
+
+async def get_items(db: AsyncSession, skip: int = 0, limit: int = 10) -> List[Item]:
+    result = await db.execute(items_query(skip=skip, limit=limit))
+    return result.scalars().all()
+
+async def get_items_page(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    owner_id: Optional[int] = None,
+    order: str = "asc",
+    q: Optional[str] = None,
+) -> Tuple[List[Item], Optional[str]]:
+    """
+    상품 목록 한 페이지와 다음 페이지 cursor를 반환합니다.
+
+    Returns:
+        Tuple[List[Item], Optional[str]]: 상품 목록, 다음 페이지 cursor (마지막 페이지면 None)
+    """
+    result = await db.execute(items_query(skip=skip, limit=limit, cursor=cursor, owner_id=owner_id, order=order, q=q))
+    items = result.scalars().all()
+    return items, next_item_cursor(items, limit, order)
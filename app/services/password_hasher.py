@@ -0,0 +1,127 @@
+# app/services/password_hasher.py
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import logging
+from app.core.config import settings
+from app.utils.security import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+class PasswordHasherBusy(Exception):
+    """해시 작업 대기열이 가득 차 요청을 처리할 수 없을 때 발생합니다."""
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 프로세스 풀에서 실행하는 비동기 실행기입니다.
+
+    bcrypt는 일부러 느리게 만든 연산(요청당 수백 ms)이라 async 핸들러에서 직접 호출하면
+    그동안 이벤트 루프 전체가 멈춥니다. 작업을 프로세스 풀로 보내 여러 코어에 나누고,
+    동시에 실행하는 작업은 max_concurrency개로 제한합니다.
+    실행 슬롯을 기다리는 요청이 max_queue개를 넘거나 queue_timeout 안에 슬롯을 얻지 못하면
+    PasswordHasherBusy를 발생시켜 요청을 바로 거절합니다. (로그인 폭주 시 부하 차단)
+
+    Args:
+        workers (int): 프로세스 수 (0이면 CPU 코어 수)
+        max_concurrency (int): 동시에 실행할 최대 작업 수 (0이면 workers)
+        max_queue (int): 실행 슬롯을 기다릴 수 있는 최대 요청 수
+        queue_timeout (float): 실행 슬롯을 기다리는 최대 시간 (초)
+    """
+
+    def __init__(
+        self,
+        workers: int = None,
+        max_concurrency: int = None,
+        max_queue: int = None,
+        queue_timeout: float = None,
+    ):
+        self.workers = (settings.PASSWORD_HASH_WORKERS if workers is None else workers) or os.cpu_count() or 1
+        self.max_concurrency = (
+            settings.PASSWORD_HASH_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+        ) or self.workers
+        self.max_queue = settings.PASSWORD_HASH_MAX_QUEUE if max_queue is None else max_queue
+        self.queue_timeout = settings.PASSWORD_HASH_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 이벤트 루프와 클라이언트 스레드가 떠 있는 프로세스를 fork하지 않도록 spawn으로 워커를 만듭니다.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"비밀번호 해시 프로세스 풀 시작: {self.workers}개")
+        return self._executor
+
+    async def _acquire(self):
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy(f"비밀번호 해시 대기 요청이 {self.waiting}개로 가득 찼습니다.")
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise PasswordHasherBusy(f"비밀번호 해시 대기 시간 {self.queue_timeout}초를 넘었습니다.")
+        finally:
+            self.waiting -= 1
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """
+        fn(*args)를 프로세스 풀에서 실행하고 결과를 반환합니다. fn과 인자는 pickle 가능해야 합니다.
+
+        Raises:
+            PasswordHasherBusy: 대기 요청이 max_queue를 넘거나 queue_timeout 안에 실행하지 못한 경우
+        """
+        queued_at = time.perf_counter()
+        await self._acquire()
+        started = time.perf_counter()
+        self.wait_time += started - queued_at
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.run_time += time.perf_counter() - started
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.wait_time / self.completed * 1000, 1) if self.completed else None,
+            "avg_run_ms": round(self.run_time / self.completed * 1000, 1) if self.completed else None,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,344 @@
+# app/services/search_cache.py
+
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+import threading
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+import logging
+import orjson
+from pydantic import BaseModel
+from app.core.config import settings
+from app.schemas.search import SearchRequest
+from app.utils.ttl_cache import TTLCache, MISSING
+
+logger = logging.getLogger(__name__)
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict()
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value)}")
+
+def serialize(value: Any) -> bytes:
+    """캐시 값을 compact한 JSON 바이트로 직렬화합니다."""
+    return orjson.dumps(value, default=_orjson_default)
+
+def deserialize(data: bytes) -> Any:
+    return orjson.loads(data)
+
+class SearchCacheBackend(ABC):
+    """
+    검색 캐시 저장소 인터페이스입니다.
+    값 저장/조회와 인덱스별 generation 관리만 담당하며, 키 구성과 요청 병합은 SearchCache가 처리합니다.
+    비동기 메서드는 기본적으로 동기 메서드를 그대로 호출합니다.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """값을 조회합니다. 없으면 MISSING을 반환합니다."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float):
+        pass
+
+    @abstractmethod
+    def generation(self, index_name: str) -> int:
+        pass
+
+    @abstractmethod
+    def bump_generation(self, index_name: str) -> int:
+        pass
+
+    async def aget(self, key: str) -> Any:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: float):
+        self.set(key, value, ttl)
+
+    async def ageneration(self, index_name: str) -> int:
+        return self.generation(index_name)
+
+    def clear(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+class MemorySearchCacheBackend(SearchCacheBackend):
+    """프로세스 내부 TTL/LRU 캐시 저장소입니다. uvicorn 워커마다 별도로 존재합니다."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = None, ttl: float = None):
+        self._cache = TTLCache(
+            max_entries=max_entries or settings.SEARCH_CACHE_MAX_ENTRIES,
+            ttl=settings.SEARCH_CACHE_TTL if ttl is None else ttl,
+        )
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._cache.set(key, value, ttl=ttl)
+
+    def generation(self, index_name: str) -> int:
+        return self._generations[index_name]
+
+    def bump_generation(self, index_name: str) -> int:
+        with self._lock:
+            self._generations[index_name] += 1
+            return self._generations[index_name]
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._cache.stats()
+        stats.update({"backend": self.name, "generations": dict(self._generations)})
+        return stats
+
+class RedisSearchCacheBackend(SearchCacheBackend):
+    """
+    Redis 프로토콜 서버를 사용하는 프로세스 외부 캐시 저장소입니다.
+    모든 uvicorn 워커가 같은 항목과 generation을 공유하므로 워커 수가 늘어도 적중률이 유지됩니다.
+
+    Args:
+        client: redis.Redis 호환 동기 클라이언트
+        async_client: redis.asyncio.Redis 호환 비동기 클라이언트 (없으면 동기 클라이언트 사용)
+        prefix (str): 키 접두사
+    """
+
+    name = "redis"
+
+    def __init__(self, client, async_client=None, prefix: str = "search"):
+        self.client = client
+        self.async_client = async_client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "search") -> "RedisSearchCacheBackend":
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError as e:
+            raise RuntimeError("redis 캐시 백엔드를 사용하려면 redis 패키지가 필요합니다.") from e
+        return cls(redis.Redis.from_url(url), redis.asyncio.Redis.from_url(url), prefix=prefix)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _generation_key(self, index_name: str) -> str:
+        return f"{self.prefix}:gen:{index_name}"
+
+    def get(self, key: str) -> Any:
+        data = self.client.get(self._key(key))
+        return MISSING if data is None else deserialize(data)
+
+    def set(self, key: str, value: Any, ttl: float):
+        self.client.set(self._key(key), serialize(value), px=max(1, int(ttl * 1000)))
+
+    def generation(self, index_name: str) -> int:
+        return int(self.client.get(self._generation_key(index_name)) or 0)
+
+    def bump_generation(self, index_name: str) -> int:
+        return int(self.client.incr(self._generation_key(index_name)))
+
+    async def aget(self, key: str) -> Any:
+        if self.async_client is None:
+            return self.get(key)
+        data = await self.async_client.get(self._key(key))
+        return MISSING if data is None else deserialize(data)
+
+    async def aset(self, key: str, value: Any, ttl: float):
+        if self.async_client is None:
+            return self.set(key, value, ttl)
+        await self.async_client.set(self._key(key), serialize(value), px=max(1, int(ttl * 1000)))
+
+    async def ageneration(self, index_name: str) -> int:
+        if self.async_client is None:
+            return self.generation(index_name)
+        return int(await self.async_client.get(self._generation_key(index_name)) or 0)
+
+def create_cache_backend() -> SearchCacheBackend:
+    """Settings.SEARCH_CACHE_BACKEND에 맞는 캐시 저장소를 생성합니다."""
+    if settings.SEARCH_CACHE_BACKEND == "redis":
+        return RedisSearchCacheBackend.from_url(settings.SEARCH_CACHE_REDIS_URL)
+    return MemorySearchCacheBackend()
+
+class _Pending:
+    """동일 키에 대한 동시 요청이 기다리는 진행 중인 로드 결과입니다."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: BaseException = None
+
+class SearchCache:
+    """
+    검색 결과 캐시입니다.
+    정규화된 SearchRequest를 키로 사용하고, 동시에 들어온 같은 miss는 한 번만 Elasticsearch를 호출합니다.
+    인덱스별 generation을 키에 포함하여 인덱스에 쓰기가 발생하면 기존 항목이 더 이상 조회되지 않습니다.
+    실제 저장은 SearchCacheBackend(memory 또는 redis)에 위임합니다.
+
+    Args:
+        backend (SearchCacheBackend): 캐시 저장소 (기본값: MemorySearchCacheBackend)
+        ttl (float): 항목 유효 시간 (초)
+    """
+
+    def __init__(self, backend: SearchCacheBackend = None, ttl: float = None):
+        self.backend = backend or MemorySearchCacheBackend()
+        self.ttl = settings.SEARCH_CACHE_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._async_pending: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @staticmethod
+    def normalize(request: SearchRequest) -> Tuple:
+        """검색 결과에 영향을 주는 요청 값만 정규화합니다."""
+        query = " ".join(request.query.split()).lower()
+        return (
+            query,
+            request.min_price,
+            request.max_price,
+            sorted(request.category) if request.category else None,
+            request.status,
+            request.facets,
+            request.sort,
+            request.order,
+            request.size,
+            request.page,
+            list(request.search_after) if request.search_after else None,
+        )
+
+    def make_key(self, index_name: str, request: SearchRequest, generation: int) -> str:
+        """인덱스, generation, 정규화된 요청으로 짧은 캐시 키를 만듭니다."""
+        digest = hashlib.blake2b(orjson.dumps(self.normalize(request)), digest_size=16).hexdigest()
+        return f"{index_name}:{generation}:{digest}"
+
+    def invalidate(self, index_name: str):
+        """인덱스의 generation을 올려 해당 인덱스의 캐시 항목을 모두 무효화합니다."""
+        try:
+            generation = self.backend.bump_generation(index_name)
+        except Exception as e:
+            # 무효화에 실패해도 기존 항목은 TTL이 지나면 만료됩니다.
+            self._record_error(e)
+            return
+        self.invalidations += 1
+        logger.info(f"검색 캐시 무효화: index={index_name}, generation={generation}")
+
+    def get_or_load(self, index_name: str, request: SearchRequest, loader: Callable[[], Any]) -> Any:
+        """
+        캐시에서 값을 조회하고, 없으면 loader를 호출해 채웁니다.
+        같은 키로 동시에 들어온 요청은 먼저 들어온 요청의 결과를 기다립니다.
+        """
+        try:
+            key = self.make_key(index_name, request, self.backend.generation(index_name))
+            value = self.backend.get(key)
+        except Exception as e:
+            # 캐시 저장소 장애 시 검색 자체는 계속 동작하도록 캐시를 건너뜁니다.
+            self._record_error(e)
+            return loader()
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+            pending = self._pending.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._pending[key] = _Pending()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = loader()
+            try:
+                self.backend.set(key, pending.value, self.ttl)
+            except Exception as e:
+                self._record_error(e)
+            return pending.value
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.event.set()
+
+    async def aget_or_load(self, index_name: str, request: SearchRequest, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_load의 비동기 버전입니다. 같은 이벤트 루프의 동시 miss를 하나의 호출로 합칩니다."""
+        try:
+            key = self.make_key(index_name, request, await self.backend.ageneration(index_name))
+            value = await self.backend.aget(key)
+        except Exception as e:
+            self._record_error(e)
+            return await loader()
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        task = self._async_pending.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            # 먼저 들어온 요청이 취소되어도(클라이언트 연결 끊김 등) 기다리던 요청은 결과를 받도록
+            # 로드를 어느 요청에도 속하지 않는 태스크로 실행하고, 요청마다 shield로 기다립니다.
+            task = asyncio.ensure_future(self._aload(key, loader))
+            self._async_pending[key] = task
+            task.add_done_callback(lambda done: self._aload_done(key, done))
+        return await asyncio.shield(task)
+
+    async def _aload(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        try:
+            await self.backend.aset(key, value, self.ttl)
+        except Exception as e:
+            self._record_error(e)
+        return value
+
+    def _aload_done(self, key: str, task: "asyncio.Future"):
+        if self._async_pending.get(key) is task:
+            del self._async_pending[key]
+        if not task.cancelled():
+            # 기다리는 요청이 모두 취소된 뒤 실패하면 "exception was never retrieved" 경고를 막습니다.
+            task.exception()
+
+    def _record_error(self, error: Exception):
+        self.errors += 1
+        logger.warning(f"검색 캐시 저장소 오류, 캐시를 건너뜁니다: {error}")
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        stats = self.backend.stats()
+        stats.update({
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        })
+        return stats
+
+search_cache = SearchCache(backend=create_cache_backend())
@@ -0,0 +1,81 @@
+# app/services/search_query.py
+
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.schemas.search import SearchRequest
+
+# 카테고리 facet 집계 이름
+CATEGORY_FACET = "category"
+
+def text_clause(request: SearchRequest) -> Dict[str, Any]:
+    """제목 검색어를 문서가 반드시 일치해야 하는 match 절로 만듭니다."""
+    title = {"query": request.query}
+    if settings.SEARCH_TITLE_MINIMUM_SHOULD_MATCH:
+        # 설정된 경우에만 n-gram 토큰 중 최소 일치 비율을 적용합니다. (재현율이 줄어듭니다)
+        title["minimum_should_match"] = settings.SEARCH_TITLE_MINIMUM_SHOULD_MATCH
+    return {"match": {"title": title}}
+
+def price_clause(request: SearchRequest) -> Optional[Dict[str, Any]]:
+    if request.min_price is None and request.max_price is None:
+        return None
+    price_filter = {}
+    if request.min_price is not None:
+        price_filter["gte"] = request.min_price
+    if request.max_price is not None:
+        price_filter["lte"] = request.max_price
+    return {"range": {"price": price_filter}}
+
+def category_clause(request: SearchRequest) -> Optional[Dict[str, Any]]:
+    if not request.category:
+        return None
+    return {"terms": {"category": list(request.category)}}
+
+def status_clause(request: SearchRequest) -> Optional[Dict[str, Any]]:
+    if not request.status:
+        return None
+    return {"term": {"status": request.status}}
+
+def build_query(request: SearchRequest) -> Dict[str, Any]:
+    """
+    검색 요청을 Elasticsearch 요청 본문의 query/post_filter/aggs/track_total_hits 부분으로 변환합니다.
+
+    - 제목 match는 must에 두어 일치하는 문서만 점수를 계산합니다.
+    - 가격/카테고리/판매 상태는 점수와 무관한 filter context에 두어 Elasticsearch가 캐시할 수 있게 합니다.
+    - facet을 요청하면 카테고리 필터는 post_filter로 옮겨, 선택하지 않은 카테고리의 개수도 집계되게 합니다.
+    - total은 SEARCH_TRACK_TOTAL_HITS까지만 정확히 셉니다. (넘으면 relation이 gte)
+
+    Args:
+        request (SearchRequest): 검색 요청 데이터
+
+    Returns:
+        Dict[str, Any]: 요청 본문에 합칠 query 관련 항목
+    """
+    filters: List[Dict[str, Any]] = [
+        clause for clause in (price_clause(request), status_clause(request)) if clause is not None
+    ]
+    category = category_clause(request)
+    body: Dict[str, Any] = {"track_total_hits": settings.SEARCH_TRACK_TOTAL_HITS}
+
+    if request.facets:
+        body["aggs"] = {
+            CATEGORY_FACET: {"terms": {"field": "category", "size": settings.SEARCH_FACET_SIZE}}
+        }
+        if category is not None:
+            body["post_filter"] = category
+    elif category is not None:
+        filters.append(category)
+
+    body["query"] = {"bool": {"must": [text_clause(request)], "filter": filters}}
+    return body
+
+def parse_facets(response: Dict[str, Any]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """집계 응답을 {"category": [{"key", "count"}, ...]} 형태로 변환합니다. 집계가 없으면 None을 반환합니다."""
+    aggregations = response.get("aggregations")
+    if not aggregations or CATEGORY_FACET not in aggregations:
+        return None
+    return {
+        CATEGORY_FACET: [
+            {"key": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregations[CATEGORY_FACET]["buckets"]
+        ]
+    }
@@ -1,20 +1,158 @@
 # services/search_service.py
 
-from typing import Optional, List, Dict
-from elasticsearch import Elasticsearch
+import base64
+import json
+from typing import Optional, List, Dict, Any
+from elasticsearch import Elasticsearch, AsyncElasticsearch
 import logging
+from app.core.config import settings
 from app.schemas.search import SearchRequest, SearchResponseItem
+from app.services.search_cache import SearchCache
+from app.services.search_query import build_query, parse_facets
 
 logger = logging.getLogger(__name__)
 
+# 검색 응답에 필요한 _source 필드 (fingerprint 등 색인용 필드는 가져오지 않습니다)
+RESPONSE_FIELDS = list(SearchResponseItem.__fields__)
+# 같은 정렬 값을 가진 문서 사이의 순서를 고정하는 고유 필드
+TIEBREAKER_FIELD = "link"
+
+def encode_cursor(pit_id: str, sort_values: List[Any]) -> str:
+    """PIT id와 마지막 sort 값을 클라이언트에 전달할 opaque cursor로 인코딩합니다."""
+    payload = json.dumps({"pit": pit_id, "sort": sort_values}, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """cursor를 디코딩합니다. 형식이 잘못되었거나 PIT id가 없으면 ValueError를 발생시킵니다."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(payload.get("sort"), list):
+            raise ValueError("sort 값이 없습니다.")
+        if not payload.get("pit"):
+            raise ValueError("point-in-time id가 없습니다.")
+        return {"pit": payload["pit"], "sort": payload["sort"]}
+    except Exception as e:
+        raise ValueError(f"잘못된 cursor입니다: {e}")
+
+def is_cursor_request(request: SearchRequest) -> bool:
+    """PIT를 사용하는 cursor 방식 요청인지 확인합니다."""
+    return bool(request.cursor or request.cursor_mode)
+
+def item_from_source(source: Dict[str, Any]) -> Dict[str, Any]:
+    """_source를 SearchResponseItem 필드만 가진 딕셔너리로 변환합니다. 없는 필드는 None으로 채웁니다."""
+    return {field: source.get(field) for field in RESPONSE_FIELDS}
+
 class SearchService:
-    def __init__(self, es: Elasticsearch, index_name: str = "bunjang"):
+    def __init__(self, es: Elasticsearch, index_name: str = "bunjang", cache: Optional[SearchCache] = None):
         self.es = es
         self.index_name = index_name
+        self.cache = cache
+
+    def _build_sort(self, request: SearchRequest, use_pit: bool = False) -> List[Dict]:
+        """요청 정렬 기준에 고유 tiebreaker를 붙여 정렬 순서를 결정적으로 만듭니다."""
+        sort = [
+            {request.sort: {"order": request.order}},
+            {TIEBREAKER_FIELD: {"order": "asc"}},
+        ]
+        if use_pit:
+            sort.append({"_shard_doc": {"order": "asc"}})
+        return sort
+
+    def _build_body(self, request: SearchRequest, cursor: Optional[Dict[str, Any]] = None, pit_id: Optional[str] = None) -> Dict:
+        """
+        검색 요청을 Elasticsearch 요청 본문으로 변환합니다.
+
+        Args:
+            request (SearchRequest): 검색 요청 데이터
+            cursor (Optional[Dict[str, Any]]): 디코딩한 이전 페이지 cursor
+            pit_id (Optional[str]): cursor 방식 첫 페이지에서 새로 연 PIT id (다음 페이지부터는 cursor의 PIT 사용)
+        """
+        pit_id = cursor["pit"] if cursor else pit_id
+        use_pit = pit_id is not None
+
+        # Elasticsearch 검색 요청 본문 구성 (must/filter 쿼리, facet 집계, total 상한)
+        body = build_query(request)
+        body["sort"] = self._build_sort(request, use_pit=use_pit)
+        body["size"] = request.size
+        body["_source"] = RESPONSE_FIELDS
+
+        # 페이지네이션 설정
+        if use_pit:
+            # cursor 기반 페이지네이션 (PIT + search_after)
+            # 첫 페이지부터 같은 PIT를 사용하므로 모든 페이지가 같은 스냅샷을 보고, 페이지 깊이와 무관하게 비용이 일정합니다.
+            body["pit"] = {"id": pit_id, "keep_alive": settings.SEARCH_PIT_KEEP_ALIVE}
+            if cursor:
+                body["search_after"] = list(cursor["sort"])
+        elif request.search_after:
+            body["search_after"] = request.search_after
+        elif request.page and request.page > 1:
+            # 페이지 번호 기반 페이지네이션 (from/size 사용, SEARCH_MAX_RESULT_WINDOW 이내)
+            body["from"] = (request.page - 1) * request.size
+
+        if "search_after" in body:
+            # facet은 첫 페이지에서만 집계합니다. (다음 페이지의 집계 결과는 같습니다)
+            body.pop("aggs", None)
+
+        return body
+
+    def _search_kwargs(self, body: Dict) -> Dict:
+        """PIT 검색은 인덱스를 지정하지 않아야 하므로 요청 인자를 나눠서 구성합니다."""
+        if "pit" in body:
+            return {"body": body}
+        return {"index": self.index_name, "body": body}
+
+    def _build_response(self, request: SearchRequest, response: Dict, body: Dict) -> Dict:
+        """Elasticsearch 응답을 SearchResponse 형태의 딕셔너리로 변환합니다."""
+        hits = response["hits"]["hits"]
+        total = response["hits"]["total"]["value"]
+
+        # 마지막 문서의 sort 값을 search_after로 전달
+        last_sort = hits[-1]["sort"] if hits else None
+
+        # cursor 방식에서 결과가 size만큼 채워졌으면 다음 페이지 cursor를 만듭니다.
+        next_cursor = None
+        if "pit" in body and hits and len(hits) == request.size:
+            pit_id = response.get("pit_id") or body["pit"]["id"]
+            next_cursor = encode_cursor(pit_id, last_sort)
+
+        # 결과 포맷팅
+        # _source는 우리가 색인한 문서이므로 필드별 검증 없이 응답 필드만 골라 딕셔너리로 만듭니다.
+        # (라우터는 이 결과를 response_model 재검증 없이 ORJSONResponse로 바로 직렬화합니다)
+        results = [item_from_source(hit["_source"]) for hit in hits]
+
+        return {
+            "total": total,
+            "total_relation": response["hits"]["total"].get("relation", "eq"),
+            "facets": parse_facets(response),
+            "page": request.page if not (request.search_after or request.cursor) else None,
+            "size": request.size,
+            "last_sort": last_sort,
+            "next_cursor": next_cursor,
+            "results": results
+        }
+
+    def _exhausted_pit(self, result: Dict, body: Dict) -> Optional[str]:
+        """마지막 페이지에 도달한 PIT id를 반환합니다. (닫아야 할 PIT)"""
+        if "pit" in body and result["next_cursor"] is None:
+            return body["pit"]["id"]
+        return None
+
+    def _open_pit(self) -> str:
+        return self.es.open_point_in_time(index=self.index_name, keep_alive=settings.SEARCH_PIT_KEEP_ALIVE)["id"]
+
+    def _close_pit(self, pit_id: str):
+        try:
+            self.es.close_point_in_time(id=pit_id)
+        except Exception as e:
+            logger.warning(f"PIT 종료 실패: {e}")
 
     def search_items(self, request: SearchRequest) -> Dict:
         """
         Elasticsearch에서 '제목' 필드로 검색을 수행합니다.
+        cursor_mode이면 첫 페이지에서 point-in-time을 열어 next_cursor에 담고,
+        cursor가 주어지면 그 PIT와 search_after로 다음 페이지를 조회합니다.
+        캐시가 설정되어 있으면 같은 요청은 캐시된 결과를 반환합니다.
+        (cursor 방식 응답은 PIT id를 담고 있어 클라이언트끼리 공유되면 안 되므로 캐시하지 않습니다)
 
         Args:
             request (SearchRequest): 검색 요청 데이터
@@ -22,76 +160,91 @@ class SearchService:
         Returns:
             Dict: 검색 결과
         """
+        if self.cache is None or is_cursor_request(request):
+            return self._search(request)
+        return self.cache.get_or_load(self.index_name, request, lambda: self._search(request))
+
+    def _search(self, request: SearchRequest) -> Dict:
+        opened_pit = None
         try:
-            # Elasticsearch 쿼리 구성
-            es_query = {
-                "bool": {
-                    "should": {
-                        "match": {
-                            "title": {
-                                "query": request.query,
-                            }
-                        }
-                    },
-                    "filter": []
-                }
-            }
-
-            # 가격 범위 필터 추가
-            if request.min_price is not None or request.max_price is not None:
-                price_filter = {}
-                if request.min_price is not None:
-                    price_filter["gte"] = request.min_price
-                if request.max_price is not None:
-                    price_filter["lte"] = request.max_price
-                es_query["bool"]["filter"].append({
-                    "range": {
-                        "price": price_filter
-                    }
-                })
-
-            # 정렬 옵션 구성
-            sort_option = {request.sort: {"order": request.order}}
-
-            # Elasticsearch 검색 요청 본문 구성
-            body = {
-                "query": es_query,
-                "sort": [sort_option],
-                "size": request.size,
-            }
-
-            # 페이지네이션 설정
-            # if request.search_after:
-            #     body["search_after"] = request.search_after
-            # else:
-            #     # 페이지 번호 기반 페이지네이션 (from/size 사용)
-            #     from_ = (request.page - 1) * request.size
-            #     body["from"] = from_
+            cursor = decode_cursor(request.cursor) if request.cursor else None
+            if cursor is None and request.cursor_mode:
+                # cursor 방식 첫 페이지에서만 PIT를 열고, 이후 페이지는 cursor에 담긴 PIT를 재사용합니다.
+                opened_pit = self._open_pit()
+
+            body = self._build_body(request, cursor, opened_pit)
 
             # Elasticsearch 검색 요청
             logger.info(f"es query : {body}")
-            response = self.es.search(
-                index=self.index_name,
-                body=body
-            )
+            response = self.es.search(**self._search_kwargs(body))
+            result = self._build_response(request, response, body)
+
+            exhausted_pit = self._exhausted_pit(result, body)
+            if exhausted_pit:
+                self._close_pit(exhausted_pit)
+            return result
+
+        except Exception as e:
+            logger.error(f"검색 실패: {e}")
+            if opened_pit:
+                # 클라이언트에 전달하지 못한 PIT는 keep_alive까지 남지 않도록 바로 닫습니다.
+                self._close_pit(opened_pit)
+            raise
+
+
+class AsyncSearchService(SearchService):
+    """
+    AsyncElasticsearch 기반 SearchService입니다.
+    쿼리 구성과 응답 변환은 SearchService와 공유하고, ES 호출만 이벤트 루프에서 await 합니다.
+    """
 
-            hits = response["hits"]["hits"]
-            total = response["hits"]["total"]["value"]
+    def __init__(self, es: AsyncElasticsearch, index_name: str = "bunjang", cache: Optional[SearchCache] = None):
+        super().__init__(es=es, index_name=index_name, cache=cache)
 
-            # 마지막 문서의 sort 값을 search_after로 전달
-            last_sort = hits[-1]["sort"] if hits else None
+    async def _open_pit(self) -> str:
+        response = await self.es.open_point_in_time(index=self.index_name, keep_alive=settings.SEARCH_PIT_KEEP_ALIVE)
+        return response["id"]
 
-            # 결과 포맷팅
-            results = [SearchResponseItem(**hit["_source"]) for hit in hits]
+    async def _close_pit(self, pit_id: str):
+        try:
+            await self.es.close_point_in_time(id=pit_id)
+        except Exception as e:
+            logger.warning(f"PIT 종료 실패: {e}")
+
+    async def search_items(self, request: SearchRequest) -> Dict:
+        """
+        Elasticsearch에서 '제목' 필드로 비동기 검색을 수행합니다.
+
+        Args:
+            request (SearchRequest): 검색 요청 데이터
+
+        Returns:
+            Dict: 검색 결과
+        """
+        if self.cache is None or is_cursor_request(request):
+            return await self._search(request)
+        return await self.cache.aget_or_load(self.index_name, request, lambda: self._search(request))
+
+    async def _search(self, request: SearchRequest) -> Dict:
+        opened_pit = None
+        try:
+            cursor = decode_cursor(request.cursor) if request.cursor else None
+            if cursor is None and request.cursor_mode:
+                opened_pit = await self._open_pit()
+
+            body = self._build_body(request, cursor, opened_pit)
+
+            logger.info(f"es query : {body}")
+            response = await self.es.search(**self._search_kwargs(body))
+            result = self._build_response(request, response, body)
 
-            return {
-                "total": total,
-                "page": request.page if not request.search_after else None,
-                "size": request.size,
-                "last_sort": last_sort,
-                "results": results
-            }
+            exhausted_pit = self._exhausted_pit(result, body)
+            if exhausted_pit:
+                await self._close_pit(exhausted_pit)
+            return result
 
         except Exception as e:
             logger.error(f"검색 실패: {e}")
+            if opened_pit:
+                await self._close_pit(opened_pit)
             raise
@@ -1,8 +1,15 @@
 # app/services/service_container.py
 
+from elasticsearch import Elasticsearch, AsyncElasticsearch
 from app.services.crawl_service import CrawlService
+from app.services.es_client import EsHealthProbe
+from app.services.suggest_service import SuggestService
 
 class ServiceContainer:
     crawl_service: CrawlService = None
+    es_client: Elasticsearch = None
+    async_es_client: AsyncElasticsearch = None
+    es_health: EsHealthProbe = None
+    suggest_service: SuggestService = None
 
 service_container = ServiceContainer()
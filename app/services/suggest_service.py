@@ -0,0 +1,191 @@
+# app/services/suggest_service.py
+
+import asyncio
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+import logging
+from elasticsearch import AsyncElasticsearch
+from app.core.config import settings
+from app.utils.prefix_trie import PrefixTrie
+
+logger = logging.getLogger(__name__)
+
+# 검색창 자동완성을 처리하는 edge n-gram 서브필드
+SUGGEST_FIELD = "title.suggest"
+# 인기 제목을 집계하는 keyword 서브필드
+TITLE_KEYWORD_FIELD = "title.keyword"
+
+def normalize_prefix(text: str) -> str:
+    """대소문자와 연속 공백 차이를 없앤 비교용 문자열을 만듭니다."""
+    return " ".join(text.split()).lower()
+
+def title_keys(title: str, word_starts: int) -> List[str]:
+    """제목을 앞에서부터 word_starts개 단어 위치에서 시작하는 키로 펼칩니다. ('프라다 가방' → '프라다 가방', '가방')"""
+    normalized = normalize_prefix(re.sub(r"[^\w\s]", " ", title))
+    words = normalized.split(" ")
+    return [" ".join(words[i:]) for i in range(min(word_starts, len(words))) if words[i]]
+
+class SuggestService:
+    """
+    검색창 자동완성(search-as-you-type) 서비스입니다.
+
+    인덱스에 많이 등록된 상위 trie_size개 제목으로 PrefixTrie를 만들어 두고,
+    trie에서 size개 이상 찾을 수 있는 접두어는 Elasticsearch를 거치지 않고 바로 응답합니다.
+    (인덱스의 제목이 모두 trie에 들어가면 trie에 있는 접두어는 결과 수와 관계없이 trie로 응답합니다.)
+    trie에서 size개보다 적게 찾으면 그 제목을 앞에 두고 title.suggest(edge n-gram) 검색 결과로 나머지를 채우며,
+    trie에 없는 접두어는 title.suggest만 검색합니다.
+    trie는 ttl이 지나면 백그라운드에서 다시 만들며, 만드는 동안에는 이전 trie로 응답합니다.
+
+    title.suggest/title.keyword 서브필드는 매핑 버전 3/5에서 추가되었으므로, 그 전에 만든 인덱스는
+    insert_main.reindex_data(EsService.reindex)로 재색인해야 합니다. (create_index는 기존 인덱스를 건너뜁니다)
+
+    Args:
+        es (AsyncElasticsearch): Elasticsearch 비동기 클라이언트
+        index_name (str): 검색할 인덱스(별칭) 이름
+        trie_size (int): trie에 넣을 인기 제목 수
+        top_k (int): 접두어별 보관할 최대 제안 수
+        ttl (float): trie를 다시 만드는 주기 (초)
+    """
+
+    def __init__(
+        self,
+        es: AsyncElasticsearch,
+        index_name: str = "items",
+        trie_size: int = None,
+        top_k: int = None,
+        ttl: float = None,
+    ):
+        self.es = es
+        self.index_name = index_name
+        self.trie_size = trie_size or settings.SUGGEST_TRIE_SIZE
+        self.top_k = top_k or settings.SUGGEST_TOP_K
+        self.ttl = settings.SUGGEST_TRIE_TTL if ttl is None else ttl
+        self.trie: Optional[PrefixTrie] = None
+        # 인덱스의 모든 제목이 trie에 들어갔으면 size보다 적은 결과도 trie로 응답합니다.
+        self.trie_complete = False
+        self.built_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.trie_hits = 0
+        self.es_queries = 0
+        self.errors = 0
+
+    async def refresh(self) -> PrefixTrie:
+        """
+        title.keyword terms 집계로 등록 수가 많은 상위 trie_size개 제목을 가져와 trie를 만들고 교체합니다.
+        문서를 읽지 않고 집계 요청 하나로 만들므로 비용이 인덱스 크기가 아니라 trie_size에 비례합니다.
+        """
+        started = time.perf_counter()
+        body = {
+            "size": 0,
+            "track_total_hits": 1,
+            "aggs": {"titles": {"terms": {"field": TITLE_KEYWORD_FIELD, "size": self.trie_size}}},
+        }
+        response = await self.es.search(index=self.index_name, body=body)
+        titles = response["aggregations"]["titles"]
+        if not titles["buckets"] and response["hits"]["total"]["value"]:
+            logger.warning(f"'{self.index_name}'에 {TITLE_KEYWORD_FIELD} 필드가 없습니다. reindex_data로 재색인해야 합니다.")
+
+        # 대소문자/공백만 다른 제목은 합치고, 가장 많이 등록된 표기로 보여 줍니다. (버킷은 등록 수 순서)
+        counts: Counter = Counter()
+        display: Dict[str, str] = {}
+        for bucket in titles["buckets"]:
+            title = bucket["key"]
+            if not title.strip() or title == 'None':
+                continue
+            key = normalize_prefix(title)
+            counts[key] += bucket["doc_count"]
+            display.setdefault(key, title.strip())
+
+        trie = PrefixTrie(top_k=self.top_k, max_depth=settings.SUGGEST_TRIE_MAX_DEPTH)
+        for rank, (key, count) in enumerate(counts.most_common(self.trie_size)):
+            # 등록 수가 같으면 집계 순서(제목 순)대로 앞서도록 순위를 점수에 반영합니다.
+            score = count - rank / (self.trie_size + 1)
+            for trie_key in title_keys(display[key], settings.SUGGEST_WORD_STARTS):
+                trie.insert(trie_key, display[key], score)
+
+        # 집계에 빠진 제목이 없으면(sum_other_doc_count == 0) 인덱스의 모든 제목이 trie에 있습니다.
+        self.trie, self.trie_complete, self.built_at = trie, titles["sum_other_doc_count"] == 0, time.monotonic()
+        logger.info(f"자동완성 trie 갱신: 제목 {len(counts)}개, 노드 {trie.nodes}개, "
+                    f"{time.perf_counter() - started:.2f}초")
+        return trie
+
+    async def _refresh_in_background(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"자동완성 trie 갱신 실패: {e}")
+
+    def _schedule_refresh(self):
+        stale = self.built_at is None or time.monotonic() - self.built_at >= self.ttl
+        if stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+    async def _search(self, prefix: str, size: int) -> List[str]:
+        body = {
+            "query": {"match": {SUGGEST_FIELD: {"query": prefix, "operator": "and"}}},
+            "_source": ["title"],
+            # 같은 제목이 여러 번 나올 수 있으므로 넉넉히 가져와 중복을 제거합니다.
+            "size": size * 3,
+            "track_total_hits": False,
+        }
+        response = await self.es.search(index=self.index_name, body=body)
+        suggestions, seen = [], set()
+        for hit in response["hits"]["hits"]:
+            title = (hit.get("_source") or {}).get("title")
+            key = normalize_prefix(title) if title else None
+            if key and key not in seen:
+                seen.add(key)
+                suggestions.append(title.strip())
+            if len(suggestions) >= size:
+                break
+        return suggestions
+
+    async def suggest(self, prefix: str, size: int = 10) -> Dict[str, Any]:
+        """
+        접두어로 시작하는 단어가 있는 상품 제목을 제안합니다.
+
+        Args:
+            prefix (str): 사용자가 입력 중인 검색어
+            size (int): 최대 제안 수 (top_k 이하)
+
+        Returns:
+            Dict[str, Any]: 검색어, 제안 목록, 응답 출처(trie, trie+es 또는 es)
+        """
+        self._schedule_refresh()
+        normalized = normalize_prefix(prefix)
+        size = min(size, self.top_k)
+
+        trie = self.trie
+        cached = trie.find(normalized) if trie is not None else None
+        if cached is not None and (len(cached) >= size or self.trie_complete):
+            self.trie_hits += 1
+            return {"query": prefix, "suggestions": cached[:size], "source": "trie"}
+
+        self.es_queries += 1
+        found = await self._search(prefix, size)
+        if not cached:
+            return {"query": prefix, "suggestions": found, "source": "es"}
+
+        # trie에서 찾은 인기 제목을 앞에 두고 모자란 만큼 Elasticsearch 결과로 채웁니다.
+        suggestions, seen = list(cached), {normalize_prefix(title) for title in cached}
+        for title in found:
+            if len(suggestions) >= size:
+                break
+            if normalize_prefix(title) not in seen:
+                seen.add(normalize_prefix(title))
+                suggestions.append(title)
+        return {"query": prefix, "suggestions": suggestions[:size], "source": "trie+es"}
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.trie_hits + self.es_queries
+        return {
+            "trie_hits": self.trie_hits,
+            "es_queries": self.es_queries,
+            "trie_hit_ratio": round(self.trie_hits / total, 3) if total else None,
+            "trie_nodes": self.trie.nodes if self.trie else 0,
+            "trie_age": round(time.monotonic() - self.built_at, 1) if self.built_at else None,
+            "errors": self.errors,
+        }
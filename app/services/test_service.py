@@ -1,17 +1,20 @@
+from typing import Optional
 from sqlalchemy.orm import Session
-from app import models
+from app.models import user  # noqa: F401 (relationship 대상 모델을 매퍼에 등록)
+from app.models.item import Item
 from app.schemas import schemas
+from app.services.item_service import items_query
 
 class TestService:
     def __init__(self, db: Session):
         self.db = db
 
     def create_item(self, item_in: schemas.ItemCreate, user_id: int):
-        item = models.Item(**item_in.dict(), owner_id=user_id)
+        item = Item(**item_in.dict(), owner_id=user_id)
         self.db.add(item)
         self.db.commit()
         self.db.refresh(item)
         return item
 
-    def get_items(self, skip: int = 0, limit: int = 10):
-        return self.db.query(models.Item).offset(skip).limit(limit).all()
\ No newline at end of file
+    def get_items(self, skip: int = 0, limit: int = 10, cursor: Optional[str] = None):
+        return self.db.execute(items_query(skip=skip, limit=limit, cursor=cursor)).scalars().all()
\ No newline at end of file
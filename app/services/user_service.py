@@ -1,15 +1,18 @@
-from sqlalchemy.orm import Session
-from app import models
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import item  # noqa: F401 (relationship 대상 모델을 매퍼에 등록)
+from app.models.user import User
 from app.schemas import schemas
-from app.core.security import get_password_hash
+from app.services.password_hasher import password_hasher
 
-def create_user(db: Session, user_in: schemas.UserCreate):
-    hashed_password = get_password_hash(user_in.password)
-    user = models.User(email=user_in.email, hashed_password=hashed_password)
+async def create_user(db: AsyncSession, user_in: schemas.UserCreate) -> User:
+    # bcrypt 해시는 이벤트 루프를 막지 않도록 프로세스 풀에서 실행합니다.
+    hashed_password = await password_hasher.hash(user_in.password)
+    user = User(email=user_in.email, hashed_password=hashed_password)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
-def get_user(db: Session, user_id: int):
-    return db.query(models.User).filter(models.User.id == user_id).first()
+async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    return await db.get(User, user_id)
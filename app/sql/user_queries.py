@@ -18,4 +18,11 @@ DELETE FROM users
 WHERE id = $1
 """
 
+# 커넥션마다 미리 prepare 할 쿼리 (app/db/database.py의 init 훅에서 사용)
+PREPARED_QUERIES = [
+    GET_USER_BY_USERNAME,
+    CREATE_USER,
+    DELETE_USER,
+]
+
 # 필요한 추가 쿼리들을 여기에 추가하세요.
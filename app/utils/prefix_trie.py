@@ -0,0 +1,73 @@
+# utils/prefix_trie.py
+
+from typing import Dict, List, Optional, Tuple
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[Tuple[float, str]] = []  # 점수 내림차순 (score, value)
+
+class PrefixTrie:
+    """
+    접두어별 상위 top_k개 값을 노드에 미리 저장해 두는 trie입니다.
+    조회는 접두어 길이만큼만 내려가면 되므로 값의 개수와 관계없이 O(len(prefix))입니다.
+    메모리를 제한하기 위해 키는 앞쪽 max_depth 글자까지만 노드로 만듭니다.
+
+    조회 중에 수정하지 않는 용도로 만들었습니다. 내용을 바꿀 때는 새 trie를 만들어 참조를 교체하세요.
+
+    Args:
+        top_k (int): 노드마다 보관할 최대 값 수
+        max_depth (int): 노드를 만들 최대 접두어 길이
+    """
+
+    def __init__(self, top_k: int = 10, max_depth: int = 12):
+        self.top_k = top_k
+        self.max_depth = max_depth
+        self._root = _Node()
+        self.nodes = 1
+        self.size = 0
+
+    def insert(self, key: str, value: str, score: float):
+        """key의 각 접두어 노드에 (score, value)를 기록합니다. 같은 값이 이미 있으면 더 높은 점수만 남깁니다."""
+        node = self._root
+        for char in key[:self.max_depth]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+                self.nodes += 1
+            node = child
+            self._offer(node, value, score)
+        self.size += 1
+
+    def _offer(self, node: _Node, value: str, score: float):
+        top = node.top
+        for i, (existing_score, existing) in enumerate(top):
+            if existing == value:
+                if score <= existing_score:
+                    return
+                del top[i]
+                break
+        if len(top) >= self.top_k and score <= top[-1][0]:
+            return
+        # top_k가 작으므로 삽입 정렬로 충분합니다.
+        i = len(top)
+        while i > 0 and top[i - 1][0] < score:
+            i -= 1
+        top.insert(i, (score, value))
+        del top[self.top_k:]
+
+    def find(self, prefix: str) -> Optional[List[str]]:
+        """
+        접두어의 상위 값 목록을 점수 순서대로 반환합니다.
+        max_depth보다 긴 접두어나 trie에 없는 접두어는 None을 반환합니다. (trie만으로는 답할 수 없음)
+        """
+        if not prefix or len(prefix) > self.max_depth:
+            return None
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return [value for _, value in node.top]
@@ -1,10 +1,14 @@
 # utils/security.py
+import hashlib
+import time
 import bcrypt
 import jwt
 from datetime import datetime, timedelta
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from typing import Optional
+from app.core.config import settings
+from app.utils.ttl_cache import TTLCache, MISSING
 
 SECRET_KEY = "your-secret-key"  # Replace with a secure key in production
 ALGORITHM = "HS256"
@@ -12,6 +16,9 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
+# 검증을 통과한 토큰의 subject 캐시 (키: 토큰의 SHA-256, 토큰 원문은 메모리에 남기지 않습니다)
+token_cache = TTLCache(max_entries=settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
@@ -33,11 +40,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> Optional[str]
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    username = token_cache.get(key)
+    if username is not MISSING:
+        return username
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
+        username = payload.get("sub")
         if username is None:
             raise credentials_exception
-        return username
     except jwt.PyJWTError:
         raise credentials_exception
+    # 만료된 토큰이 캐시에서 통과하지 않도록 보관 시간은 토큰의 exp를 넘기지 않습니다.
+    ttl = min(token_cache.ttl, payload["exp"] - time.time()) if "exp" in payload else token_cache.ttl
+    if ttl > 0:
+        token_cache.set(key, username, ttl=ttl)
+    return username
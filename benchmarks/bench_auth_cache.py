@@ -0,0 +1,99 @@
+# benchmarks/bench_auth_cache.py
+
+"""
+보호된 엔드포인트(GET /auth/me)의 처리량을 토큰/사용자 캐시 유무로 비교합니다.
+
+- no cache: 요청마다 jwt.decode와 사용자 조회 쿼리를 실행 (캐시 TTL 0)
+- cache: 검증된 토큰과 사용자 레코드를 캐시
+
+--users명의 사용자가 각자 토큰 하나로 요청을 보내며, 사용자 조회는 --db-latency 지연을 두는
+메모리의 가짜 커넥션 풀로 대체합니다. 의존성만 호출하는 경우와 ASGI 앱 전체를 거치는 경우를 함께 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_auth_cache --requests 20000 --users 200
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import auth as auth_endpoints
+from app.db.database import database
+from app.services import auth
+from app.utils import security
+from app.utils.ttl_cache import TTLCache
+
+
+class FakePool:
+    def __init__(self, users, latency: float):
+        self.users = users
+        self.latency = latency
+        self.queries = 0
+
+    async def fetchrow(self, query, username):
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        return self.users.get(username)
+
+
+async def run_dependency(tokens):
+    for token in tokens:
+        await auth.get_current_user_record(await security.get_current_user(token))
+
+
+async def run_endpoint(app, tokens, concurrency: int):
+    queue = list(reversed(tokens))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            while queue:
+                response = await client.get("/auth/me", headers={"Authorization": f"Bearer {queue.pop()}"})
+                assert response.status_code == 200, response.text
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--db-latency", type=float, default=0.0005, help="사용자 조회 쿼리당 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    names = [f"user{i}" for i in range(args.users)]
+    users = {name: {"id": i, "username": name, "hashed_password": "x"} for i, name in enumerate(names)}
+    user_tokens = {name: security.create_access_token({"sub": name}) for name in names}
+    rng = random.Random(0)
+    tokens = [user_tokens[name] for name in rng.choices(names, k=args.requests)]
+
+    app = FastAPI()
+    app.include_router(auth_endpoints.router, prefix="/auth")
+
+    for name, ttl in (("no cache", 0), ("cache", None)):
+        for target, run in (
+            ("dependency", lambda: run_dependency(tokens)),
+            ("endpoint", lambda: run_endpoint(app, tokens, args.concurrency)),
+        ):
+            security.token_cache = TTLCache(max_entries=10000, ttl=security.settings.AUTH_TOKEN_CACHE_TTL if ttl is None else ttl)
+            auth.user_cache = TTLCache(max_entries=10000, ttl=security.settings.AUTH_USER_CACHE_TTL if ttl is None else ttl)
+            pool = FakePool(users, args.db_latency)
+            database.fetchrow = pool.fetchrow
+            started = time.perf_counter()
+            asyncio.run(run())
+            elapsed = time.perf_counter() - started
+            print(f"{name:<9} {target:<10} {args.requests / elapsed:9.0f} req/s  "
+                  f"jwt decodes={security.token_cache.misses:<6} db queries={pool.queries}")
+
+
+if __name__ == "__main__":
+    import logging
+    import warnings
+    logging.disable(logging.INFO)
+    warnings.filterwarnings("ignore")
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_bulk_reload.py
+
+"""
+bunjang.xlsx 전체를 다시 적재하는 시간을 측정합니다.
+기존 insert_data 방식(helpers.bulk 기본값: 500건씩 순차 요청)과 BulkIndexer(병렬 요청 + bulk-load 모드)를 비교합니다.
+
+기본값은 요청마다 지연(--latency)을 두는 StubEsCluster를 사용하므로 Elasticsearch 없이 실행됩니다.
+스텁은 refresh/replica 비용을 흉내 내지 않으므로, bulk-load 모드의 효과까지 보려면 --es-url로 실제 클러스터를 지정하세요.
+(지정한 클러스터의 --index 인덱스는 모드마다 삭제 후 다시 생성됩니다.)
+
+사용법:
+    python -m benchmarks.bench_bulk_reload --rounds 3
+    python -m benchmarks.bench_bulk_reload --es-url http://localhost:9200 --index bench_items
+"""
+
+import argparse
+import time
+
+import pandas as pd
+from elasticsearch import Elasticsearch, helpers
+
+from app.insert_main import generate_actions
+from app.services.bulk_indexer import BulkIndexer
+from benchmarks.stub_es import StubEsCluster
+
+
+def reset_index(es: Elasticsearch, index_name: str):
+    if es.indices.exists(index=index_name):
+        es.indices.delete(index=index_name)
+    es.indices.create(index=index_name, settings={"index": {"number_of_shards": 1, "number_of_replicas": 1}})
+
+
+def run_default(es: Elasticsearch, actions, index_name: str) -> int:
+    success, _ = helpers.bulk(es, actions, stats_only=True)
+    return success
+
+
+def run_tuned(es: Elasticsearch, actions, index_name: str, workers: int, chunk_size: int) -> int:
+    indexer = BulkIndexer(es, chunk_size=chunk_size, workers=workers)
+    with indexer.bulk_load_mode(index_name):
+        result = indexer.index(actions)
+    return result.succeeded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="./bunjang.xlsx")
+    parser.add_argument("--es-url", default=None, help="실제 Elasticsearch 주소 (없으면 스텁 사용)")
+    parser.add_argument("--index", default="bench_items")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁의 bulk 요청당 지연 (초)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    df = pd.read_excel(args.path)
+    actions = list(generate_actions(df, args.index))
+    print(f"documents: {len(actions)}")
+
+    modes = {
+        "helpers.bulk": lambda es: run_default(es, actions, args.index),
+        "BulkIndexer": lambda es: run_tuned(es, actions, args.index, args.workers, args.chunk_size),
+    }
+    for name, run in modes.items():
+        timings = []
+        for _ in range(args.rounds):
+            cluster = None if args.es_url else StubEsCluster(bulk_latency=args.latency).start()
+            es = Elasticsearch(args.es_url or cluster.url, request_timeout=60)
+            try:
+                reset_index(es, args.index)
+                started = time.perf_counter()
+                indexed = run(es)
+                timings.append(time.perf_counter() - started)
+                # 같은 상품 링크는 같은 _id로 저장되므로 문서 수는 행 수보다 적을 수 있습니다.
+                assert indexed == len(actions)
+            finally:
+                if cluster:
+                    cluster.stop()
+        best = min(timings)
+        print(f"{name:<13} best={best:6.2f}s  docs/s={len(actions) / best:8.0f}")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
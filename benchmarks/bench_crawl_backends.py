@@ -0,0 +1,82 @@
+# benchmarks/bench_crawl_backends.py
+
+"""
+HTTP 크롤링 백엔드의 처리량(pages/s)과 메모리 사용량을 측정합니다.
+녹화된 응답을 돌려주는 StubBunjangServer를 사용하므로 네트워크 없이 실행됩니다.
+
+--selenium 옵션을 주면 headless Chrome 하나를 띄워 브라우저 프로세스 트리의 RSS를 함께 출력합니다.
+(chromedriver와 psutil이 필요합니다.)
+
+사용법:
+    python -m benchmarks.bench_crawl_backends --categories 4 --pages 2 --latency 0.05
+"""
+
+import argparse
+import resource
+import time
+import tracemalloc
+
+from app.core.config import settings
+from app.services.crawl_fetcher import HttpFetchBackend
+from app.services.crawl_service import CrawlService
+from benchmarks.stub_bunjang import StubBunjangServer
+
+
+def browser_rss_mb() -> float:
+    """headless Chrome 하나(자식 프로세스 포함)의 RSS를 MB 단위로 측정합니다."""
+    import psutil
+
+    service = CrawlService()
+    browser = service._create_browser()
+    try:
+        browser.get("about:blank")
+        root = psutil.Process(browser.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / 1024 / 1024
+    finally:
+        browser.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--categories", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=2, help="카테고리당 페이지 수 (녹화된 페이지는 2개)")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--selenium", action="store_true", help="브라우저 1개의 메모리 사용량도 측정")
+    args = parser.parse_args()
+
+    settings.CRAWL_HOST_RATE_LIMIT = 0
+    items_options = [
+        {"category": f"카테고리{c}", "min_price": 0, "max_price": 10000000, "page_limit": args.pages}
+        for c in range(args.categories)
+    ]
+    pages = args.categories * args.pages
+
+    with StubBunjangServer(latency=args.latency) as stub:
+        service = CrawlService()
+        service.backends["http"] = HttpFetchBackend(base_url=stub.url)
+        tracemalloc.start()
+        try:
+            for workers in (1, 4, 8):
+                tracemalloc.reset_peak()
+                started = time.perf_counter()
+                service.run_scraper(items_options, num_workers=workers, backend="http")
+                elapsed = time.perf_counter() - started
+                peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+                print(f"http  workers={workers}  pages={pages:>3}  wall={elapsed:6.2f}s  "
+                      f"pages/s={pages / elapsed:7.1f}  python_peak={peak:6.2f}MB")
+        finally:
+            tracemalloc.stop()
+            service.close()
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"http  process max RSS={max_rss:.1f}MB (브라우저 없음)")
+
+    if args.selenium:
+        print(f"selenium  browser RSS={browser_rss_mb():.1f}MB per worker")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
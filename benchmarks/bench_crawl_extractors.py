@@ -0,0 +1,62 @@
+# benchmarks/bench_crawl_extractors.py
+
+"""
+저장된 검색 페이지 HTML(tests/fixtures/bunjang/search_page*.html)로 추출기별 처리량을 비교합니다.
+각 추출기의 결과가 기존 BeautifulSoup 경로와 완전히 같은지도 함께 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_crawl_extractors --rounds 20
+"""
+
+import argparse
+import glob
+import os
+import time
+
+from app.services.crawl_extractor import EXTRACTORS, BeautifulSoupExtractor
+from benchmarks.stub_bunjang import FIXTURE_DIR
+
+
+def load_pages():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "search_page*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20, help="fixture 전체를 반복 파싱할 횟수")
+    args = parser.parse_args()
+
+    pages = load_pages()
+    expected = [list(BeautifulSoupExtractor().extract(html, "프라다")) for html in pages]
+
+    baseline = None
+    for name, cls in EXTRACTORS.items():
+        try:
+            extractor = cls()
+        except RuntimeError as e:
+            print(f"{name:<11} skipped ({e})")
+            continue
+
+        identical = all(
+            list(extractor.extract(html, "프라다")) == records
+            for html, records in zip(pages, expected)
+        )
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            for html in pages:
+                for _record in extractor.extract(html, "프라다"):
+                    pass
+        elapsed = time.perf_counter() - started
+        pages_per_sec = len(pages) * args.rounds / elapsed
+        baseline = baseline or pages_per_sec
+        print(f"{name:<11} pages/s={pages_per_sec:8.1f}  speedup={pages_per_sec / baseline:5.2f}x  identical={identical}")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
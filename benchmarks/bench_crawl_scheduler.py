@@ -0,0 +1,61 @@
+# benchmarks/bench_crawl_scheduler.py
+
+"""
+CrawlScheduler의 워커 수에 따른 크롤링 소요 시간을 측정합니다.
+브라우저 대신 고정 지연 후 레코드를 돌려주는 가짜 워커를 사용하므로 네트워크 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_crawl_scheduler --categories 3 --pages 10 --latency 0.2
+"""
+
+import argparse
+import time
+
+from app.services.crawl_scheduler import CrawlScheduler, CrawlTask, HostRateLimiter
+
+
+class FakeWorker:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def fetch(self, url: str) -> str:
+        time.sleep(self.latency)
+        return url
+
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--categories", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.2, help="페이지당 가짜 로딩 시간 (초)")
+    parser.add_argument("--rate", type=float, default=0, help="호스트당 초당 최대 요청 수 (0이면 제한 없음)")
+    args = parser.parse_args()
+
+    tasks = [
+        CrawlTask(c, f"category-{c}", page, f"https://m.bunjang.co.kr/search/products?page={page}&q={c}")
+        for c in range(args.categories)
+        for page in range(1, args.pages + 1)
+    ]
+    handler = lambda worker, task: [{"url": worker.fetch(task.url)}]
+
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        scheduler = CrawlScheduler(
+            worker_factory=lambda: FakeWorker(args.latency),
+            handler=handler,
+            num_workers=workers,
+            rate_limiter=HostRateLimiter(args.rate),
+        )
+        records = scheduler.run(tasks)
+        elapsed = scheduler.stats.elapsed
+        baseline = baseline or elapsed
+        print(f"workers={workers}  pages={len(records):>3}  wall={elapsed:6.2f}s  speedup={baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_crawl_stream.py
+
+"""
+일괄 모드(run_scraper 후 save_item)와 스트리밍 모드(StreamingCrawlPipeline)를 비교합니다.
+StubBunjangServer와 지연을 흉내 낸 메모리 인덱서를 사용하므로 네트워크/Elasticsearch 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_crawl_stream --categories 20 --latency 0.05 --bulk-latency 0.05
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from app.core.config import settings
+from app.services.crawl_fetcher import HttpFetchBackend
+from app.services.crawl_pipeline import StreamingCrawlPipeline
+from app.services.crawl_service import CrawlService
+from benchmarks.stub_bunjang import StubBunjangServer
+
+
+class FakeIndexer:
+    def __init__(self, bulk_latency: float):
+        self.bulk_latency = bulk_latency
+        self.started = time.perf_counter()
+        self.first_doc_at = None
+        self.docs = 0
+
+    def __call__(self, batch):
+        time.sleep(self.bulk_latency)
+        if self.first_doc_at is None:
+            self.first_doc_at = time.perf_counter() - self.started
+        self.docs += len(batch)
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        fn()
+        return time.perf_counter() - started, tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05, help="페이지 응답 지연 (초)")
+    parser.add_argument("--bulk-latency", type=float, default=0.05, help="bulk 요청 한 번의 지연 (초)")
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    settings.CRAWL_HOST_RATE_LIMIT = 0
+    options = [
+        {"category": f"카테고리{c}", "min_price": 0, "max_price": 10000000, "page_limit": 2}
+        for c in range(args.categories)
+    ]
+
+    with StubBunjangServer(latency=args.latency, vary_by_query=True) as stub:
+        service = CrawlService()
+        service.backends["http"] = HttpFetchBackend(base_url=stub.url)
+        try:
+            batch_indexer = FakeIndexer(args.bulk_latency)
+
+            def batch_mode():
+                result = service.run_scraper(options, num_workers=args.workers, backend="http")
+                # save_item은 전체 결과를 bulk 한 번으로 저장합니다. (helpers.bulk 기본 chunk 500)
+                for i in range(0, len(result), 500):
+                    batch_indexer(result[i:i + 500])
+
+            elapsed, peak = measure(batch_mode)
+            print(f"batch   wall={elapsed:6.2f}s  first_doc={batch_indexer.first_doc_at:6.2f}s  "
+                  f"docs={batch_indexer.docs}  python_peak={peak:6.2f}MB")
+
+            stream_indexer = FakeIndexer(args.bulk_latency)
+            pipeline = StreamingCrawlPipeline(service, batch_size=args.batch_size, indexer=stream_indexer)
+            result = {}
+            elapsed, peak = measure(lambda: result.update(pipeline.run(options, num_workers=args.workers, backend="http")))
+            print(f"stream  wall={elapsed:6.2f}s  first_doc={stream_indexer.first_doc_at:6.2f}s  "
+                  f"docs={stream_indexer.docs}  python_peak={peak:6.2f}MB")
+            for name, stats in result["stages"].items():
+                print(f"  {name:<9} in={stats['in']:>5}  out={stats['out']:>5}  per_sec={stats['per_sec']}")
+        finally:
+            service.close()
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
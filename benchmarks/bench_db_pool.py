@@ -0,0 +1,113 @@
+# benchmarks/bench_db_pool.py
+
+"""
+로그인 폭주처럼 사용자 조회가 몰릴 때 asyncpg 기본 풀과 설정된 Database 풀을 비교합니다.
+
+- default: asyncpg.create_pool(dsn) (기본값: 커넥션 10개, prepared statement는 첫 실행 때 준비)
+- tuned: app.db.database.Database (Settings의 풀 크기/타임아웃, init 훅에서 쿼리 미리 준비, 획득 지표)
+
+--concurrency개의 코루틴이 --duration초 동안 GET_USER_BY_USERNAME을 반복 실행합니다.
+로컬 PostgreSQL 컨테이너가 필요하며, users 테이블이 없으면 만들고 --users명을 채웁니다.
+
+    docker run -d --name bench_pg -e POSTGRES_USER=ecommerce_user -e POSTGRES_PASSWORD=ecommerce_pass \\
+        -e POSTGRES_DB=ecommerce_db -p 5434:5432 postgres:16
+
+사용법:
+    python -m benchmarks.bench_db_pool --concurrency 200 --duration 10
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import asyncpg
+
+from app.core.config import settings
+from app.db.database import Database
+from app.sql import user_queries
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(255) UNIQUE NOT NULL,
+    hashed_password VARCHAR(255) NOT NULL
+)
+"""
+
+
+async def seed(dsn: str, users: int):
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(CREATE_TABLE)
+        await conn.executemany(
+            "INSERT INTO users (username, hashed_password) VALUES ($1, $2) ON CONFLICT (username) DO NOTHING",
+            [(f"bench_user_{i}", "x" * 60) for i in range(users)],
+        )
+    finally:
+        await conn.close()
+
+
+async def storm(fetchrow, users: int, concurrency: int, duration: float):
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    rng = random.Random(0)
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                await fetchrow(user_queries.GET_USER_BY_USERNAME, f"bench_user_{rng.randrange(users)}")
+                latencies.append(time.perf_counter() - started)
+            except (asyncio.TimeoutError, asyncpg.PostgresError):
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return sorted(latencies), errors
+
+
+def report(name: str, latencies, errors: int, duration: float):
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000 if latencies else float("nan")
+
+    print(f"{name:<8} {len(latencies) / duration:8.0f} q/s  p50={percentile(0.5):6.2f}ms  "
+          f"p99={percentile(0.99):7.2f}ms  errors={errors}")
+
+
+async def run(args):
+    await seed(args.dsn, args.users)
+
+    pool = await asyncpg.create_pool(args.dsn)
+    try:
+        latencies, errors = await storm(pool.fetchrow, args.users, args.concurrency, args.duration)
+        report("default", latencies, errors, args.duration)
+    finally:
+        await pool.close()
+
+    settings.DB_ASYNC_URL = args.dsn
+    settings.DB_POOL_MAX_SIZE = args.max_size
+    database = Database()
+    await database.connect()
+    try:
+        latencies, errors = await storm(database.fetchrow, args.users, args.concurrency, args.duration)
+        report("tuned", latencies, errors, args.duration)
+        print(f"pool stats: {database.stats()}")
+    finally:
+        await database.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=settings.DB_ASYNC_URL)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--max-size", type=int, default=settings.DB_POOL_MAX_SIZE)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
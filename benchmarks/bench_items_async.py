@@ -0,0 +1,123 @@
+# benchmarks/bench_items_async.py
+
+"""
+상품 목록 조회(GET /items)를 동기 Session(스레드풀)과 AsyncSession(이벤트 루프)으로 비교합니다.
+
+- sync: def 엔드포인트 + Session (FastAPI 스레드풀에서 실행, 동시 처리 수가 --threadpool로 제한)
+- async: 현재 items 라우터 (async def + AsyncSession)
+
+--concurrency개의 클라이언트가 --requests건을 보냅니다. 기본값은 임시 SQLite 파일(aiosqlite)이며,
+--url에 postgresql://... 을 주면 asyncpg 드라이버로 같은 비교를 합니다.
+
+사용법:
+    python -m benchmarks.bench_items_async --requests 3000 --concurrency 100 --threadpool 8
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import anyio
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.v1.endpoints import items
+from app.db.base import Base
+from app.db.session import async_database_url, async_engine_options, get_async_db
+from app.models.item import Item
+from app.models.user import User
+from app.schemas import schemas
+
+
+def build_apps(url: str):
+    sync_engine = create_engine(url, **({"connect_args": {"check_same_thread": False}} if url.startswith("sqlite") else {}))
+    Base.metadata.drop_all(sync_engine)
+    Base.metadata.create_all(sync_engine)
+    with Session(sync_engine) as db:
+        db.add(User(email="bench@example.com", hashed_password="x"))
+        db.add_all(Item(title=f"Item {i}", description="desc " * 20, owner_id=1) for i in range(1000))
+        db.commit()
+    SyncSession = sessionmaker(bind=sync_engine)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    sync_app = FastAPI()
+
+    @sync_app.get("/items/", response_model=list[schemas.Item])
+    def read_items(skip: int = 0, limit: int = 10, db: Session = Depends(get_sync_db)):
+        return db.execute(select(Item).order_by(Item.id).offset(skip).limit(limit)).scalars().all()
+
+    async_url = async_database_url(url)
+    async_engine = create_async_engine(async_url, **async_engine_options(async_url))
+    AsyncSessionLocal = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    async_app = FastAPI()
+    async_app.include_router(items.router, prefix="/items")
+    async_app.dependency_overrides[get_async_db] = get_bench_db
+    return sync_app, async_app, async_engine
+
+
+async def load(app, total: int, concurrency: int, threadpool: int):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool
+    latencies = []
+    remaining = iter(range(total))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def worker():
+            for i in remaining:
+                started = time.perf_counter()
+                response = await client.get("/items/", params={"skip": (i * 10) % 990, "limit": 10})
+                assert response.status_code == 200, response.text
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - started, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None, help="동기 드라이버 URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--threadpool", type=int, default=40, help="FastAPI 스레드풀 크기 (anyio 기본값 40)")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.url is None:
+        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        args.url = f"sqlite:///{tmp.name}"
+    sync_app, async_app, async_engine = build_apps(args.url)
+    try:
+        for name, app in (("sync", sync_app), ("async", async_app)):
+            elapsed, latencies = asyncio.run(load(app, args.requests, args.concurrency, args.threadpool))
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+            print(f"{name:<6} {args.requests / elapsed:7.0f} req/s  p50={p50:7.1f}ms  p99={p99:7.1f}ms")
+            if app is async_app:
+                asyncio.run(async_engine.dispose())
+    finally:
+        if tmp is not None:
+            os.unlink(tmp.name)
+
+
+if __name__ == "__main__":
+    import logging
+    import warnings
+    logging.disable(logging.INFO)
+    warnings.filterwarnings("ignore")
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_items_bulk.py
+
+"""
+상품 N개를 등록할 때 상품별 등록(create_item: add → commit → refresh)과
+일괄 등록(create_items_bulk: 청크당 INSERT 한 번 + 트랜잭션 하나)의 초당 처리 행 수를 비교합니다.
+
+기본값은 Alembic head를 적용한 임시 SQLite 파일(aiosqlite)이며, --url에 postgresql://... 을 주면
+asyncpg 드라이버로 같은 비교를 합니다. (PostgreSQL은 마이그레이션이 적용되어 있어야 합니다)
+
+사용법:
+    python -m benchmarks.bench_items_bulk --items 5000 --chunk-size 1000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.session import async_database_url, async_engine_options
+from app.models.item import Item
+from app.schemas import schemas
+from app.services.item_service import create_item, create_items_bulk
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+async def per_item(Session, items):
+    async with Session() as db:
+        for item_in in items:
+            await create_item(db, schemas.ItemCreate(**item_in.dict(exclude={"owner_id"})), item_in.owner_id)
+
+
+async def bulk(Session, items, chunk_size: int):
+    async with Session() as db:
+        result = await create_items_bulk(db, items, chunk_size=chunk_size)
+        assert result["failed"] == 0, result["errors"]
+
+
+async def run(url: str, args):
+    engine = create_async_engine(url, **async_engine_options(url))
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    items = [schemas.ItemBulkEntry(title=f"Item {i}", description="description " * 5) for i in range(args.items)]
+    try:
+        results = {}
+        for name, load in (("per-item", lambda: per_item(Session, items)), ("bulk", lambda: bulk(Session, items, args.chunk_size))):
+            started = time.perf_counter()
+            await load()
+            elapsed = time.perf_counter() - started
+            results[name] = args.items / elapsed
+            print(f"{name:<9} {args.items} rows in {elapsed:6.2f}s  {results[name]:9.0f} rows/s")
+        async with Session() as db:
+            total = (await db.execute(select(func.count()).select_from(Item))).scalar()
+        assert total >= 2 * args.items, total
+        print(f"speedup: {results['bulk'] / results['per-item']:.1f}x")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None, help="동기 드라이버 URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    path = None
+    url = args.url
+    if url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+        config = Config(str(ROOT / "alembic.ini"))
+        config.set_main_option("script_location", str(ROOT / "alembic"))
+        config.set_main_option("sqlalchemy.url", url)
+        command.upgrade(config, "head")
+    try:
+        asyncio.run(run(async_database_url(url), args))
+    finally:
+        if path:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    import logging
+    import warnings
+    logging.disable(logging.INFO)
+    warnings.filterwarnings("ignore")
+    main()
@@ -0,0 +1,109 @@
+# benchmarks/bench_items_pagination.py
+
+"""
+상품 목록의 페이지 깊이별 조회 시간을 OFFSET/LIMIT과 keyset(cursor) 방식으로 비교합니다.
+
+임시 SQLite 파일에 Alembic 마이그레이션(head)을 적용하고 --rows개의 상품(판매자 --owners명)을 채운 뒤,
+item_service.get_items_page로 여러 깊이의 페이지를 --repeat번씩 조회해 중앙값을 출력합니다.
+keyset은 페이지 깊이와 무관하게 일정하고, OFFSET은 건너뛰는 행 수에 비례해 느려집니다.
+
+사용법:
+    python -m benchmarks.bench_items_pagination --rows 1000000 --limit 20
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.session import async_database_url
+from app.services.item_service import encode_item_cursor, get_items_page
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def prepare(path: str, rows: int, owners: int):
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{path}")
+    command.upgrade(config, "head")
+
+    conn = sqlite3.connect(path)
+    conn.executemany('INSERT INTO "user" (id, email, hashed_password, is_active) VALUES (?, ?, ?, 1)',
+                     ((i, f"user{i}@example.com", "x") for i in range(1, owners + 1)))
+    conn.executemany("INSERT INTO item (id, title, description, owner_id) VALUES (?, ?, ?, ?)",
+                     ((i, f"Item {i}", "description " * 5, i % owners + 1) for i in range(1, rows + 1)))
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+async def measure(Session, repeat: int, **kwargs) -> float:
+    samples = []
+    async with Session() as db:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            items, _ = await get_items_page(db, **kwargs)
+            samples.append(time.perf_counter() - started)
+            assert items, kwargs
+    return statistics.median(samples) * 1000
+
+
+async def run(path: str, args):
+    engine = create_async_engine(async_database_url(f"sqlite:///{path}"))
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        pages = [1, 10, 100, 1000, 10000, args.rows // args.limit]
+        print(f"{'page':>8} {'offset ms':>10} {'keyset ms':>10}")
+        for page in pages:
+            skip = (page - 1) * args.limit
+            offset_ms = await measure(Session, args.repeat, skip=skip, limit=args.limit)
+            cursor = encode_item_cursor(skip, "asc") if skip else None
+            keyset_ms = await measure(Session, args.repeat, cursor=cursor, limit=args.limit)
+            print(f"{page:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+
+        # 판매자 한 명의 마지막 페이지 (owner_id, id) 복합 인덱스 사용
+        per_owner = args.rows // args.owners
+        skip = per_owner - args.limit
+        last_id = skip * args.owners
+        offset_ms = await measure(Session, args.repeat, skip=skip, limit=args.limit, owner_id=1)
+        keyset_ms = await measure(Session, args.repeat, cursor=encode_item_cursor(last_id, "asc"), limit=args.limit, owner_id=1)
+        print(f"owner=1 last page ({per_owner} items)  offset={offset_ms:.2f}ms  keyset={keyset_ms:.2f}ms")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--owners", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        started = time.perf_counter()
+        prepare(path, args.rows, args.owners)
+        print(f"seeded {args.rows} items in {time.perf_counter() - started:.1f}s")
+        asyncio.run(run(path, args))
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    import logging
+    import warnings
+    logging.disable(logging.INFO)
+    warnings.filterwarnings("ignore")
+    main()
@@ -0,0 +1,128 @@
+# benchmarks/bench_login_storm.py
+
+"""
+로그인 폭주 중에 인증과 무관한 엔드포인트(/metrics)의 지연 시간이 유지되는지 측정합니다.
+
+한 워커(이벤트 루프 하나)에 auth/metrics 라우터를 올리고, /metrics를 --probe-interval마다 호출하면서
+초당 --login-rate건의 로그인을 --storm초 동안 보냅니다.
+
+- inline: async 핸들러 안에서 bcrypt를 직접 호출 (기존 방식, 해시 동안 이벤트 루프가 멈춤)
+- pool: PasswordHasher 프로세스 풀 (동시 실행 제한, 대기열이 차면 503)
+
+사용자 조회는 메모리의 가짜 커넥션 풀로 대체하므로 PostgreSQL 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_login_storm --login-rate 20 --storm 5
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import auth as auth_endpoints, metrics
+from app.db.database import database
+from app.services import auth
+from app.services.password_hasher import PasswordHasher
+from app.utils.security import hash_password, verify_password
+
+
+class FakePool:
+    def __init__(self, users):
+        self.users = users
+
+    async def fetchrow(self, query, username):
+        return self.users.get(username)
+
+
+class InlineHasher:
+    """기존 방식처럼 이벤트 루프에서 bcrypt를 바로 실행합니다."""
+
+    async def hash(self, password):
+        return hash_password(password)
+
+    async def verify(self, password, hashed_password):
+        return verify_password(password, hashed_password)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000 if values else float("nan")
+
+
+async def storm(app, args):
+    probes = {"before": [], "during": [], "after": []}
+    logins = {"ok": [], "rejected": 0}
+    phase = "before"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+
+        async def probe():
+            while phase != "done":
+                # 지연은 예정된 호출 시각부터 잽니다. (이벤트 루프가 멈춰 호출이 늦어진 시간까지 포함)
+                due = time.perf_counter() + args.probe_interval
+                await asyncio.sleep(args.probe_interval)
+                await client.get("/metrics/")
+                probes.get(phase, []).append(time.perf_counter() - due)
+
+        async def login():
+            started = time.perf_counter()
+            response = await client.post("/auth/user/login", json={"username": "kim", "password": "secret"})
+            if response.status_code == 200:
+                logins["ok"].append(time.perf_counter() - started)
+            elif response.status_code == 503:
+                logins["rejected"] += 1
+            else:
+                raise RuntimeError(f"unexpected status {response.status_code}")
+
+        prober = asyncio.create_task(probe())
+        await asyncio.sleep(1.0)
+        phase = "during"
+        tasks = []
+        for _ in range(int(args.storm * args.login_rate)):
+            tasks.append(asyncio.create_task(login()))
+            await asyncio.sleep(1 / args.login_rate)
+        await asyncio.gather(*tasks)
+        phase = "after"
+        await asyncio.sleep(1.0)
+        phase = "done"
+        await prober
+    return probes, logins
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--login-rate", type=float, default=20.0, help="초당 로그인 요청 수")
+    parser.add_argument("--storm", type=float, default=5.0, help="로그인 폭주 지속 시간 (초)")
+    parser.add_argument("--probe-interval", type=float, default=0.02)
+    args = parser.parse_args()
+
+    database.fetchrow = FakePool({"kim": {"id": 1, "username": "kim", "hashed_password": hash_password("secret")}}).fetchrow
+    app = FastAPI()
+    app.include_router(auth_endpoints.router, prefix="/auth")
+    app.include_router(metrics.router, prefix="/metrics")
+
+    pool = PasswordHasher()
+    for name, hasher in (("inline", InlineHasher()), ("pool", pool)):
+        auth.password_hasher = hasher
+        if hasher is pool:
+            # 워커 프로세스 시작 비용은 측정에서 뺍니다.
+            asyncio.run(pool.hash("warmup"))
+        probes, logins = asyncio.run(storm(app, args))
+        line = "  ".join(
+            f"{phase} p50={percentile(values, 0.5):7.1f}ms p99={percentile(values, 0.99):7.1f}ms"
+            for phase, values in probes.items()
+        )
+        print(f"{name:<7} /metrics {line}")
+        print(f"{'':<7} logins ok={len(logins['ok'])} rejected(503)={logins['rejected']} "
+              f"ok p50={percentile(logins['ok'], 0.5):7.1f}ms")
+    print(f"pool stats: {pool.stats()}")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/bench_mapping.py
+
+"""
+items 매핑 버전별 인덱스 크기와 검색 지연 시간을 bunjang.xlsx 데이터로 비교합니다.
+
+- v1: app/config/items_mapping_v1.json (standard analyzer, category text, 모든 필드 색인)
+- v2: app/config/items_mapping.json (title 2~3-gram, category keyword, 표시 전용 필드 색인/doc values 끔)
+
+매핑마다 인덱스를 만들어 적재하고 세그먼트를 하나로 합친 뒤, 저장 크기와
+검색 서비스와 같은 형태의 쿼리(제목 검색 + 가격 정렬, 카테고리 필터)의 지연 시간과 평균 결과 수를 측정합니다.
+분석기/세그먼트 크기는 스텁으로 흉내 낼 수 없으므로 실제 Elasticsearch가 필요합니다.
+
+사용법:
+    python -m benchmarks.bench_mapping --es-url http://localhost:9200 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import pandas as pd
+from elasticsearch import Elasticsearch
+
+from app.core.config import settings
+from app.insert_main import generate_actions
+from app.services.bulk_indexer import BulkIndexer
+from app.services.es_service import EsService
+
+MAPPINGS = {
+    "v1": "app/config/items_mapping_v1.json",
+    "v2": "app/config/items_mapping.json",
+}
+
+
+def sample_terms(df: pd.DataFrame, n: int, rng: random.Random):
+    """제목에서 두 글자 이상인 단어를 골라 검색어로 사용합니다."""
+    words = [w for title in df["제목"].dropna().astype(str) for w in title.split() if len(w) >= 2]
+    return rng.sample(words, min(n, len(words)))
+
+
+def title_query(term: str):
+    return {
+        "query": {"bool": {"should": {"match": {"title": {"query": term}}}, "filter": []}},
+        "sort": [{"price": {"order": "desc"}}, {"link": {"order": "asc"}}],
+        "size": 10,
+    }
+
+
+def category_query(version: str, category: str):
+    # v1은 category가 text라 match로, v2는 keyword라 캐시되는 term 필터로 찾습니다.
+    clause = {"match": {"category": category}} if version == "v1" else {"term": {"category": category}}
+    return {
+        "query": {"bool": {"filter": [clause, {"range": {"price": {"gte": 10000}}}]}},
+        "sort": [{"price": {"order": "desc"}}, {"link": {"order": "asc"}}],
+        "size": 10,
+    }
+
+
+def measure(es: Elasticsearch, index: str, bodies):
+    latencies, totals = [], []
+    for body in bodies:
+        started = time.perf_counter()
+        response = es.search(index=index, body=body, request_cache=False, track_total_hits=True)
+        latencies.append((time.perf_counter() - started) * 1000)
+        totals.append(response["hits"]["total"]["value"])
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1], statistics.mean(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="./bunjang.xlsx")
+    parser.add_argument("--es-url", default=settings.ES_HOST)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    es = Elasticsearch(args.es_url, request_timeout=120)
+    df = pd.read_excel(args.path)
+    terms = sample_terms(df, args.queries, rng)
+    categories = [rng.choice(df["category"].dropna().unique().tolist()) for _ in range(args.queries)]
+
+    for version, path in MAPPINGS.items():
+        index = f"bench_mapping_{version}"
+        if es.indices.exists(index=index):
+            es.indices.delete(index=index)
+        es.indices.create(index=index, body=EsService(client=es, mapping_path=path).load_mapping())
+        indexer = BulkIndexer(es)
+        with indexer.bulk_load_mode(index):
+            indexer.index(generate_actions(df, index))
+        es.indices.forcemerge(index=index, max_num_segments=1)
+        es.indices.refresh(index=index)
+
+        stats = es.indices.stats(index=index, metric="store,docs")["indices"][index]["primaries"]
+        size_kb = stats["store"]["size_in_bytes"] / 1024
+        # 워밍업
+        measure(es, index, [title_query(t) for t in terms[:20]])
+        t50, t95, t_hits = measure(es, index, [title_query(t) for t in terms])
+        c50, c95, c_hits = measure(es, index, [category_query(version, c) for c in categories])
+        print(f"{version}: docs={stats['docs']['count']}  store={size_kb:8.1f}KB  "
+              f"title p50={t50:5.2f}ms p95={t95:5.2f}ms hits={t_hits:7.1f}  "
+              f"category p50={c50:5.2f}ms p95={c95:5.2f}ms hits={c_hits:7.1f}")
+        es.indices.delete(index=index)
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
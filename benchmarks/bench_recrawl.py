@@ -0,0 +1,96 @@
+# benchmarks/bench_recrawl.py
+
+"""
+정상 상태 재크롤링(대부분 상품이 그대로인 경우)의 bulk 쓰기량을 측정합니다.
+fingerprint 변경 감지 없이 모든 상품을 upsert하는 경우와 새/변경 상품만 쓰는 save_item을 비교합니다.
+StubEsCluster를 사용하므로 Elasticsearch 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_recrawl --items 5000 --changed 0.05 --rounds 3
+"""
+
+import argparse
+import random
+import tempfile
+
+from elasticsearch import Elasticsearch, helpers
+
+from app.core.config import settings
+from app.services.crawl_service import CrawlService, item_document_id
+from benchmarks.stub_es import StubEsCluster
+
+
+def make_items(n: int):
+    return [
+        {
+            "category": "프라다",
+            "title": f"프라다 가방 {i}",
+            "price": 100000 + i,
+            "registration_date": "3일 전",
+            "location": "서울",
+            "link": f"https://m.bunjang.co.kr/products/{i}",
+            "src": f"https://media.bunjang.co.kr/product/{i}_1_w266.jpg",
+            "status": "판매중",
+        }
+        for i in range(n)
+    ]
+
+
+def mutate(items, ratio: float, rng: random.Random):
+    """ratio 비율의 상품에 가격 인하/판매완료/제목 변경 중 하나를 적용합니다."""
+    items = [dict(item) for item in items]
+    for item in rng.sample(items, int(len(items) * ratio)):
+        change = rng.choice(("price", "status", "title"))
+        if change == "price":
+            item["price"] = int(item["price"] * 0.9)
+        elif change == "status":
+            item["status"] = "판매완료"
+        else:
+            item["title"] += " (수정)"
+    return items
+
+
+def upsert_all(es: Elasticsearch, items, index_name: str):
+    actions = (
+        {"_op_type": "update", "_index": index_name, "_id": item_document_id(item), "doc": item, "doc_as_upsert": True}
+        for item in items
+    )
+    for _ in helpers.streaming_bulk(es, actions, raise_on_error=False):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--changed", type=float, default=0.05, help="재크롤링마다 바뀌는 상품 비율")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    settings.CRAWL_FINGERPRINT_DIR = tempfile.mkdtemp()
+
+    for mode in ("upsert_all", "fingerprint"):
+        with StubEsCluster() as cluster:
+            service = CrawlService(elasticsearch_url=cluster.url)
+            es = Elasticsearch(cluster.url)
+            items = make_items(args.items)
+            service.save_item(items, index_name="items")
+            items_written = bytes_written = 0
+            for _ in range(args.rounds):
+                items = mutate(items, args.changed, rng)
+                before_items, before_bytes = cluster.bulk_items, cluster.bulk_bytes
+                if mode == "upsert_all":
+                    upsert_all(es, items, "items")
+                else:
+                    result = service.save_item(items, index_name="items")
+                items_written += cluster.bulk_items - before_items
+                bytes_written += cluster.bulk_bytes - before_bytes
+            print(f"{mode:<11} per re-crawl: bulk_docs={items_written / args.rounds:8.0f}  "
+                  f"bulk_bytes={bytes_written / args.rounds / 1024:8.1f}KB")
+    print(f"last changelog: { {k: v for k, v in result['changelog'].items() if k != 'items'} }")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
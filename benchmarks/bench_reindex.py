@@ -0,0 +1,114 @@
+# benchmarks/bench_reindex.py
+
+"""
+전체 재적재 중 검색 품질을 측정합니다.
+기존 방식(delete_index → 인덱스 생성 → 적재)과 버전 인덱스 + 별칭 교체(EsService.reindex)를 비교하며,
+적재하는 동안 별도 스레드가 별칭(items)으로 계속 검색해 지연 시간과 실패/부분 결과 수를 기록합니다.
+
+기본값은 StubEsCluster를 사용하므로 Elasticsearch 없이 실행됩니다. 스텁은 세그먼트/캐시 비용을 흉내 내지 않으므로
+지연 시간 분포를 보려면 --es-url로 실제 클러스터를 지정하세요. (지정한 클러스터의 items* 인덱스가 삭제됩니다.)
+
+사용법:
+    python -m benchmarks.bench_reindex
+    python -m benchmarks.bench_reindex --es-url http://localhost:9200
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+import pandas as pd
+from elasticsearch import Elasticsearch
+
+from app.insert_main import generate_actions
+from app.services.bulk_indexer import BulkIndexer
+from app.services.es_service import EsService
+from benchmarks.stub_es import StubEsCluster
+
+ALIAS = "items"
+
+
+class Searcher(threading.Thread):
+    """별칭으로 계속 검색하며 지연 시간, 실패 수, 전체보다 적은 결과 수를 기록합니다."""
+
+    def __init__(self, es: Elasticsearch, expected: int):
+        super().__init__(daemon=True)
+        self.es = es
+        self.expected = expected
+        self.latencies = []
+        self.errors = 0
+        self.partial = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            started = time.perf_counter()
+            try:
+                total = self.es.search(index=ALIAS, query={"match": {"title": "가방"}}, size=10, track_total_hits=True)["hits"]["total"]["value"]
+                if total < self.expected:
+                    self.partial += 1
+            except Exception:
+                self.errors += 1
+            self.latencies.append(time.perf_counter() - started)
+            time.sleep(0.005)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def reload_in_place(es: Elasticsearch, df: pd.DataFrame, workers: int):
+    service = EsService(client=es)
+    target = service.alias_target(ALIAS) or ALIAS
+    es.indices.delete(index=target)
+    es.indices.create(index=ALIAS, body=service.load_mapping())
+    BulkIndexer(es, workers=workers).index(generate_actions(df, ALIAS))
+    es.indices.refresh(index=ALIAS)
+
+
+def reload_with_alias(es: Elasticsearch, df: pd.DataFrame, workers: int):
+    EsService(client=es).reindex(ALIAS, lambda index_name: generate_actions(df, index_name), indexer=BulkIndexer(es, workers=workers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="./bunjang.xlsx")
+    parser.add_argument("--es-url", default=None, help="실제 Elasticsearch 주소 (없으면 스텁 사용)")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁의 bulk 요청당 지연 (초)")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    df = pd.read_excel(args.path)
+    print(f"documents: {len(df)}")
+
+    for name, reload in (("delete+load", reload_in_place), ("alias swap", reload_with_alias)):
+        cluster = None if args.es_url else StubEsCluster(bulk_latency=args.latency).start()
+        es = Elasticsearch(args.es_url or cluster.url, request_timeout=60)
+        try:
+            # 서비스 중인 상태를 만든 뒤 전체 재적재
+            reload_with_alias(es, df, args.workers)
+            expected = es.count(index=ALIAS)["count"]
+            searcher = Searcher(es, expected)
+            searcher.start()
+            started = time.perf_counter()
+            reload(es, df, args.workers)
+            elapsed = time.perf_counter() - started
+            searcher.stop()
+
+            latencies = sorted(searcher.latencies)
+            p50 = statistics.median(latencies) * 1000
+            p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+            print(f"{name:<12} reload={elapsed:5.2f}s  searches={len(latencies):5d}  "
+                  f"errors={searcher.errors:4d}  partial={searcher.partial:4d}  p50={p50:6.1f}ms  p99={p99:6.1f}ms")
+        finally:
+            for index in es.indices.get_alias(index=f"{ALIAS}*"):
+                es.indices.delete(index=index)
+            if cluster:
+                cluster.stop()
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+    main()
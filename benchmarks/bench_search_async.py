@@ -0,0 +1,80 @@
+# benchmarks/bench_search_async.py
+
+"""
+동기 검색 경로(SearchService + FastAPI 스레드풀)와 비동기 검색 경로(AsyncSearchService)의
+동시 처리량과 지연 시간을 비교하는 부하 테스트입니다.
+
+사용법:
+    python -m benchmarks.bench_search_async --requests 2000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from starlette.concurrency import run_in_threadpool
+
+from app.schemas.search import SearchRequest
+from app.services.es_client import create_shared_client, create_shared_async_client
+from app.services.search_service import SearchService, AsyncSearchService
+from benchmarks.stub_es import StubEsServer
+
+
+def summarize(name: str, latencies: List[float], elapsed: float):
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{name:<6} requests={len(latencies):>5}  wall={elapsed:6.2f}s  "
+        f"rps={len(latencies) / elapsed:8.1f}  p50={p50:7.1f}ms  p99={p99:7.1f}ms  "
+        f"mean={statistics.mean(latencies) * 1000:7.1f}ms"
+    )
+
+
+async def run_sync_path(url: str, request: SearchRequest, total: int):
+    """FastAPI가 sync 엔드포인트를 실행하는 방식 그대로 run_in_threadpool로 호출합니다."""
+    service = SearchService(es=create_shared_client(url), index_name="items")
+
+    async def one() -> float:
+        started = time.perf_counter()
+        await run_in_threadpool(service.search_items, request)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(total)))
+    summarize("sync", latencies, time.perf_counter() - started)
+    service.es.close()
+
+
+async def run_async_path(url: str, request: SearchRequest, total: int):
+    service = AsyncSearchService(es=create_shared_async_client(url), index_name="items")
+
+    async def one() -> float:
+        started = time.perf_counter()
+        await service.search_items(request)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(total)))
+    summarize("async", latencies, time.perf_counter() - started)
+    await service.es.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000, help="동시에 보낼 검색 요청 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁 ES 응답 지연 (초)")
+    args = parser.parse_args()
+
+    request = SearchRequest(query="프라다", min_price=200000, max_price=5000000)
+    with StubEsServer(latency=args.latency) as stub:
+        asyncio.run(run_sync_path(stub.url, request, args.requests))
+        asyncio.run(run_async_path(stub.url, request, args.requests))
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_search_cache.py
+
+"""
+uvicorn 워커 여러 개가 각자 캐시를 가질 때(memory)와 Redis 프로토콜 서버를 공유할 때(redis)의
+검색 캐시 적중률과 Elasticsearch 호출 수를 비교합니다.
+
+요청은 인기 브랜드 검색이 대부분을 차지하도록 Zipf 분포로 생성하고 워커들에 번갈아 분배합니다.
+--redis-url을 주지 않으면 fakeredis를 공유 서버로 사용합니다.
+
+사용법:
+    python -m benchmarks.bench_search_cache --workers 4 --requests 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+from unittest.mock import MagicMock
+
+from app.schemas.search import SearchRequest
+from app.services.search_cache import SearchCache, MemorySearchCacheBackend, RedisSearchCacheBackend, SearchCacheBackend
+from app.services.search_service import SearchService
+from benchmarks.stub_es import make_hits
+
+BRANDS = ["프라다", "구찌", "샤넬", "루이비통", "크롬하츠", "버버리", "발렌시아가", "디올", "셀린느", "보테가"]
+
+
+def make_workload(total: int, distinct: int, seed: int = 42) -> List[SearchRequest]:
+    rng = random.Random(seed)
+    queries = [
+        SearchRequest(query=f"{BRANDS[i % len(BRANDS)]} {i // len(BRANDS)}".strip(), min_price=(i % 3) * 100000)
+        for i in range(distinct)
+    ]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(queries, weights=weights, k=total)
+
+
+def run(name: str, backend_factory: Callable[[], SearchCacheBackend], workers: int, workload: List[SearchRequest], ttl: float):
+    es = MagicMock()
+    es.search.return_value = {"hits": {"total": {"value": 10, "relation": "eq"}, "hits": make_hits(10)}}
+    services = [
+        SearchService(es=es, index_name="items", cache=SearchCache(backend_factory(), ttl=ttl))
+        for _ in range(workers)
+    ]
+
+    started = time.perf_counter()
+    for i, request in enumerate(workload):
+        services[i % workers].search_items(request)
+    elapsed = time.perf_counter() - started
+
+    hits = sum(s.cache.hits for s in services)
+    misses = sum(s.cache.misses for s in services)
+    print(
+        f"{name:<7} workers={workers}  requests={len(workload)}  es_calls={es.search.call_count:>6}  "
+        f"hit_rate={hits / (hits + misses):6.2%}  per_request={elapsed / len(workload) * 1e6:6.1f}us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=2000, help="서로 다른 검색 요청 수")
+    parser.add_argument("--max-entries", type=int, default=256, help="워커별 memory 캐시 크기")
+    parser.add_argument("--ttl", type=float, default=300.0)
+    parser.add_argument("--redis-url", default=None, help="실제 Redis 주소 (없으면 fakeredis 사용)")
+    args = parser.parse_args()
+
+    workload = make_workload(args.requests, args.distinct)
+
+    run("memory", lambda: MemorySearchCacheBackend(max_entries=args.max_entries), args.workers, workload, args.ttl)
+
+    if args.redis_url:
+        import redis
+        redis.Redis.from_url(args.redis_url).flushdb()
+        shared = lambda: RedisSearchCacheBackend.from_url(args.redis_url, prefix="bench")
+    else:
+        import fakeredis
+        server = fakeredis.FakeServer()
+        shared = lambda: RedisSearchCacheBackend(fakeredis.FakeRedis(server=server), prefix="bench")
+    run("redis", shared, args.workers, workload, args.ttl)
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_search_query.py
+
+"""
+검색 쿼리 형태별 Elasticsearch 처리 시간(took)과 응답 크기를 비교합니다.
+
+- legacy: 제목 match를 bool.should에 두고 가격 필터만 있는 기존 본문 (가격 범위 안의 모든 문서가 일치)
+- builder: search_query.build_query (제목 match는 must, 필터는 filter context, total 상한)
+
+넓은 가격 범위와 짧은 검색어처럼 일치 문서가 많은 쿼리에서 차이가 큽니다.
+실제 Elasticsearch의 items 별칭(또는 --index)에 데이터가 적재되어 있어야 합니다.
+
+사용법:
+    python -m benchmarks.bench_search_query --es-url http://localhost:9200 --rounds 50
+"""
+
+import argparse
+import json
+import statistics
+
+from elasticsearch import Elasticsearch
+
+from app.core.config import settings
+from app.schemas.search import SearchRequest
+from app.services.search_service import SearchService
+
+QUERIES = ["가방", "프라다", "볼캡", "크롬하츠 볼캡", "나이키 신발"]
+
+
+def legacy_body(request: SearchRequest):
+    return {
+        "query": {"bool": {"should": {"match": {"title": {"query": request.query}}}, "filter": [
+            {"range": {"price": {"gte": request.min_price, "lte": request.max_price}}}
+        ]}},
+        "sort": [{"price": {"order": "desc"}}, {"link": {"order": "asc"}}],
+        "size": request.size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--es-url", default=settings.ES_HOST)
+    parser.add_argument("--index", default="items")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    es = Elasticsearch(args.es_url)
+    service = SearchService(es=es, index_name=args.index)
+    requests = [SearchRequest(query=q, min_price=0, max_price=100_000_000, size=20) for q in QUERIES]
+
+    shapes = {
+        "legacy": legacy_body,
+        "builder": service._build_body,
+    }
+    for name, build in shapes.items():
+        took, sizes, totals = [], [], []
+        for _ in range(args.rounds):
+            for request in requests:
+                response = es.search(index=args.index, body=build(request), request_cache=False)
+                took.append(response["took"])
+                sizes.append(len(json.dumps(response.body, ensure_ascii=False).encode("utf-8")))
+                totals.append(response["hits"]["total"]["value"])
+        print(f"{name:<8} took p50={statistics.median(took):5.1f}ms  mean={statistics.mean(took):5.1f}ms  "
+              f"response={statistics.mean(sizes) / 1024:6.1f}KB  total(mean)={statistics.mean(totals):8.1f}")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_search_serialize.py
+
+"""
+검색 응답 한 건을 만드는 데 드는 CPU 시간(ES 응답 → HTTP 본문 바이트)을 비교합니다.
+
+- legacy: hit마다 SearchResponseItem(**_source)를 만들고, FastAPI가 response_model로 다시 검증한 뒤 표준 json으로 직렬화
+- lean: _source를 응답 필드만 가진 딕셔너리로 바꾸고 ORJSONResponse로 바로 직렬화 (현재 검색 라우터)
+
+ES 응답은 _source 필터링 전(fingerprint 포함 전체 문서)과 후를 각각 사용해 응답 크기도 함께 출력합니다.
+
+사용법:
+    python -m benchmarks.bench_search_serialize --size 100 --rounds 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.schemas.search import SearchRequest, SearchResponse, SearchResponseItem
+from app.services.search_service import RESPONSE_FIELDS, SearchService
+from benchmarks.stub_es import make_hits
+
+
+def es_response(size: int, filtered: bool):
+    hits = make_hits(size)
+    for hit in hits:
+        hit["_source"]["fingerprint"] = "f" * 40
+        if filtered:
+            hit["_source"] = {key: hit["_source"][key] for key in RESPONSE_FIELDS}
+    return {"took": 3, "hits": {"total": {"value": 1000, "relation": "gte"}, "hits": hits}}
+
+
+async def legacy_response(service: SearchService, request: SearchRequest, response, body, field) -> bytes:
+    result = service._build_response(request, response, body)
+    result["results"] = [SearchResponseItem(**hit["_source"]) for hit in response["hits"]["hits"]]
+    content = await serialize_response(field=field, response_content=result)
+    return JSONResponse(content).body
+
+
+async def lean_response(service: SearchService, request: SearchRequest, response, body, field) -> bytes:
+    return ORJSONResponse(service._build_response(request, response, body)).body
+
+
+async def measure(build, rounds: int, *args):
+    await build(*args)
+    started = time.process_time()
+    for _ in range(rounds):
+        payload = await build(*args)
+    return (time.process_time() - started) / rounds * 1000, len(payload)
+
+
+async def run(args):
+    service = SearchService(es=None, index_name="items")
+    request = SearchRequest(query="프라다", size=args.size)
+    body = service._build_body(request)
+    field = create_response_field(name="Response_search_items", type_=SearchResponse)
+
+    full, filtered = es_response(args.size, False), es_response(args.size, True)
+    print(f"es hits payload  full={len(json.dumps(full, ensure_ascii=False).encode()) / 1024:6.1f}KB  "
+          f"_source includes={len(json.dumps(filtered, ensure_ascii=False).encode()) / 1024:6.1f}KB")
+
+    for name, build, response in (("legacy", legacy_response, full), ("lean", lean_response, filtered)):
+        cpu_ms, size = await measure(build, args.rounds, service, request, response, body, field)
+        print(f"{name:<7} cpu/response={cpu_ms:6.3f}ms  body={size / 1024:6.1f}KB")
+
+    # 두 경로가 같은 JSON을 만드는지 확인합니다.
+    legacy = json.loads(await legacy_response(service, request, full, body, field))
+    lean = json.loads(await lean_response(service, request, filtered, body, field))
+    assert legacy == lean == jsonable_encoder(SearchResponse(**lean)), "응답 내용이 다릅니다."
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_suggest.py
+
+"""
+자동완성 엔드포인트의 키 입력 단위 지연 시간을 측정합니다.
+
+bunjang.xlsx 제목을 인기도(등록 수 순위의 Zipf 분포)에 따라 골라, 동시 사용자 --users명이
+초당 --rate 타자 속도로 앞 단어를 한 글자씩 입력하는 접두어 요청을 재생합니다.
+trie 없이 모든 접두어를 Elasticsearch로 보내는 경우와 SuggestService(trie + Elasticsearch)를 비교합니다.
+
+기본값은 검색마다 --es-latency 지연을 두는 StubEsCluster를 사용합니다.
+--es-url을 지정하면 실제 클러스터의 items 별칭(title.suggest, title.keyword 매핑 필요)을 사용합니다.
+
+사용법:
+    python -m benchmarks.bench_suggest --users 50 --rate 10 --sessions 400
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import pandas as pd
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+from app.insert_main import generate_actions
+from app.services.bulk_indexer import BulkIndexer
+from app.services.suggest_service import SuggestService, normalize_prefix
+from benchmarks.stub_es import StubEsCluster
+
+
+def make_sessions(df: pd.DataFrame, n: int, rng: random.Random):
+    """인기 제목일수록 자주 입력되도록 Zipf 가중치로 제목을 고르고, 앞 두 단어의 접두어 목록을 만듭니다."""
+    ranked = df["제목"].dropna().astype(str).map(normalize_prefix).value_counts().index.tolist()
+    weights = [1 / (rank + 1) for rank in range(len(ranked))]
+    sessions = []
+    for title in rng.choices(ranked, weights=weights, k=n):
+        typed = " ".join(title.split()[:2])
+        sessions.append([typed[:i] for i in range(1, len(typed) + 1) if not typed[:i].endswith(" ")])
+    return sessions
+
+
+async def replay(service: SuggestService, sessions, users: int, rate: float):
+    """키 입력을 재생하고 응답 출처(trie, trie+es, es)별 지연 시간 목록을 반환합니다."""
+    latencies = {}
+    queue = asyncio.Queue()
+    for session in sessions:
+        queue.put_nowait(session)
+
+    async def typist():
+        while not queue.empty():
+            for prefix in queue.get_nowait():
+                started = time.perf_counter()
+                response = await service.suggest(prefix, size=10)
+                latencies.setdefault(response["source"], []).append(time.perf_counter() - started)
+                await asyncio.sleep(1 / rate)
+
+    await asyncio.gather(*(typist() for _ in range(users)))
+    return latencies
+
+
+async def run(url: str, sessions, users: int, rate: float, use_trie: bool):
+    es = AsyncElasticsearch(url)
+    try:
+        service = SuggestService(es, index_name="items")
+        if use_trie:
+            await service.refresh()
+        else:
+            # trie를 만들지 않고 모든 접두어를 Elasticsearch로 보냅니다.
+            service.built_at = float("inf")
+        return await replay(service, sessions, users, rate), service.stats()
+    finally:
+        await es.close()
+
+
+def percentiles(latencies) -> str:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    return f"p50={p50:7.2f}ms  p99={p99:7.2f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="./bunjang.xlsx")
+    parser.add_argument("--es-url", default=None, help="실제 Elasticsearch 주소 (없으면 스텁 사용)")
+    parser.add_argument("--es-latency", type=float, default=0.005, help="스텁의 검색 요청당 지연 (초)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=10.0, help="사용자당 초당 키 입력 수")
+    parser.add_argument("--sessions", type=int, default=400)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    df = pd.read_excel(args.path)
+    sessions = make_sessions(df, args.sessions, rng)
+    print(f"sessions: {len(sessions)}  keystrokes: {sum(map(len, sessions))}")
+
+    cluster = None
+    if not args.es_url:
+        cluster = StubEsCluster().start()
+        cluster.search_latency = args.es_latency
+        # 스텁이 문서마다 match를 평가하면 그 CPU 시간이 지연을 좌우하므로 고정 지연만 흉내 냅니다.
+        cluster.match_queries = False
+        BulkIndexer(Elasticsearch(cluster.url)).index(generate_actions(df, "items"))
+    try:
+        for name, use_trie in (("es only", False), ("trie + es", True)):
+            by_source, stats = asyncio.run(run(args.es_url or cluster.url, sessions, args.users, args.rate, use_trie))
+            print(f"{name:<10} {percentiles(sum(by_source.values(), []))}  trie_hit_ratio={stats['trie_hit_ratio']}  "
+                  f"es_queries={stats['es_queries']}")
+            # 전체 지연은 Elasticsearch로 가는 키 입력 비율에 좌우되므로 출처별로도 출력합니다.
+            for source, latencies in sorted(by_source.items()):
+                print(f"  {source:<8} {percentiles(latencies)}  n={len(latencies)}")
+    finally:
+        if cluster:
+            cluster.stop()
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
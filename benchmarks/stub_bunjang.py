@@ -0,0 +1,118 @@
+# benchmarks/stub_bunjang.py
+
+"""
+녹화된 번개장터 검색 API 응답(tests/fixtures/bunjang)을 돌려주는 스텁 서버입니다.
+HttpFetchBackend를 실제 사이트 없이 테스트하고 처리량/메모리를 비교할 때 사용합니다.
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures", "bunjang")
+
+
+def load_fixtures(fixture_dir: str = FIXTURE_DIR) -> Dict[int, bytes]:
+    """find_v2_page{N}.json 파일을 페이지 번호(0부터)별 응답 본문으로 읽습니다."""
+    pages = {}
+    for name in sorted(os.listdir(fixture_dir)):
+        if name.startswith("find_v2_page") and name.endswith(".json"):
+            page = int(name[len("find_v2_page"):-len(".json")])
+            with open(os.path.join(fixture_dir, name), "rb") as f:
+                pages[page] = f.read()
+    return pages
+
+
+class StubBunjangServer:
+    """
+    백그라운드 스레드에서 동작하는 번개장터 검색 API 스텁 서버입니다.
+    녹화된 마지막 페이지보다 뒤 페이지는 마지막(빈) 페이지를 돌려줍니다.
+
+    Args:
+        latency (float): 응답 전 대기 시간 (초)
+        fail_first (int): 처음 N개 요청은 503으로 응답 (재시도 테스트용)
+        vary_by_query (bool): 검색어마다 상품 id/이미지를 다르게 만들어 카테고리 간 중복이 없도록 함 (벤치마크용)
+    """
+
+    def __init__(self, latency: float = 0.0, fail_first: int = 0, vary_by_query: bool = False, fixture_dir: str = FIXTURE_DIR):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.vary_by_query = vary_by_query
+        self.requests = 0
+        self.paths = []
+        self._pages = load_fixtures(fixture_dir)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status: int, payload: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                with stub._lock:
+                    stub.requests += 1
+                    stub.paths.append(self.path)
+                    failing = stub.requests <= stub.fail_first
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if failing:
+                    return self._reply(503, b'{"result": "fail"}')
+                if parsed.path != "/api/1/find_v2.json":
+                    return self._reply(404, b'{"result": "not found"}')
+                params = parse_qs(parsed.query)
+                page = int(params.get("page", ["0"])[0])
+                body = stub._pages.get(page, stub._pages[max(stub._pages)])
+                if stub.vary_by_query:
+                    body = stub._vary(body, params.get("q", [""])[0])
+                self._reply(200, body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @staticmethod
+    def _vary(body: bytes, query: str) -> bytes:
+        tag = str(abs(hash(query)) % 10 ** 6)
+        payload = json.loads(body)
+        for product in payload["list"]:
+            product["pid"] = f"{tag}{product['pid']}"
+            product["product_image"] = product["product_image"].replace("/product/", f"/product/{tag}_")
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def start(self) -> "StubBunjangServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
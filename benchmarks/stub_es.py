@@ -0,0 +1,554 @@
+# benchmarks/stub_es.py
+
+"""
+벤치마크용 Elasticsearch 스텁 서버입니다.
+실제 클러스터 없이 클라이언트/서비스 경로의 동시성만 비교할 수 있도록
+고정 지연 후 미리 만든 검색 응답을 돌려줍니다.
+"""
+
+import fnmatch
+import functools
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+
+@functools.lru_cache(maxsize=65536)
+def words_of(text: str) -> tuple:
+    """edge n-gram 검색을 흉내 내기 위해 소문자 단어 목록으로 나눕니다."""
+    return tuple(re.findall(r"\w+", text.lower()))
+
+
+def make_hits(size: int) -> List[Dict]:
+    """SearchResponseItem 형태의 _source를 가진 검색 결과를 생성합니다."""
+    return [
+        {
+            "_id": str(i),
+            "_source": {
+                "category": "프라다",
+                "title": f"프라다 리나일론 백 {i}",
+                "price": 250000 + i,
+                "registration_date": "3일 전",
+                "location": "서울특별시 강남구",
+                "link": f"https://m.bunjang.co.kr/products/{i}",
+                "src": f"https://media.bunjang.co.kr/product/{i}_1_w266.jpg",
+                "status": "판매중",
+            },
+            "sort": [250000 + i, f"https://m.bunjang.co.kr/products/{i}"],
+        }
+        for i in range(size)
+    ]
+
+
+class StubEsServer:
+    """
+    백그라운드 스레드에서 동작하는 Elasticsearch 스텁 서버입니다.
+
+    Args:
+        latency (float): `_search` 응답 전 대기 시간 (초)
+        hits (int): 검색 응답에 포함할 문서 수
+    """
+
+    def __init__(self, latency: float = 0.02, hits: int = 10):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        body = {
+            "took": int(latency * 1000),
+            "timed_out": False,
+            "hits": {"total": {"value": hits, "relation": "eq"}, "hits": make_hits(hits)},
+        }
+        self._search_body = json.dumps(body).encode("utf-8")
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, payload: bytes):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("X-Elastic-Product", "Elasticsearch")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_HEAD(self):
+                self._reply(b"")
+
+            def do_GET(self):
+                self._reply(b'{"version": {"number": "8.15.0"}, "tagline": "You Know, for Search"}')
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                with stub._lock:
+                    stub.requests += 1
+                time.sleep(stub.latency)
+                self._reply(stub._search_body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubEsServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class StubEsCluster:
+    """
+    인덱스/문서를 메모리에 저장하는 Elasticsearch 스텁 서버입니다.
+    인덱스 생성/삭제/존재 확인, `_bulk`(index/create/update/delete), 문서 조회, `_count`를 지원합니다.
+    update는 doc 병합 결과가 기존 문서와 같으면 실제 클러스터처럼 noop으로 응답합니다.
+    `_settings` 조회/변경은 인덱스별로 기록하며(settings_history), bulk 거절(429)을 흉내 낼 수 있습니다.
+    별칭(`_aliases`, `_alias`)은 인덱스 하나를 가리키며, 요청 경로와 bulk의 _index에서 실제 인덱스로 바뀝니다.
+    `_search`는 최상위 match 질의만 (단어 접두어 일치로) 해석하고 그 밖의 질의는 무시한 채 앞쪽 문서를 돌려주며,
+    (match_queries를 끄면 고정 지연만 흉내 내도록 match도 무시합니다)
+    scroll로 전체 문서를 읽을 수 있습니다. 최상위 terms 집계는 문서 전체에 대해 계산합니다.
+    `index.blocks.write`가 설정된 인덱스의 bulk 쓰기는 문서 단위 403으로 거절하고,
+    `_reindex`는 range(gte) 질의 하나만 해석해 일치하는 문서를 복사합니다. `_mapping` 변경은 properties를 병합합니다.
+
+    Args:
+        bulk_latency (float): bulk 요청마다 추가할 지연 시간 (초)
+        reject_bulk_requests (int): 처음 N개의 bulk 요청 전체를 429로 거절
+        reject_bulk_items (int): 처음 N개의 bulk 문서를 문서 단위 429로 거절
+    """
+
+    def __init__(self, bulk_latency: float = 0.0, reject_bulk_requests: int = 0, reject_bulk_items: int = 0):
+        self.indices: Dict[str, Dict[str, Dict]] = {}
+        self.uuids: Dict[str, str] = {}
+        self.settings: Dict[str, Dict] = {}
+        self.settings_history: List[Dict] = []
+        self.mappings: Dict[str, Dict] = {}
+        self.aliases: Dict[str, str] = {}  # 별칭 → 인덱스
+        self.alias_history: List[Dict[str, str]] = []
+        self.forcemerged: List[str] = []
+        self.search_requests: List[str] = []
+        self.search_latency = 0.0
+        self.match_queries = True
+        self._scrolls: Dict[str, List[Dict]] = {}
+        self.bulk_latency = bulk_latency
+        self.reject_bulk_requests = reject_bulk_requests
+        self.reject_bulk_items = reject_bulk_items
+        self.rejected_requests = 0
+        self.rejected_items = 0
+        self.bulk_requests = 0
+        self.bulk_items = 0
+        self.bulk_bytes = 0
+        self.mget_requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _bulk(self, default_index: Optional[str], lines: List[Dict]) -> Dict:
+        items = []
+        i = 0
+        while i < len(lines):
+            action = lines[i]
+            op, meta = next(iter(action.items()))
+            index = meta.get("_index", default_index)
+            index = self.aliases.get(index, index)
+            doc_id = meta.get("_id")
+            source = None
+            if op != "delete":
+                i += 1
+                source = lines[i]
+            i += 1
+            if index not in self.indices:
+                self._create_index(index, {})
+            docs = self.indices[index]
+            result = {"_index": index, "_id": doc_id}
+            if self.rejected_items < self.reject_bulk_items:
+                self.rejected_items += 1
+                result.update(status=429, error={"type": "es_rejected_execution_exception", "reason": "rejected execution"})
+                items.append({op: result})
+                continue
+            if self.settings.get(index, {}).get("blocks.write") == "True":
+                result.update(status=403, error={"type": "cluster_block_exception",
+                                                 "reason": f"index [{index}] blocked by: [FORBIDDEN/8/index write (api)];"})
+                items.append({op: result})
+                continue
+            if op in ("index", "create"):
+                if op == "create" and doc_id in docs:
+                    result.update(status=409, error={"type": "version_conflict_engine_exception"})
+                else:
+                    doc_id = doc_id or str(len(docs) + 1)
+                    result.update(_id=doc_id, result="updated" if doc_id in docs else "created",
+                                  status=200 if doc_id in docs else 201)
+                    docs[doc_id] = source
+            elif op == "update":
+                existing = docs.get(doc_id)
+                if existing is None:
+                    if source.get("doc_as_upsert"):
+                        docs[doc_id] = dict(source["doc"])
+                        result.update(result="created", status=201)
+                    else:
+                        result.update(status=404, error={"type": "document_missing_exception"})
+                else:
+                    merged = {**existing, **source["doc"]}
+                    result.update(result="noop" if merged == existing else "updated", status=200)
+                    docs[doc_id] = merged
+            elif op == "delete":
+                found = docs.pop(doc_id, None) is not None
+                result.update(result="deleted" if found else "not_found", status=200 if found else 404)
+            items.append({op: result})
+        self.bulk_items += len(items)
+        return {"took": 1, "errors": any("error" in next(iter(item.values())) for item in items), "items": items}
+
+    def _reindex(self, request: Dict) -> Dict:
+        source = self.resolve(request["source"]["index"])
+        dest = self.resolve(request["dest"]["index"]) or request["dest"]["index"]
+        if dest not in self.indices:
+            self._create_index(dest, {})
+        ranges = request["source"].get("query", {}).get("range", {})
+        copied = 0
+        for doc_id, doc in self.indices[source].items():
+            if all(doc.get(field) is not None and doc[field] >= bounds["gte"] for field, bounds in ranges.items()):
+                self.indices[dest][doc_id] = dict(doc)
+                copied += 1
+        return {"took": 1, "timed_out": False, "total": copied, "created": copied, "updated": 0, "failures": []}
+
+    @staticmethod
+    def _field_value(doc: Dict, field: str):
+        # title.keyword 같은 서브필드는 원래 필드 값을 사용합니다.
+        return doc.get(field, doc.get(field.split(".")[0]))
+
+    def _matches(self, doc: Dict, query: Dict) -> bool:
+        if "match" not in query or not self.match_queries:
+            return True
+        field, match = next(iter(query["match"].items()))
+        text = match["query"] if isinstance(match, dict) else match
+        words = words_of(str(self._field_value(doc, field) or ""))
+        return all(any(word.startswith(token) for word in words) for token in words_of(text))
+
+    def _terms_aggs(self, docs: List[Dict], aggs: Dict) -> Dict:
+        aggregations = {}
+        for name, agg in aggs.items():
+            if "terms" not in agg:
+                continue
+            counts: Dict = {}
+            for doc in docs:
+                value = self._field_value(doc, agg["terms"]["field"])
+                if value is not None:
+                    counts[value] = counts.get(value, 0) + 1
+            ranked = sorted(counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+            size = agg["terms"].get("size", 10)
+            aggregations[name] = {
+                "doc_count_error_upper_bound": 0,
+                "sum_other_doc_count": sum(count for _, count in ranked[size:]),
+                "buckets": [{"key": key, "doc_count": count} for key, count in ranked[:size]],
+            }
+        return aggregations
+
+    def resolve(self, name: str) -> Optional[str]:
+        """별칭이면 실제 인덱스 이름을, 인덱스이면 그대로 반환합니다."""
+        return self.aliases.get(name, name if name in self.indices else None)
+
+    def _match(self, pattern: str) -> List[str]:
+        names = set()
+        for part in pattern.split(","):
+            if part in self.aliases:
+                names.add(self.aliases[part])
+            else:
+                names.update(name for name in self.indices if fnmatch.fnmatchcase(name, part))
+        return sorted(names)
+
+    def _create_index(self, index: str, request: Dict):
+        self.indices[index] = {}
+        self.uuids[index] = uuid.uuid4().hex
+        index_settings = request.get("settings", {})
+        self.settings[index] = {k: str(v) for k, v in index_settings.get("index", index_settings).items()}
+        self.mappings[index] = request.get("mappings", {})
+        for alias in request.get("aliases", {}):
+            self.aliases[alias] = index
+
+    def _update_aliases(self, actions: List[Dict]) -> Optional[Dict]:
+        # 실제 클러스터처럼 모든 동작을 검증한 뒤 한 번에 적용합니다.
+        aliases = dict(self.aliases)
+        removed = []
+        for action in actions:
+            op, args = next(iter(action.items()))
+            if op == "add":
+                if args["index"] not in self.indices:
+                    return {"error": {"type": "index_not_found_exception"}, "status": 404}
+                aliases[args["alias"]] = args["index"]
+            elif op == "remove":
+                if aliases.get(args["alias"]) != args["index"]:
+                    return {"error": {"type": "aliases_not_found_exception"}, "status": 404}
+                del aliases[args["alias"]]
+            elif op == "remove_index":
+                if args["index"] not in self.indices:
+                    return {"error": {"type": "index_not_found_exception"}, "status": 404}
+                removed.append(args["index"])
+        for index in removed:
+            self._delete_index(index)
+        self.aliases = {alias: index for alias, index in aliases.items() if index not in removed}
+        self.alias_history.append(dict(self.aliases))
+        return None
+
+    def _delete_index(self, index: str):
+        self.indices.pop(index, None)
+        self.uuids.pop(index, None)
+        self.settings.pop(index, None)
+        self.mappings.pop(index, None)
+        self.aliases = {alias: target for alias, target in self.aliases.items() if target != index}
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status: int, payload: Optional[Dict] = None):
+                body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("X-Elastic-Product", "Elasticsearch")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _not_found(self):
+                return self._reply(404, {"error": {"type": "index_not_found_exception"}, "status": 404})
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def _parts(self) -> List[str]:
+                return [p for p in urlparse(self.path).path.split("/") if p]
+
+            def do_HEAD(self):
+                parts = self._parts()
+                self._reply(200 if parts and stub.resolve(parts[0]) else 404)
+
+            def do_GET(self):
+                parts = self._parts()
+                if not parts:
+                    return self._reply(200, {"version": {"number": "8.15.0"}, "tagline": "You Know, for Search"})
+                if parts[0] == "_cluster" and parts[1:2] == ["health"]:
+                    return self._reply(200, {"status": "green", "timed_out": False})
+                if parts[0] == "_alias":
+                    # GET /_alias/{name}
+                    index = stub.aliases.get(parts[1])
+                    if index is None:
+                        return self._reply(404, {"error": "alias [%s] missing" % parts[1], "status": 404})
+                    return self._reply(200, {index: {"aliases": {parts[1]: {}}}})
+                if len(parts) == 2 and parts[1] == "_alias":
+                    # GET /{pattern}/_alias (별칭이 없는 인덱스도 포함)
+                    with stub._lock:
+                        matched = stub._match(parts[0])
+                        return self._reply(200, {
+                            index: {"aliases": {alias: {} for alias, target in stub.aliases.items() if target == index}}
+                            for index in matched
+                        })
+                index = stub.resolve(parts[0])
+                if index is None:
+                    return self._not_found()
+                docs = stub.indices[index]
+                if len(parts) == 2 and parts[1] == "_count":
+                    return self._reply(200, {"count": len(docs)})
+                if len(parts) == 2 and parts[1] == "_settings":
+                    index_settings = dict(stub.settings.get(index, {}), uuid=stub.uuids[index])
+                    return self._reply(200, {index: {"settings": {"index": index_settings}}})
+                if len(parts) == 2 and parts[1] == "_mapping":
+                    return self._reply(200, {index: {"mappings": stub.mappings.get(index, {})}})
+                if len(parts) == 3 and parts[1] == "_doc":
+                    doc = docs.get(parts[2])
+                    return self._reply(200 if doc else 404, {"_index": index, "_id": parts[2], "found": doc is not None, "_source": doc})
+                self._reply(400, {"error": "unsupported"})
+
+            def do_PUT(self):
+                parts = self._parts()
+                body = self._body()
+                if parts and parts[-1] == "_bulk":
+                    return self._do_bulk(parts, body)
+                if len(parts) == 2 and parts[1] == "_settings":
+                    return self._do_put_settings(parts[0], json.loads(body))
+                if len(parts) == 2 and parts[1] == "_mapping":
+                    index = stub.resolve(parts[0])
+                    if index is None:
+                        return self._not_found()
+                    with stub._lock:
+                        mapping = stub.mappings.setdefault(index, {})
+                        mapping.setdefault("properties", {}).update(json.loads(body).get("properties", {}))
+                    return self._reply(200, {"acknowledged": True})
+                with stub._lock:
+                    if stub.resolve(parts[0]):
+                        return self._reply(400, {"error": {"type": "resource_already_exists_exception"}, "status": 400})
+                    stub._create_index(parts[0], json.loads(body) if body else {})
+                self._reply(200, {"acknowledged": True, "shards_acknowledged": True, "index": parts[0]})
+
+            def do_POST(self):
+                parts = self._parts()
+                body = self._body()
+                if parts and parts[-1] == "_bulk":
+                    return self._do_bulk(parts, body)
+                if parts == ["_search", "scroll"]:
+                    return self._do_scroll(json.loads(body))
+                if parts == ["_reindex"]:
+                    with stub._lock:
+                        response = stub._reindex(json.loads(body))
+                    return self._reply(200, response)
+                if parts == ["_aliases"]:
+                    with stub._lock:
+                        error = stub._update_aliases(json.loads(body)["actions"])
+                    return self._reply(error["status"], error) if error else self._reply(200, {"acknowledged": True})
+                index = stub.resolve(parts[0]) if parts else None
+                if parts and parts[-1] == "_refresh":
+                    return self._reply(200, {"_shards": {"total": 1, "successful": 1, "failed": 0}})
+                if index is None:
+                    return self._not_found()
+                if len(parts) == 2 and parts[1] == "_forcemerge":
+                    with stub._lock:
+                        stub.forcemerged.append(index)
+                    return self._reply(200, {"_shards": {"total": 1, "successful": 1, "failed": 0}})
+                if len(parts) == 2 and parts[1] == "_count":
+                    return self._reply(200, {"count": len(stub.indices[index])})
+                if len(parts) == 2 and parts[1] == "_search":
+                    return self._do_search(index, json.loads(body) if body else {})
+                if len(parts) == 2 and parts[1] == "_mget":
+                    return self._do_mget(index, json.loads(body))
+                self._reply(400, {"error": "unsupported"})
+
+            def do_DELETE(self):
+                parts = self._parts()
+                if parts == ["_search", "scroll"]:
+                    self._body()
+                    return self._reply(200, {"succeeded": True, "num_freed": 1})
+                with stub._lock:
+                    found = parts[0] in stub.indices
+                    stub._delete_index(parts[0])
+                self._reply(200 if found else 404, {"acknowledged": found})
+
+            def _do_search(self, index: str, request: Dict):
+                if stub.search_latency:
+                    time.sleep(stub.search_latency)
+                size = request.get("size", 10)
+                scroll = "scroll" in urlparse(self.path).query
+                with stub._lock:
+                    stub.search_requests.append(index)
+                    docs = dict(stub.indices[index])
+                query = request.get("query", {})
+                matched = ((i, doc) for i, doc in docs.items() if stub._matches(doc, query))
+                items = list(matched) if scroll else list(itertools.islice(matched, size))
+                aggregations = stub._terms_aggs(list(docs.values()), request.get("aggs") or request.get("aggregations") or {})
+                includes = request.get("_source")
+                if isinstance(includes, list):
+                    # _source 필터링은 포함할 필드 목록 형태만 지원합니다.
+                    items = [(i, {key: doc[key] for key in includes if key in doc}) for i, doc in items]
+                all_hits = [{"_index": index, "_id": i, "_source": doc} for i, doc in items]
+                response = {"took": 1, "timed_out": False, "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+                            "hits": {"total": {"value": len(docs), "relation": "eq"}, "hits": all_hits[:size]}}
+                if aggregations:
+                    response["aggregations"] = aggregations
+                if scroll:
+                    scroll_id = uuid.uuid4().hex
+                    with stub._lock:
+                        stub._scrolls[scroll_id] = [all_hits[i:i + size] for i in range(size, len(all_hits), size)]
+                    response["_scroll_id"] = scroll_id
+                self._reply(200, response)
+
+            def _do_scroll(self, request: Dict):
+                with stub._lock:
+                    pages = stub._scrolls.get(request["scroll_id"], [])
+                    hits = pages.pop(0) if pages else []
+                self._reply(200, {"_scroll_id": request["scroll_id"], "took": 1, "timed_out": False,
+                                  "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+                                  "hits": {"hits": hits}})
+
+            def _do_mget(self, index: str, request: Dict):
+                docs = stub.indices.get(index, {})
+                with stub._lock:
+                    stub.mget_requests += 1
+                ids = request.get("ids") or [d["_id"] for d in request.get("docs", [])]
+                self._reply(200, {"docs": [
+                    {"_index": index, "_id": i, "found": True, "_source": docs[i]} if i in docs
+                    else {"_index": index, "_id": i, "found": False}
+                    for i in ids
+                ]})
+
+            def _do_put_settings(self, name: str, request: Dict):
+                index = stub.resolve(name)
+                if index is None:
+                    return self._not_found()
+                with stub._lock:
+                    current = stub.settings.setdefault(index, {})
+                    for key, value in request.get("index", request).items():
+                        # null은 설정을 지워 기본값으로 되돌립니다.
+                        if value is None:
+                            current.pop(key, None)
+                        else:
+                            current[key] = str(value)
+                    stub.settings_history.append({"index": index, **request.get("index", request)})
+                self._reply(200, {"acknowledged": True})
+
+            def _do_bulk(self, parts: List[str], body: bytes):
+                lines = [json.loads(line) for line in body.splitlines() if line.strip()]
+                if stub.bulk_latency:
+                    time.sleep(stub.bulk_latency)
+                with stub._lock:
+                    stub.bulk_requests += 1
+                    stub.bulk_bytes += len(body)
+                    rejected = stub.rejected_requests < stub.reject_bulk_requests
+                    if rejected:
+                        stub.rejected_requests += 1
+                    else:
+                        response = stub._bulk(parts[0] if len(parts) == 2 else None, lines)
+                if rejected:
+                    return self._reply(429, {"error": {"type": "es_rejected_execution_exception"}, "status": 429})
+                self._reply(200, response)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubEsCluster":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -4,14 +4,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
+from app.api.v1.endpoints.items import NEXT_CURSOR_HEADER
 from app.core.config import settings
 from app.db.init_db import init_db
-from app.db.session import engine
+from app.db.session import engine, async_engine
 from app.db.database import database
 
 from app.services.es_service import EsService
+from app.services.es_client import create_shared_client, create_shared_async_client, EsHealthProbe
 from app.services.kafka_service import KafkaService
 from app.services.crawl_service import CrawlService
+from app.services.password_hasher import password_hasher
 from app.services.service_container import service_container
 import logging
 
@@ -31,6 +34,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],    # 허용할 HTTP 메서드
     allow_headers=["*"],    # 허용할 HTTP 헤더
+    expose_headers=[NEXT_CURSOR_HEADER],  # 브라우저에서 읽을 수 있는 응답 헤더 (상품 목록 다음 페이지 cursor)
 )
 
 # 로깅 설정
@@ -40,10 +44,17 @@ logger = logging.getLogger(__name__)
 @app.on_event("startup")
 async def on_startup():
     await database.connect()
+
+    # 공유 Elasticsearch 클라이언트 생성 및 백그라운드 health probe 시작
+    service_container.es_client = create_shared_client()
+    service_container.async_es_client = create_shared_async_client()
+    service_container.es_health = EsHealthProbe(service_container.es_client)
+    await service_container.es_health.check()
+    service_container.es_health.start()
     
     # Elasticsearch 서비스 초기화 및 인덱스 생성
     try:
-        es_service = EsService()
+        es_service = EsService(client=service_container.es_client)
         es_service.create_index()
         logger.info("Elasticsearch 인덱스 생성 완료")
     except Exception as e:
@@ -66,10 +77,26 @@ async def on_startup():
         logger.error(f"Selenium 구동 실패: {e}")
 
 @app.on_event("shutdown")
-def on_shutdown():
-    if service_container.crawl_service and service_container.crawl_service.browser:
-        service_container.crawl_service.browser.quit()
-        logger.info("Selenium WebDriver 종료 완료")
+async def on_shutdown():
+    if service_container.crawl_service:
+        service_container.crawl_service.close()
+        logger.info("Selenium WebDriver 및 크롤러 커넥션 종료 완료")
+
+    if service_container.es_health:
+        await service_container.es_health.stop()
+    if service_container.es_client:
+        service_container.es_client.close()
+        logger.info("Elasticsearch 클라이언트 종료 완료")
+    if service_container.async_es_client:
+        await service_container.async_es_client.close()
+        logger.info("AsyncElasticsearch 클라이언트 종료 완료")
+
+    # 비밀번호 해시 프로세스 풀 종료
+    password_hasher.shutdown()
+
+    # DB 커넥션 풀 종료 (asyncpg 인증 풀, SQLAlchemy 비동기 엔진)
+    await database.disconnect()
+    await async_engine.dispose()
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
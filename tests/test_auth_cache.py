@@ -0,0 +1,104 @@
+# tests/test_auth_cache.py
+
+import asyncio
+import time
+import jwt
+import pytest
+from fastapi import HTTPException
+from app.db.database import database
+from app.schemas.user import UserDelete
+from app.services import auth
+from app.utils import security
+
+class FakePool:
+    def __init__(self):
+        self.users = {"kim": {"id": 1, "username": "kim", "hashed_password": "hashed"}}
+        self.queries = 0
+
+    async def fetchrow(self, query, username):
+        self.queries += 1
+        return self.users.get(username)
+
+    async def execute(self, query, user_id):
+        self.users = {name: user for name, user in self.users.items() if user["id"] != user_id}
+
+@pytest.fixture(autouse=True)
+def clean_caches(monkeypatch):
+    security.token_cache.clear()
+    auth.user_cache.clear()
+    pool = FakePool()
+    monkeypatch.setattr(database, "fetchrow", pool.fetchrow)
+    monkeypatch.setattr(database, "execute", pool.execute)
+    yield pool
+    security.token_cache.clear()
+    auth.user_cache.clear()
+
+def make_token(username: str, expires_in: float) -> str:
+    return jwt.encode({"sub": username, "exp": int(time.time() + expires_in)}, security.SECRET_KEY, algorithm=security.ALGORITHM)
+
+def test_verified_token_is_cached_until_exp(monkeypatch):
+    decodes = []
+    decode = jwt.decode
+    monkeypatch.setattr(security.jwt, "decode", lambda *args, **kwargs: decodes.append(1) or decode(*args, **kwargs))
+    token = make_token("kim", 2)
+
+    assert asyncio.run(security.get_current_user(token)) == "kim"
+    assert asyncio.run(security.get_current_user(token)) == "kim"
+
+    assert len(decodes) == 1
+    (_, expires_at), = security.token_cache._data.values()
+    assert expires_at - time.monotonic() <= 2
+    assert security.token_cache.stats()["hits"] == 1
+
+def test_invalid_and_expired_tokens_are_not_cached():
+    for token in ("not-a-token", make_token("kim", -10)):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(security.get_current_user(token))
+        assert error.value.status_code == 401
+    assert len(security.token_cache) == 0
+
+def test_user_record_is_cached_and_invalidated_on_delete(clean_caches, monkeypatch):
+    pool = clean_caches
+
+    async def verify(*args):
+        return True
+
+    monkeypatch.setattr(auth.password_hasher, "verify", verify)
+
+    async def main():
+        first = await auth.get_current_user_record("kim")
+        second = await auth.get_current_user_record("kim")
+        assert first == second == {"id": 1, "username": "kim"}
+        assert pool.queries == 1
+
+        await auth.delete_user(UserDelete(username="kim", password="pw", double_check_password="pw"))
+        # 비밀번호 검증은 캐시가 아니라 DB에서 새로 읽은 레코드로 합니다.
+        assert pool.queries == 2
+        assert "kim" not in auth.user_cache._data
+        with pytest.raises(HTTPException) as error:
+            await auth.get_current_user_record("kim")
+        assert error.value.status_code == 401
+
+    asyncio.run(main())
+
+def test_login_verifies_against_fresh_record(clean_caches, monkeypatch):
+    pool = clean_caches
+    checked = []
+
+    async def verify(password, hashed_password):
+        checked.append(hashed_password)
+        return hashed_password == "new-hash"
+
+    monkeypatch.setattr(auth.password_hasher, "verify", verify)
+
+    async def main():
+        await auth.get_current_user_record("kim")
+        # 다른 워커에서 비밀번호가 바뀌어도 로그인은 캐시된 레코드를 쓰지 않습니다.
+        pool.users["kim"] = dict(pool.users["kim"], hashed_password="new-hash")
+        return await auth.authenticate_user("kim", "pw")
+
+    user = asyncio.run(main())
+
+    assert checked == ["new-hash"]
+    assert user["username"] == "kim"
+    assert "hashed_password" not in auth.user_cache.get("kim")
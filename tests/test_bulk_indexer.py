@@ -0,0 +1,81 @@
+# tests/test_bulk_indexer.py
+
+import pytest
+from elasticsearch import Elasticsearch
+from benchmarks.stub_es import StubEsCluster
+from app.services.bulk_indexer import BulkIndexer
+
+def make_actions(n: int, index: str = "items", size: int = 10):
+    return (
+        {"_index": index, "_id": str(i), "_source": {"title": f"상품 {i}", "body": "x" * size}}
+        for i in range(n)
+    )
+
+@pytest.fixture
+def cluster():
+    with StubEsCluster() as stub:
+        yield stub
+
+def make_indexer(url: str, **kwargs) -> BulkIndexer:
+    options = dict(chunk_size=100, workers=4, initial_backoff=0.01, max_backoff=0.05)
+    options.update(kwargs)
+    return BulkIndexer(Elasticsearch(url), **options)
+
+def test_index_splits_by_count_and_indexes_all(cluster):
+    result = make_indexer(cluster.url).index(make_actions(1050))
+
+    assert (result.total, result.succeeded, result.failed) == (1050, 1050, 0)
+    assert result.results == {"created": 1050}
+    assert result.chunks == cluster.bulk_requests == 11
+    assert len(cluster.indices["items"]) == 1050
+
+def test_index_splits_by_bytes(cluster):
+    result = make_indexer(cluster.url, max_chunk_bytes=2000).index(make_actions(20, size=500))
+
+    assert result.succeeded == 20
+    assert result.chunks == cluster.bulk_requests
+    assert result.chunks >= 5
+    assert cluster.bulk_bytes / cluster.bulk_requests <= 2000
+
+def test_rejected_requests_and_items_are_retried(cluster):
+    cluster.reject_bulk_requests = 2
+    cluster.reject_bulk_items = 30
+
+    result = make_indexer(cluster.url).index(make_actions(300))
+
+    assert (result.succeeded, result.failed) == (300, 0)
+    assert result.retries == 2 * 100 + 30
+    assert len(cluster.indices["items"]) == 300
+
+def test_item_errors_are_reported_per_document(cluster):
+    actions = [{"_op_type": "update", "_index": "items", "_id": str(i), "doc": {"price": i}} for i in range(5)]
+    actions.append({"_op_type": "update", "_index": "items", "_id": "new", "doc": {"price": 1}, "doc_as_upsert": True})
+
+    result = make_indexer(cluster.url).index(actions)
+
+    assert (result.succeeded, result.failed) == (1, 5)
+    assert sorted(result.failed_ids) == ["0", "1", "2", "3", "4"]
+    assert result.errors[0]["status"] == 404
+    assert result.errors[0]["error"]["type"] == "document_missing_exception"
+
+def test_rejections_beyond_max_retries_fail(cluster):
+    cluster.reject_bulk_items = 1000
+
+    result = make_indexer(cluster.url, max_retries=2).index(make_actions(10))
+
+    assert result.failed == 10
+    assert result.errors[0]["status"] == 429
+
+def test_bulk_load_mode_restores_settings(cluster):
+    es = Elasticsearch(cluster.url)
+    es.indices.create(index="items", settings={"index": {"refresh_interval": "5s"}})
+    indexer = make_indexer(cluster.url)
+
+    with indexer.bulk_load_mode("items"):
+        assert cluster.settings["items"]["refresh_interval"] == "-1"
+        assert cluster.settings["items"]["number_of_replicas"] == "0"
+        indexer.index(make_actions(10))
+
+    # 명시적으로 설정했던 값은 되돌리고, 없던 값은 기본값(null)으로 되돌립니다.
+    assert cluster.settings["items"] == {"refresh_interval": "5s"}
+    assert cluster.settings_history[-1] == {"index": "items", "refresh_interval": "5s", "number_of_replicas": None}
@@ -0,0 +1,69 @@
+# tests/test_crawl_extractor.py
+
+import os
+import types
+import pytest
+from benchmarks.stub_bunjang import FIXTURE_DIR
+from app.services.crawl_extractor import (
+    BeautifulSoupExtractor, EXTRACTORS, LxmlExtractor, create_extractor
+)
+
+FAST_EXTRACTORS = ["lxml", "selectolax"]
+
+def load_page(page: int) -> str:
+    with open(os.path.join(FIXTURE_DIR, f"search_page{page}.html"), encoding="utf-8") as f:
+        return f.read()
+
+@pytest.fixture(params=FAST_EXTRACTORS)
+def extractor(request):
+    pytest.importorskip(request.param)
+    return EXTRACTORS[request.param]()
+
+@pytest.mark.parametrize("page", [0, 1, 2])
+def test_fast_extractor_matches_beautifulsoup(extractor, page):
+    html = load_page(page)
+    expected = list(BeautifulSoupExtractor().extract(html, "프라다"))
+    assert list(extractor.extract(html, "프라다")) == expected
+
+def test_extractors_skip_text_and_comment_children():
+    with open(os.path.join(FIXTURE_DIR, "search_card_mixed.html"), encoding="utf-8") as f:
+        html = f.read()
+
+    expected = list(BeautifulSoupExtractor().extract(html, "프라다"))
+    assert [(r["title"], r["price"], r["registration_date"], r["location"], r["status"]) for r in expected] == [
+        ("프라다 사피아노 지갑", "150,000", "3일 전", "서울특별시 강남구", "판매중"),
+        ("프라다 리에디션 나일론 백", "1,200,000", "1주 전", "None", "판매완료"),
+    ]
+    assert expected[0]["src"] == "https://media.bunjang.co.kr/product/300000001_1_1713458432_w266.jpg"
+    for name in FAST_EXTRACTORS:
+        pytest.importorskip(name)
+        assert list(EXTRACTORS[name]().extract(html, "프라다")) == expected, name
+
+def test_extract_yields_records_lazily(extractor):
+    records = extractor.extract(load_page(0), "프라다")
+    assert isinstance(records, types.GeneratorType)
+
+    first = next(records)
+    assert first["title"] == "보테가,구찌,조말론,프라다,루이비통,스톤 쇼핑백 판매"
+    assert first["price"] == "100"
+    assert first["registration_date"] == "1주 전"
+    assert first["link"].startswith("https://m.bunjang.co.kr/products/259578305?")
+    assert first["src"] == "https://media.bunjang.co.kr/product/259578305_1_1713458432_w266.jpg"
+
+def test_extract_detects_sold_out_badge(extractor):
+    statuses = [r["status"] for r in extractor.extract(load_page(0), "프라다")]
+    assert statuses.count("판매완료") == 1
+    assert statuses[5] == "판매완료"
+
+def test_extract_empty_page(extractor):
+    assert list(extractor.extract(load_page(2), "프라다")) == []
+    assert list(extractor.extract("", "프라다")) == []
+
+def test_create_extractor_falls_back_when_parser_missing(monkeypatch):
+    def missing(self):
+        raise RuntimeError("lxml 추출기를 사용하려면 lxml 패키지가 필요합니다.")
+
+    monkeypatch.setattr(LxmlExtractor, "__init__", missing)
+    assert isinstance(create_extractor("lxml"), BeautifulSoupExtractor)
+    with pytest.raises(ValueError):
+        create_extractor("html5lib")
@@ -0,0 +1,91 @@
+# tests/test_crawl_fetcher.py
+
+import json
+import os
+import pytest
+from benchmarks.stub_bunjang import FIXTURE_DIR, StubBunjangServer
+from app.core.config import settings
+from app.services.crawl_fetcher import HttpFetchBackend, relative_time
+from app.services.crawl_service import CrawlService
+
+ITEMS_OPTIONS = [{"category": "프라다", "min_price": 0, "max_price": 10000000, "page_limit": 5}]
+
+def load_fixture(page: int):
+    with open(os.path.join(FIXTURE_DIR, f"find_v2_page{page}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+@pytest.fixture
+def stub():
+    with StubBunjangServer() as server:
+        yield server
+
+@pytest.fixture
+def crawl_service(stub, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_HOST_RATE_LIMIT", 0)
+    monkeypatch.setattr(settings, "CRAWL_RETRY_BACKOFF", 0.01)
+    service = CrawlService()
+    service.backends["http"] = HttpFetchBackend(base_url=stub.url, timeout=2.0)
+    yield service
+    service.close()
+
+def test_parse_matches_crawl_item_record_format():
+    payload = load_fixture(0)
+    records = HttpFetchBackend(base_url="http://stub").parse(payload, "프라다", now=1731800000)
+    products = [p for p in payload["list"] if not p["ad"]]
+
+    assert len(records) == len(products)
+    first = records[0]
+    assert set(first) == {"category", "title", "price", "registration_date", "location", "link", "src", "status"}
+    assert first["link"] == f"https://m.bunjang.co.kr/products/{products[0]['pid']}"
+    assert first["src"].endswith("_1_1713458432_w266.jpg")
+    assert first["registration_date"] == "7일 전"
+    assert {r["status"] for r in records} == {"판매중", "판매완료"}
+    assert "지역정보 없음" in {r["location"] for r in records}
+
+def test_parse_keeps_zero_price():
+    products = [
+        {"pid": 1, "name": "나눔", "price": 0, "ad": False},
+        {"pid": 2, "name": "가격 없음", "ad": False},
+        {"pid": 3, "name": "가방", "price": "15000", "ad": False},
+    ]
+
+    records = HttpFetchBackend(base_url="http://stub").parse({"list": products}, "프라다")
+
+    assert [r["price"] for r in records] == ["0", "None", "15000"]
+
+def test_relative_time():
+    assert relative_time(1000 - 30, now=1000) == "1분 전"
+    assert relative_time(1000 - 2 * 3600, now=1000) == "2시간 전"
+    assert relative_time(1000 - 3 * 86400, now=1000) == "3일 전"
+
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_http_backend_crawls_fixture_pages_without_browser(crawl_service, stub, num_workers):
+    result = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=num_workers, backend="http")
+
+    expected = {
+        f"https://m.bunjang.co.kr/products/{p['pid']}"
+        for page in (0, 1) for p in load_fixture(page)["list"]
+        if not p["ad"] and p["status"] not in HttpFetchBackend.SOLD_STATUSES
+    }
+    assert crawl_service.browser is None
+    assert {r["link"] for r in result} == expected
+    assert all(isinstance(r["price"], int) for r in result)
+    # 빈 페이지(page=2)에서 멈추고 그 뒤 페이지는 순차 모드에서 요청하지 않습니다.
+    if num_workers == 1:
+        assert stub.requests == 3
+
+def test_http_backend_matches_between_sequential_and_parallel(crawl_service):
+    sequential = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=1, backend="http")
+    parallel = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=4, backend="http")
+    assert [r["link"] for r in sequential] == [r["link"] for r in parallel]
+
+def test_http_backend_retries_transient_errors(crawl_service, stub):
+    stub.fail_first = 2
+    result = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=2, backend="http")
+    assert result
+    assert crawl_service.last_crawl_stats["retries"] >= 2
+    assert crawl_service.last_crawl_stats["pages_failed"] == 0
+
+def test_unknown_backend_is_rejected(crawl_service):
+    with pytest.raises(ValueError):
+        crawl_service.run_scraper(ITEMS_OPTIONS, backend="curl")
@@ -0,0 +1,104 @@
+# tests/test_crawl_pipeline.py
+
+import threading
+import time
+import pytest
+from benchmarks.stub_bunjang import StubBunjangServer
+from app.core.config import settings
+from app.services.crawl_fetcher import HttpFetchBackend
+from app.services.crawl_pipeline import StreamingCrawlPipeline, parse_price, shift_registration_date
+from app.services.crawl_service import CrawlService
+
+ITEMS_OPTIONS = [{"category": "프라다", "min_price": 0, "max_price": 200000, "page_limit": 5}]
+
+class MemoryIndexer:
+    def __init__(self, stub=None, delay: float = 0.0):
+        self.batches = []
+        self.stub = stub
+        self.delay = delay
+        self.requests_at_first_batch = None
+
+    def __call__(self, batch):
+        if self.requests_at_first_batch is None and self.stub:
+            self.requests_at_first_batch = self.stub.requests
+        time.sleep(self.delay)
+        self.batches.append(batch)
+
+    @property
+    def docs(self):
+        return [doc for batch in self.batches for doc in batch]
+
+@pytest.fixture
+def stub():
+    with StubBunjangServer(latency=0.1) as server:
+        yield server
+
+@pytest.fixture
+def crawl_service(stub, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_HOST_RATE_LIMIT", 0)
+    service = CrawlService()
+    service.backends["http"] = HttpFetchBackend(base_url=stub.url, timeout=2.0)
+    yield service
+    service.close()
+
+def test_normalize_helpers():
+    assert parse_price("1,250,000") == 1250000
+    assert parse_price("연락요망") is None
+    assert shift_registration_date("2주 전") == "14일 전"
+    assert shift_registration_date("1달 전") == "30일 전"
+    assert shift_registration_date("3시간 전") == "3시간 전"
+
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_stream_matches_batch_mode(crawl_service, num_workers):
+    expected = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=1, backend="http", include_sold=True)
+
+    indexer = MemoryIndexer()
+    pipeline = StreamingCrawlPipeline(crawl_service, batch_size=10, indexer=indexer)
+    result = pipeline.run(ITEMS_OPTIONS, num_workers=num_workers, backend="http")
+
+    key = lambda r: r["src"]
+    assert sorted(indexer.docs, key=key) == sorted(expected, key=key)
+    assert result["indexed"] == len(expected)
+    assert result["status"] == "success"
+    assert all(len(batch) == 10 for batch in indexer.batches[:-1])
+    assert set(result["stages"]) == {"parse", "normalize", "dedupe", "filter", "index"}
+    assert result["stages"]["parse"]["in"] == 2  # 비어 있지 않은 페이지 수
+    assert result["stages"]["filter"]["out"] == len(expected)
+
+def test_indexing_starts_before_crawl_finishes(crawl_service, stub):
+    indexer = MemoryIndexer(stub=stub)
+    StreamingCrawlPipeline(crawl_service, batch_size=10, indexer=indexer).run(ITEMS_OPTIONS, backend="http")
+
+    # 첫 배치는 첫 페이지만 받은 상태에서 저장됩니다. (전체 요청: 상품 페이지 2개 + 빈 페이지 1개)
+    assert indexer.requests_at_first_batch == 1
+    assert stub.requests == 3
+
+def test_slow_indexer_applies_backpressure_to_crawl(crawl_service, stub):
+    options = [
+        {"category": f"카테고리{i}", "min_price": 0, "max_price": 200000, "page_limit": 2}
+        for i in range(6)
+    ]
+    release = threading.Event()
+
+    def blocking_indexer(batch):
+        release.wait(5)
+
+    pipeline = StreamingCrawlPipeline(crawl_service, batch_size=5, queue_size=1, indexer=blocking_indexer)
+    runner = threading.Thread(target=pipeline.run, args=(options,), kwargs={"backend": "http"})
+    runner.start()
+    time.sleep(1.0)
+    # 인덱싱이 막혀 있는 동안에는 큐 크기만큼만 앞서 크롤링합니다. (전체 12페이지)
+    assert stub.requests <= 4
+    release.set()
+    runner.join(10)
+    assert not runner.is_alive()
+    assert stub.requests == 12
+
+def test_index_failures_are_reported(crawl_service):
+    def failing_indexer(batch):
+        return {"status": "error", "message": "bulk 실패"}
+
+    result = StreamingCrawlPipeline(crawl_service, batch_size=20, indexer=failing_indexer).run(ITEMS_OPTIONS, backend="http")
+    assert result["status"] == "partial"
+    assert result["indexed"] == 0
+    assert result["failed_batches"] >= 1
@@ -0,0 +1,67 @@
+# tests/test_crawl_readiness.py
+
+import time
+from unittest.mock import MagicMock
+from selenium.common.exceptions import NoSuchElementException
+from app.services.crawl_readiness import (
+    FallbackReadiness, PageLoadMetrics, PollingReadiness, SelectorReadiness
+)
+from app.services.crawl_service import CrawlService
+
+class FakeBrowser:
+    """render_delay초 후에 상품 이미지가 나타나는 가짜 브라우저입니다."""
+
+    def __init__(self, render_delay: float = 0.0, has_products: bool = True):
+        self.render_delay = render_delay
+        self.has_products = has_products
+        self.page_source = "<html></html>"
+        self._loaded_at = None
+
+    def get(self, url):
+        self._loaded_at = time.monotonic()
+
+    def find_element(self, by, value):
+        if self.has_products and time.monotonic() - self._loaded_at >= self.render_delay:
+            return MagicMock()
+        raise NoSuchElementException(value)
+
+    def execute_script(self, script):
+        return "complete"
+
+def test_selector_readiness_returns_as_soon_as_products_render():
+    browser = FakeBrowser(render_delay=0.1)
+    browser.get("url")
+    started = time.monotonic()
+
+    outcome = SelectorReadiness(timeout=2, poll_frequency=0.02).wait(browser)
+
+    assert outcome == "selector"
+    assert 0.1 <= time.monotonic() - started < 0.5
+
+def test_empty_page_falls_back_to_polling_after_timeout():
+    browser = FakeBrowser(has_products=False)
+    browser.get("url")
+    strategy = FallbackReadiness(SelectorReadiness(timeout=0.1, poll_frequency=0.02), PollingReadiness(timeout=1))
+
+    assert strategy.wait(browser) == "polling"
+
+def test_fetch_page_records_load_time_metrics():
+    service = CrawlService()
+    service.readiness = SelectorReadiness(timeout=2, poll_frequency=0.02)
+
+    html = service._fetch_page(FakeBrowser(render_delay=0.05), "https://m.bunjang.co.kr/search/products?page=1&q=x")
+
+    summary = service.page_metrics.summary()
+    assert html == "<html></html>"
+    assert summary["pages"] == 1
+    assert summary["outcomes"] == {"selector": 1}
+    assert 0.05 <= summary["max"] < 1.0
+
+def test_page_load_metrics_percentiles():
+    metrics = PageLoadMetrics()
+    for ms in range(1, 101):
+        metrics.record(ms / 1000, "selector")
+    summary = metrics.summary()
+    assert summary["p50"] == 0.051
+    assert summary["p95"] == 0.096
+    assert summary["max"] == 0.1
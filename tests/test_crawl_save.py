@@ -0,0 +1,145 @@
+# tests/test_crawl_save.py
+
+import pytest
+from elasticsearch import Elasticsearch
+from benchmarks.stub_es import StubEsCluster
+from app.core.config import settings
+from app.services.bulk_indexer import BulkIndexer
+from app.services.crawl_service import CrawlService, canonical_link, item_document_id
+from app.services.item_fingerprint import FingerprintIndex
+
+def make_items(n: int, query: str = "프라다"):
+    return [
+        {
+            "category": query,
+            "title": f"프라다 가방 {i}",
+            "price": 100000 + i,
+            "registration_date": "3일 전",
+            "location": "서울",
+            "link": f"https://m.bunjang.co.kr/products/{1000 + i}?q={query}&ref=%EA%B2%80%EC%83%89%EA%B2%B0%EA%B3%BC",
+            "src": f"https://media.bunjang.co.kr/product/{1000 + i}_1_w266.jpg",
+            "status": "판매중",
+        }
+        for i in range(n)
+    ]
+
+@pytest.fixture
+def cluster():
+    with StubEsCluster() as stub:
+        yield stub
+
+@pytest.fixture
+def crawl_service(cluster, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_FINGERPRINT_DIR", str(tmp_path / "fingerprints"))
+    return CrawlService(elasticsearch_url=cluster.url)
+
+def test_document_id_ignores_query_string():
+    a = make_items(1, "프라다")[0]
+    b = make_items(1, "가방")[0]
+    assert canonical_link(a["link"]) == "https://m.bunjang.co.kr/products/1000"
+    assert item_document_id(a) == item_document_id(b)
+    assert item_document_id(a) != item_document_id(make_items(2)[1])
+
+def test_document_id_falls_back_to_src():
+    item = dict(make_items(1)[0], link="None")
+    assert item_document_id(item) == item_document_id(dict(item, title="다른 제목"))
+    assert item_document_id(item) != item_document_id(make_items(1)[0])
+
+def test_first_crawl_creates_documents_with_fingerprint(crawl_service, cluster):
+    result = crawl_service.save_item(make_items(30), index_name="items")
+
+    assert result["status"] == "success"
+    assert (result["created"], result["updated"], result["skipped"]) == (30, 0, 0)
+    assert result["changelog"]["new_listings"] == 30
+    doc = Elasticsearch(cluster.url).get(index="items", id=item_document_id(make_items(1)[0]))["_source"]
+    assert len(doc["fingerprint"]) == 64
+
+def test_recrawl_writes_only_changed_items(crawl_service, cluster):
+    crawl_service.save_item(make_items(30), index_name="items")
+    bulk_before = cluster.bulk_requests
+
+    items = make_items(30, "가방")  # 다른 검색어로 다시 크롤링 (링크의 쿼리스트링만 다름)
+    items[0]["price"] = 90000
+    items[1]["status"] = "판매완료"
+    items[2]["title"] = "프라다 가방 2 (새 제목)"
+    result = crawl_service.save_item(items, index_name="items")
+
+    assert (result["created"], result["updated"], result["skipped"]) == (0, 3, 27)
+    assert cluster.bulk_requests == bulk_before + 1
+    changelog = result["changelog"]
+    assert (changelog["price_drops"], changelog["sold_out"], changelog["other_changes"]) == (1, 1, 1)
+    assert changelog["items"]["price_drops"][0]["old_price"] == 100000
+    assert len(cluster.indices["items"]) == 30
+    es = Elasticsearch(cluster.url)
+    assert es.get(index="items", id=item_document_id(items[0]))["_source"]["price"] == 90000
+
+def test_unchanged_recrawl_sends_no_bulk_request(crawl_service, cluster):
+    items = make_items(50)
+    crawl_service.save_item(items, index_name="items")
+    bulk_before = cluster.bulk_requests
+
+    result = crawl_service.save_item(items, index_name="items")
+
+    assert result["skipped"] == 50
+    assert result["created"] + result["updated"] + result["noop"] == 0
+    assert cluster.bulk_requests == bulk_before
+
+def test_new_sold_out_items_are_not_indexed(crawl_service, cluster):
+    items = make_items(3)
+    items[0]["status"] = "판매완료"
+    result = crawl_service.save_item(items, index_name="items")
+    assert result["created"] == 2
+    assert result["skipped"] == 1
+
+def test_lost_local_index_is_warmed_from_documents(crawl_service, cluster, tmp_path, monkeypatch):
+    items = make_items(20)
+    crawl_service.save_item(items, index_name="items")
+
+    # 로컬 fingerprint 기록이 없는 새 프로세스
+    monkeypatch.setattr(settings, "CRAWL_FINGERPRINT_DIR", str(tmp_path / "other"))
+    fresh = CrawlService(elasticsearch_url=cluster.url)
+    result = fresh.save_item(items, index_name="items")
+    assert result["skipped"] == 20
+    assert cluster.mget_requests == 2  # 첫 저장 1회 + 새 프로세스 1회
+
+    # 한 번 채운 뒤에는 mget 없이 판단합니다.
+    fresh.save_item(items, index_name="items")
+    assert cluster.mget_requests == 2
+
+def test_recreated_index_resets_local_fingerprints(crawl_service, cluster):
+    items = make_items(10)
+    crawl_service.save_item(items, index_name="items")
+    Elasticsearch(cluster.url).indices.delete(index="items")
+
+    result = crawl_service.save_item(items, index_name="items")
+    assert result["created"] == 10
+
+def test_bulk_loaded_documents_without_fingerprint_are_not_new_listings(crawl_service, cluster):
+    items = make_items(5)
+    # 이전 버전 엑셀 적재처럼 fingerprint 필드 없이 저장된 문서
+    BulkIndexer(Elasticsearch(cluster.url)).index(
+        {"_index": "items", "_id": item_document_id(item), "_source": item} for item in items
+    )
+    items[0]["price"] = 90000
+
+    result = crawl_service.save_item(items, index_name="items")
+
+    changelog = result["changelog"]
+    assert (changelog["new_listings"], changelog["price_drops"], changelog["unchanged"]) == (0, 1, 4)
+    assert (result["created"], result["updated"]) == (0, 1)
+
+def test_fingerprint_index_persists_entries_and_resets_on_new_uuid(tmp_path):
+    entry = {"fingerprint": "f" * 64, "price": 100000, "status": "판매중"}
+    FingerprintIndex(str(tmp_path)).update("items", "uuid-1", {"a": entry, "b": dict(entry, price="9,000")})
+
+    index = FingerprintIndex(str(tmp_path))
+    assert index.get_many("items", "uuid-1", ["a", "b", "c"]) == {"a": entry, "b": dict(entry, price="9,000")}
+    assert index.get_many("items", "uuid-2", ["a"]) == {}
+    index.clear()
+    assert FingerprintIndex(str(tmp_path)).get_many("items", "uuid-1", ["a"]) == {}
+
+def test_unreadable_fingerprint_file_is_recreated(tmp_path):
+    (tmp_path / "items.sqlite3").write_text("not a database")
+    index = FingerprintIndex(str(tmp_path))
+    index.update("items", "uuid-1", {"a": {"fingerprint": "f", "price": 1, "status": "판매중"}})
+    assert list(index.get_many("items", "uuid-1", ["a"])) == ["a"]
@@ -0,0 +1,159 @@
+# tests/test_crawl_scheduler.py
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from app.services.crawl_scheduler import CrawlScheduler, CrawlTask, HostRateLimiter
+from app.services.crawl_service import CrawlService
+from app.core.config import settings
+
+PAGES = {"프라다": 3, "구찌": 1}  # 카테고리별 실제 존재하는 페이지 수
+
+ITEMS_OPTIONS = [
+    {"category": "프라다", "min_price": 0, "max_price": 10000000, "page_limit": 5},
+    {"category": "구찌", "min_price": 0, "max_price": 10000000, "page_limit": 5},
+]
+
+def fake_page(category: str, page: int):
+    if page > PAGES[category]:
+        return []
+    return [
+        {
+            "category": category,
+            "title": f"{category} {page}-{i}",
+            "price": f"{page * 1000 + i}",
+            "registration_date": "1주 전",
+            "location": "서울",
+            "link": f"https://m.bunjang.co.kr/products/{category}{page}{i}",
+            "src": f"https://media.bunjang.co.kr/{category}{page}{i}.jpg",
+            "status": "판매중",
+        }
+        for i in range(3)
+    ]
+
+@pytest.fixture
+def crawl_service(monkeypatch):
+    service = CrawlService()
+    service.browser = MagicMock()
+    fetched = []
+
+    def fetch_page(browser, url):
+        fetched.append(url)
+        time.sleep(0.02)
+        return url
+
+    def parse_page(html, category):
+        page = int(html.split("page=")[1].split("&")[0])
+        return fake_page(category, page)
+
+    monkeypatch.setattr(settings, "CRAWL_HOST_RATE_LIMIT", 0)
+    monkeypatch.setattr(service, "_create_browser", MagicMock)
+    monkeypatch.setattr(service, "_fetch_page", fetch_page)
+    monkeypatch.setattr(service, "_parse_page", parse_page)
+    service.fetched = fetched
+    return service
+
+def test_parallel_crawl_matches_sequential_result(crawl_service):
+    sequential = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=1)
+    sequential_fetches = len(crawl_service.fetched)
+
+    parallel = crawl_service.run_scraper(ITEMS_OPTIONS, num_workers=4)
+
+    assert parallel == sequential
+    assert len(parallel) == (3 + 1) * 3
+    assert sequential_fetches == 4 + 2  # 카테고리별 빈 페이지 1번씩
+    assert crawl_service.last_crawl_stats["pages_empty"] >= 2
+
+def test_empty_page_skips_later_pages_of_category():
+    tasks = [CrawlTask(0, "구찌", page, f"http://h/{page}") for page in range(1, 9)]
+    handled = []
+
+    def handler(worker, task):
+        handled.append(task.page)
+        return fake_page("구찌", task.page)
+
+    scheduler = CrawlScheduler(worker_factory=MagicMock, handler=handler, num_workers=1)
+    records = scheduler.run(tasks)
+
+    assert handled == [1, 2]
+    assert scheduler.stats.pages_skipped == 6
+    assert len(records) == 3
+
+def test_stream_drops_pages_fetched_after_empty_page():
+    # 2페이지가 비어 있지만 늦게 끝나고, 3~4페이지가 먼저 수집되는 경우
+    def handler(worker, task):
+        if task.page == 2:
+            time.sleep(0.05)
+            return []
+        if task.page > 2:
+            time.sleep(0.01 * (5 - task.page))
+        return fake_page("프라다", task.page)
+
+    tasks = [CrawlTask(0, "프라다", page, f"http://h/{page}") for page in range(1, 5)]
+    merged = CrawlScheduler(worker_factory=MagicMock, handler=handler, num_workers=4).run(tasks)
+
+    streamed, pages = [], []
+
+    def on_page(task, records):
+        pages.append(task.page)
+        streamed.extend(records)
+
+    CrawlScheduler(worker_factory=MagicMock, handler=handler, num_workers=4).run(tasks, on_page=on_page)
+
+    assert streamed == merged
+    assert pages == [1]
+
+def test_stream_delivers_pages_in_category_order():
+    def handler(worker, task):
+        time.sleep(0.01 * (5 - task.page))
+        return fake_page("프라다", 1)
+
+    tasks = [CrawlTask(0, "프라다", page, f"http://h/{page}") for page in range(1, 5)]
+    pages = []
+    CrawlScheduler(worker_factory=MagicMock, handler=handler, num_workers=4).run(tasks, on_page=lambda task, records: pages.append(task.page))
+
+    assert pages == [1, 2, 3, 4]
+
+def test_failed_page_is_retried_with_backoff():
+    attempts = []
+
+    def handler(worker, task):
+        attempts.append(task.page)
+        if len(attempts) < 3:
+            raise TimeoutError("timeout")
+        return fake_page("구찌", 1)
+
+    scheduler = CrawlScheduler(worker_factory=MagicMock, handler=handler, num_workers=1, max_retries=2, backoff=0.001)
+    records = scheduler.run([CrawlTask(0, "구찌", 1, "http://h/1")])
+
+    assert len(attempts) == 3
+    assert scheduler.stats.retries == 2
+    assert len(records) == 3
+
+def test_workers_are_created_per_thread_and_closed():
+    workers = []
+    lock = threading.Lock()
+
+    def factory():
+        worker = MagicMock()
+        with lock:
+            workers.append(worker)
+        return worker
+
+    def handler(worker, task):
+        time.sleep(0.01)
+        return fake_page("프라다", 1)
+
+    tasks = [CrawlTask(0, "프라다", page, f"http://h/{page}") for page in range(1, 9)]
+    CrawlScheduler(worker_factory=factory, handler=handler, num_workers=4).run(tasks)
+
+    assert 1 <= len(workers) <= 4
+    assert all(w.close.called for w in workers)
+
+def test_host_rate_limiter_spaces_requests():
+    limiter = HostRateLimiter(rate=50)
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire("https://m.bunjang.co.kr/search")
+    assert time.monotonic() - started >= 0.09
@@ -0,0 +1,102 @@
+# tests/test_database_pool.py
+
+import asyncio
+import pytest
+from app.db.database import Database, init_connection, PREPARED_QUERIES
+from app.sql import user_queries
+
+class FakeStatement:
+    def __init__(self, query):
+        self.query = query
+        self.calls = []
+
+    async def fetchrow(self, *args):
+        self.calls.append(args)
+        return {"id": 1, "username": args[0]}
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = {}
+        self.raw_queries = []
+
+    async def prepare(self, query):
+        return FakeStatement(query)
+
+    async def fetchrow(self, query, *args):
+        self.raw_queries.append(query)
+        return None
+
+class FakePool:
+    """asyncpg.Pool의 acquire/release와 크기 조회만 흉내 내는 풀입니다."""
+
+    def __init__(self, size: int):
+        self._free = asyncio.Queue()
+        for _ in range(size):
+            self._free.put_nowait(FakeConnection())
+        self.size = size
+
+    async def acquire(self, timeout=None):
+        return await asyncio.wait_for(self._free.get(), timeout)
+
+    async def release(self, conn):
+        self._free.put_nowait(conn)
+
+    def get_size(self):
+        return self.size
+
+    def get_idle_size(self):
+        return self._free.qsize()
+
+    def get_min_size(self):
+        return self.size
+
+    def get_max_size(self):
+        return self.size
+
+def test_init_hook_prepares_user_queries_and_fetchrow_uses_them():
+    async def main():
+        db = Database()
+        db.pool = FakePool(1)
+        conn = db.pool._free.get_nowait()
+        await init_connection(conn)
+        db.pool._free.put_nowait(conn)
+
+        assert set(conn.statements) == set(PREPARED_QUERIES)
+        assert user_queries.GET_USER_BY_USERNAME in conn.statements
+        row = await db.fetchrow(user_queries.GET_USER_BY_USERNAME, "kim")
+        await db.fetchrow("SELECT 1")
+        return conn, row
+
+    conn, row = asyncio.run(main())
+
+    assert row == {"id": 1, "username": "kim"}
+    assert conn.statements[user_queries.GET_USER_BY_USERNAME].calls == [("kim",)]
+    assert conn.raw_queries == ["SELECT 1"]
+
+def test_pool_gauges_track_waiters_and_acquire_latency():
+    async def main():
+        db = Database()
+        db.pool = FakePool(1)
+
+        async def hold(seconds):
+            async with db.acquire():
+                await asyncio.sleep(seconds)
+
+        holder = asyncio.create_task(hold(0.2))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(hold(0))
+        await asyncio.sleep(0.01)
+        during = db.stats()
+        with pytest.raises(asyncio.TimeoutError):
+            async with db.acquire(timeout=0.01):
+                pass
+        await asyncio.gather(holder, waiter)
+        return during, db.stats()
+
+    during, after = asyncio.run(main())
+
+    assert (during["size"], during["idle"], during["waiters"]) == (1, 0, 1)
+    assert (after["idle"], after["waiters"], after["acquired"], after["acquire_timeouts"]) == (1, 0, 2, 1)
+    histogram = after["acquire_histogram"]
+    assert sum(histogram.values()) == 2
+    assert histogram["le_1ms"] == 1 and histogram["le_250ms"] == 1
@@ -0,0 +1,58 @@
+# tests/test_es_client.py
+
+import asyncio
+import pytest
+from fastapi import HTTPException
+from unittest.mock import MagicMock
+from app.services.es_client import EsHealthProbe
+from app.services.service_container import service_container
+from app.dependencies import get_elasticsearch_client, get_search_service
+
+@pytest.fixture
+def shared_client():
+    es = MagicMock()
+    service_container.es_client = es
+    service_container.es_health = EsHealthProbe(es, interval=0.01)
+    yield es
+    service_container.es_client = None
+    service_container.es_health = None
+
+def test_health_probe_records_ping_result(shared_client):
+    shared_client.ping.return_value = True
+    assert asyncio.run(service_container.es_health.check()) is True
+    assert service_container.es_health.healthy is True
+
+    shared_client.ping.side_effect = ConnectionError("down")
+    assert asyncio.run(service_container.es_health.check()) is False
+    assert service_container.es_health.healthy is False
+
+def test_dependency_reuses_shared_client_without_ping(shared_client):
+    service_container.es_health.healthy = True
+
+    es = get_elasticsearch_client()
+    service = get_search_service(es)
+
+    assert es is shared_client
+    assert service.es is shared_client
+    shared_client.ping.assert_not_called()
+
+def test_dependency_rejects_when_probe_unhealthy(shared_client):
+    service_container.es_health.healthy = False
+
+    with pytest.raises(HTTPException) as exc:
+        get_elasticsearch_client()
+    assert exc.value.status_code == 503
+
+def test_background_probe_stops_cleanly(shared_client):
+    shared_client.ping.return_value = True
+
+    async def run():
+        probe = service_container.es_health
+        probe.start()
+        await asyncio.sleep(0.05)
+        await probe.stop()
+        return probe
+
+    probe = asyncio.run(run())
+    assert probe.healthy is True
+    assert shared_client.ping.call_count >= 1
@@ -0,0 +1,146 @@
+# tests/test_es_reindex.py
+
+import pandas as pd
+import pytest
+from elasticsearch import Elasticsearch
+from benchmarks.stub_es import StubEsCluster
+from app.core.config import settings
+from app.insert_main import generate_actions
+from app.services.bulk_indexer import BulkIndexer
+from app.services.crawl_service import CrawlService, item_document_id
+from app.services.es_service import EsService, WARM_REQUESTS, warm_queries
+from app.services.search_service import SearchService
+
+def build_actions(n: int):
+    def build(index_name: str):
+        return ({"_index": index_name, "_id": str(i), "_source": {"title": f"상품 {i}", "price": i}} for i in range(n))
+    return build
+
+@pytest.fixture
+def cluster():
+    with StubEsCluster() as stub:
+        yield stub
+
+@pytest.fixture
+def es_service(cluster):
+    return EsService(client=Elasticsearch(cluster.url))
+
+def test_create_index_bootstraps_first_version_behind_alias(es_service, cluster):
+    es_service.create_index("items")
+    es_service.create_index("items")  # 이미 있으면 건너뜀
+
+    assert list(cluster.indices) == ["items_v1"]
+    assert cluster.aliases == {"items": "items_v1"}
+    assert "title" in cluster.mappings["items_v1"]["properties"]
+
+def test_reindex_swaps_alias_and_keeps_serving_old_version(es_service, cluster):
+    es_service.create_index("items")
+    es_service.reindex("items", build_actions(50))
+    es = Elasticsearch(cluster.url)
+    counts_during_load = []
+
+    def build(index_name):
+        # 새 인덱스를 적재하는 동안 별칭으로 검색하면 이전 버전 전체가 보입니다.
+        counts_during_load.append(es.count(index="items")["count"])
+        return build_actions(80)(index_name)
+
+    result = es_service.reindex("items", build)
+
+    assert counts_during_load == [50]
+    assert (result["index"], result["previous"]) == ("items_v3", "items_v2")
+    assert result["deleted"] == ["items_v1"]
+    assert cluster.aliases == {"items": "items_v3"}
+    assert es.count(index="items")["count"] == 80
+    assert sorted(cluster.indices) == ["items_v2", "items_v3"]
+    # 적재 후 설정 복원, forcemerge, warm-up 검색까지 마친 뒤 교체합니다.
+    assert cluster.settings["items_v3"].get("refresh_interval") != "-1"
+    assert "items_v3" in cluster.forcemerged
+    assert cluster.search_requests.count("items_v3") >= 1
+
+def test_create_index_warns_when_existing_mapping_is_older(es_service, cluster, caplog):
+    Elasticsearch(cluster.url).indices.create(index="items", mappings={"_meta": {"mapping_version": 2}})
+
+    es_service.create_index("items")
+
+    assert es_service.mapping_version("items") == 2
+    assert "reindex_data" in caplog.text
+
+def test_warm_queries_match_live_search_bodies():
+    service = SearchService(es=None, index_name="items")
+    for request, body in zip(WARM_REQUESTS, warm_queries()):
+        # 검색 API가 보내는 본문과 같은 query/filter/sort를 사용해야 같은 캐시를 미리 채웁니다.
+        live = service._build_body(request)
+        assert {key: live[key] for key in body} == body
+
+def test_reindex_replaces_legacy_concrete_index(es_service, cluster):
+    Elasticsearch(cluster.url).indices.create(index="items")
+
+    result = es_service.reindex("items", build_actions(10))
+
+    assert result["previous"] is None
+    assert cluster.aliases == {"items": "items_v1"}
+    assert "items" not in cluster.indices
+
+def test_failed_load_keeps_current_alias(es_service, cluster):
+    es_service.create_index("items")
+    cluster.reject_bulk_items = 1000
+    indexer = BulkIndexer(es_service.client, max_retries=0)
+
+    with pytest.raises(RuntimeError):
+        es_service.reindex("items", build_actions(10), indexer=indexer)
+
+    assert cluster.aliases == {"items": "items_v1"}
+    assert "items_v2" not in cluster.indices
+
+def crawled_item(i: int):
+    return {"category": "가방", "title": f"크롤링 상품 {i}", "price": 1000 + i, "registration_date": "방금 전",
+            "location": "서울", "link": f"https://m.bunjang.co.kr/products/{9000 + i}",
+            "src": f"https://media.bunjang.co.kr/product/{9000 + i}_1_w266.jpg", "status": "판매중"}
+
+def test_reindex_keeps_crawler_writes_made_during_load(es_service, cluster, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_FINGERPRINT_DIR", str(tmp_path / "fingerprints"))
+    crawl_service = CrawlService(elasticsearch_url=cluster.url)
+    es_service.create_index("items")
+    es_service.reindex("items", build_actions(20))
+
+    def build(index_name):
+        # 적재하는 동안 크롤러는 별칭(이전 인덱스)에 저장합니다.
+        assert crawl_service.save_item([crawled_item(1)], index_name="items")["created"] == 1
+        return build_actions(20)(index_name)
+
+    result = es_service.reindex("items", build)
+
+    assert result["caught_up"] == 1
+    assert cluster.aliases == {"items": "items_v3"}
+    doc = Elasticsearch(cluster.url).get(index="items", id=item_document_id(crawled_item(1)))["_source"]
+    assert doc["title"] == "크롤링 상품 1"
+    # 교체가 끝나면 이전 인덱스의 쓰기 차단을 풉니다.
+    assert "blocks.write" not in cluster.settings["items_v2"]
+    assert "indexed_at" in cluster.mappings["items_v2"]["properties"]
+
+def test_writes_rejected_while_blocked_are_retried_by_next_crawl(es_service, cluster, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_FINGERPRINT_DIR", str(tmp_path / "fingerprints"))
+    crawl_service = CrawlService(elasticsearch_url=cluster.url)
+    es_service.create_index("items")
+    es_service.set_write_block("items_v1", True)
+
+    result = crawl_service.save_item([crawled_item(2)], index_name="items")
+    assert (result["created"], result["failed"]) == (0, 1)
+
+    es_service.set_write_block("items_v1", False)
+    assert crawl_service.save_item([crawled_item(2)], index_name="items")["created"] == 1
+
+def test_mapping_covers_every_written_field(es_service):
+    mapping = es_service.load_mapping()["mappings"]
+    properties = mapping["properties"]
+    assert mapping["_meta"]["mapping_version"] == 5
+    assert properties["category"]["type"] == "keyword"
+    # 정렬 tiebreaker로 쓰는 link는 색인하지 않아도 doc values가 있어야 합니다.
+    assert properties["link"]["index"] is False and properties["link"].get("doc_values", True)
+
+    # dynamic: false이므로 크롤러/엑셀 적재 문서의 필드는 모두 매핑에 있어야 색인됩니다.
+    row = {"category": "가방", "제목": "프라다 가방", "price": 1000, "등록일시": "3일 전", "위치": "서울",
+           "링크": "https://m.bunjang.co.kr/products/1", "src": "https://media.bunjang.co.kr/1.jpg", "상태": "판매중"}
+    action = next(generate_actions(pd.DataFrame([row]), "items"))
+    crawled_fields = {"category", "title", "price", "registration_date", "location", "link", "src", "status", "fingerprint", "indexed_at"}
+    assert set(action["_source"]) | crawled_fields <= set(properties)
@@ -0,0 +1,154 @@
+# tests/test_item_service.py
+
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.api.v1.endpoints import items, users
+from app.db.base import Base
+from app.db.session import async_database_url, async_engine_options, get_async_db
+from app.models import item, user  # noqa: F401
+from app.core.config import settings
+from app.services import user_service
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    url = async_database_url(f"sqlite:///{tmp_path / 'test.db'}")
+    engine = create_async_engine(url, **async_engine_options(url))
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+
+    async def get_test_db():
+        async with Session() as db:
+            yield db
+
+    async def run_inline(fn, *args):
+        return fn(*args)
+
+    monkeypatch.setattr(user_service.password_hasher, "run", run_inline)
+    app = FastAPI()
+    app.include_router(items.router, prefix="/items")
+    app.include_router(users.router, prefix="/users")
+    app.dependency_overrides[get_async_db] = get_test_db
+    yield app
+    asyncio.run(engine.dispose())
+
+def request(app, method, path, **kwargs):
+    async def send():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(send())
+
+def test_async_database_url_uses_async_drivers():
+    assert async_database_url("sqlite:///./ecommerce.db") == "sqlite+aiosqlite:///./ecommerce.db"
+    assert async_database_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert "poolclass" in async_engine_options("sqlite+aiosqlite:///./ecommerce.db")
+    assert async_engine_options("sqlite+aiosqlite:///:memory:") == {}
+
+def test_create_and_list_items(app):
+    for i in range(3):
+        response = request(app, "POST", "/items/", json={"title": f"Item {i}", "description": "desc"})
+        assert response.status_code == 200
+        assert response.json()["owner_id"] is None
+
+    response = request(app, "GET", "/items/", params={"skip": 1, "limit": 5})
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Item 1", "Item 2"]
+
+def test_create_and_read_user(app):
+    response = request(app, "POST", "/users/", json={"email": "user@example.com", "password": "secret"})
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    response = request(app, "GET", f"/users/{user_id}")
+
+    assert response.json() == {"email": "user@example.com", "id": user_id, "is_active": True}
+    assert request(app, "GET", "/users/999").status_code == 404
+
+def test_keyset_pages_follow_next_cursor(app):
+    for i in range(5):
+        request(app, "POST", "/items/", json={"title": f"Item {i}"})
+
+    def walk(**params):
+        titles, cursor = [], None
+        while True:
+            response = request(app, "GET", "/items/", params={"limit": 2, **params, **({"cursor": cursor} if cursor else {})})
+            assert response.status_code == 200
+            titles += [item["title"] for item in response.json()]
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                return titles
+
+    assert walk() == [f"Item {i}" for i in range(5)]
+    assert walk(order="desc") == [f"Item {i}" for i in reversed(range(5))]
+    assert walk(owner_id=1) == []
+
+    cursor = request(app, "GET", "/items/", params={"limit": 2}).headers["x-next-cursor"]
+    assert request(app, "GET", "/items/", params={"cursor": cursor, "skip": 2}).status_code == 400
+    assert request(app, "GET", "/items/", params={"cursor": cursor, "order": "desc"}).status_code == 400
+    assert request(app, "GET", "/items/", params={"cursor": "garbage"}).status_code == 400
+
+def test_bulk_create_returns_ids_in_input_order(app):
+    items = [{"title": f"Bulk {i}", "description": "desc"} for i in range(2500)]
+
+    response = request(app, "POST", "/items/bulk", json={"items": items})
+
+    body = response.json()
+    assert (body["created"], body["failed"], body["errors"]) == (2500, 0, [])
+    assert body["ids"] == list(range(1, 2501))
+    latest = request(app, "GET", "/items/", params={"limit": 2, "order": "desc"}).json()
+    assert [(item["id"], item["title"]) for item in latest] == [(2500, "Bulk 2499"), (2499, "Bulk 2498")]
+
+def test_bulk_create_reports_failed_chunk_and_keeps_the_rest(app, monkeypatch):
+    monkeypatch.setattr(settings, "ITEMS_BULK_CHUNK_SIZE", 2)
+    owner_id = request(app, "POST", "/users/", json={"email": "seller@example.com", "password": "pw"}).json()["id"]
+    items = [{"title": f"Item {i}", "owner_id": owner_id} for i in range(5)]
+    items[3]["owner_id"] = 999
+
+    body = request(app, "POST", "/items/bulk", json={"items": items}).json()
+
+    assert (body["created"], body["failed"]) == (3, 2)
+    assert body["ids"][2:4] == [None, None] and None not in body["ids"][:2] + body["ids"][4:]
+    assert [(error["start"], error["count"]) for error in body["errors"]] == [(2, 2)]
+    assert "FOREIGN KEY" in body["errors"][0]["error"]
+    titles = [item["title"] for item in request(app, "GET", "/items/", params={"owner_id": owner_id}).json()]
+    assert titles == ["Item 0", "Item 1", "Item 4"]
+
+def test_bulk_create_rejects_empty_and_oversized_batches(app):
+    assert request(app, "POST", "/items/bulk", json={"items": []}).status_code == 422
+    too_many = [{"title": "x"}] * (settings.ITEMS_BULK_MAX_ITEMS + 1)
+    assert request(app, "POST", "/items/bulk", json={"items": too_many}).status_code == 422
+
+def test_search_matches_title_or_description(app):
+    for title, description in [("Red Shoes", "leather"), ("Blue Hat", "red wool"), ("Green Bag", "50% off_sale")]:
+        request(app, "POST", "/items/", json={"title": title, "description": description})
+
+    def search(q, **params):
+        response = request(app, "GET", "/items/", params={"q": q, **params})
+        assert response.status_code == 200
+        return [item["title"] for item in response.json()], response.headers.get("x-next-cursor")
+
+    assert search("RED") == (["Red Shoes", "Blue Hat"], None)
+    assert search("% o") == (["Green Bag"], None)
+    assert search("f_s") == (["Green Bag"], None)
+    assert search("0%_") == ([], None)
+
+    titles, cursor = search("red", limit=1)
+    assert titles == ["Red Shoes"]
+    assert search("red", limit=1, cursor=cursor)[0] == ["Blue Hat"]
+    assert request(app, "GET", "/items/", params={"q": "re"}).status_code == 422
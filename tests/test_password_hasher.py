@@ -0,0 +1,67 @@
+# tests/test_password_hasher.py
+
+import asyncio
+import time
+import pytest
+from fastapi import HTTPException
+from app.services import auth
+from app.services.password_hasher import PasswordHasher, PasswordHasherBusy
+from app.schemas.user import UserLogin
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, max_concurrency=1, max_queue=1, queue_timeout=5)
+    yield hasher
+    hasher.shutdown()
+
+def test_hash_and_verify_run_in_process_pool(hasher):
+    async def main():
+        hashed = await hasher.hash("secret")
+        return hashed, await hasher.verify("secret", hashed), await hasher.verify("wrong", hashed)
+
+    hashed, ok, wrong = asyncio.run(main())
+
+    assert hashed.startswith("$2") and ok and not wrong
+    stats = hasher.stats()
+    assert (stats["completed"], stats["in_flight"], stats["waiting"], stats["rejected"]) == (3, 0, 0, 0)
+
+def test_sheds_requests_beyond_queue_and_timeout(hasher):
+    async def main():
+        # 프로세스 시작 비용이 측정에 섞이지 않도록 풀을 먼저 띄웁니다.
+        await hasher.run(time.sleep, 0)
+        running = asyncio.create_task(hasher.run(time.sleep, 0.5))
+        await asyncio.sleep(0.05)
+        queued = asyncio.create_task(hasher.run(time.sleep, 0))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.run(time.sleep, 0)
+        assert hasher.stats()["waiting"] == 1
+        await asyncio.gather(running, queued)
+
+        hasher.queue_timeout = 0.05
+        running = asyncio.create_task(hasher.run(time.sleep, 0.5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.run(time.sleep, 0)
+        await running
+
+    asyncio.run(main())
+
+    stats = hasher.stats()
+    assert (stats["rejected"], stats["timeouts"], stats["completed"], stats["max_waiting"]) == (1, 1, 4, 1)
+
+def test_login_returns_503_when_hasher_is_saturated(monkeypatch):
+    async def get_user(username):
+        return {"id": 1, "username": username, "hashed_password": "$2b$12$x"}
+
+    async def busy(*args):
+        raise PasswordHasherBusy("full")
+
+    monkeypatch.setattr(auth, "get_user_by_username", get_user)
+    monkeypatch.setattr(auth.password_hasher, "verify", busy)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(auth.login_user(UserLogin(username="kim", password="secret")))
+
+    assert error.value.status_code == 503
+    assert error.value.headers["Retry-After"] == "1"
@@ -0,0 +1,178 @@
+# tests/test_search_cache.py
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from app.schemas.search import SearchRequest
+from app.services.search_cache import SearchCache, MemorySearchCacheBackend, RedisSearchCacheBackend
+from app.services.search_service import SearchService, AsyncSearchService
+from app.utils.ttl_cache import TTLCache, MISSING
+
+ES_RESPONSE = {"hits": {"total": {"value": 0, "relation": "eq"}, "hits": []}}
+
+def test_ttl_cache_evicts_least_recently_used_and_expires():
+    cache = TTLCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+    cache.set("short", 1, ttl=0)
+    assert cache.get("short") is MISSING
+    assert cache.stats()["expirations"] == 1
+
+def test_key_normalizes_query_whitespace_and_case():
+    cache = SearchCache(ttl=60)
+    a = cache.make_key("items", SearchRequest(query="  Prada   백 "), 0)
+    b = cache.make_key("items", SearchRequest(query="prada 백"), 0)
+    c = cache.make_key("items", SearchRequest(query="prada 백", min_price=1000), 0)
+    assert a == b
+    assert a != c
+
+def test_repeated_search_hits_cache_until_index_invalidated():
+    es = MagicMock()
+    es.search.return_value = ES_RESPONSE
+    cache = SearchCache(MemorySearchCacheBackend(max_entries=10), ttl=60)
+    service = SearchService(es=es, index_name="items", cache=cache)
+    request = SearchRequest(query="프라다")
+
+    service.search_items(request)
+    service.search_items(request)
+    assert es.search.call_count == 1
+
+    cache.invalidate("other")
+    service.search_items(request)
+    assert es.search.call_count == 1
+
+    cache.invalidate("items")
+    service.search_items(request)
+    assert es.search.call_count == 2
+    assert cache.stats()["hits"] == 2
+
+def test_concurrent_sync_misses_are_coalesced():
+    cache = SearchCache(MemorySearchCacheBackend(max_entries=10), ttl=60)
+    request = SearchRequest(query="프라다")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("items", request, loader))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["result"] * 8
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 7
+
+def test_concurrent_async_misses_are_coalesced():
+    es = MagicMock()
+
+    async def slow_search(**kwargs):
+        await asyncio.sleep(0.05)
+        return ES_RESPONSE
+
+    es.search = AsyncMock(side_effect=slow_search)
+    service = AsyncSearchService(es=es, index_name="items", cache=SearchCache(MemorySearchCacheBackend(max_entries=10), ttl=60))
+
+    async def run():
+        request = SearchRequest(query="프라다")
+        return await asyncio.gather(*(service.search_items(request) for _ in range(20)))
+
+    results = asyncio.run(run())
+    assert es.search.await_count == 1
+    assert all(r is results[0] for r in results)
+
+def test_cancelled_leader_does_not_cancel_coalesced_requests():
+    es = MagicMock()
+
+    async def slow_search(**kwargs):
+        await asyncio.sleep(0.05)
+        return ES_RESPONSE
+
+    es.search = AsyncMock(side_effect=slow_search)
+    service = AsyncSearchService(es=es, index_name="items", cache=SearchCache(MemorySearchCacheBackend(max_entries=10), ttl=60))
+
+    async def run():
+        request = SearchRequest(query="프라다")
+        leader = asyncio.create_task(service.search_items(request))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(service.search_items(request)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        # 첫 요청의 클라이언트가 연결을 끊어도 나머지 요청은 같은 검색 결과를 받습니다.
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    results = asyncio.run(run())
+    assert es.search.await_count == 1
+    assert all(r["total"] == 0 for r in results)
+
+@pytest.fixture
+def fake_redis_server():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis, fakeredis.FakeServer()
+
+def redis_backend(fake_redis_server):
+    fakeredis, server = fake_redis_server
+    return RedisSearchCacheBackend(
+        fakeredis.FakeRedis(server=server),
+        fakeredis.FakeAsyncRedis(server=server),
+    )
+
+def test_redis_backend_shares_entries_and_invalidation_across_workers(fake_redis_server):
+    es = MagicMock()
+    es.search.return_value = {
+        "hits": {"total": {"value": 1, "relation": "eq"}, "hits": [{"_source": {"title": "프라다 백", "price": 1000}, "sort": [1000, "a"]}]}
+    }
+    worker_a = SearchService(es=es, index_name="items", cache=SearchCache(redis_backend(fake_redis_server), ttl=60))
+    worker_b = SearchService(es=es, index_name="items", cache=SearchCache(redis_backend(fake_redis_server), ttl=60))
+    request = SearchRequest(query="프라다")
+
+    first = worker_a.search_items(request)
+    second = worker_b.search_items(request)
+    assert es.search.call_count == 1
+    assert second["results"][0]["title"] == first["results"][0]["title"]
+    assert worker_b.cache.stats()["hits"] == 1
+
+    worker_a.cache.invalidate("items")
+    worker_b.search_items(request)
+    assert es.search.call_count == 2
+
+def test_redis_backend_async_path(fake_redis_server):
+    es = MagicMock()
+    es.search = AsyncMock(return_value=ES_RESPONSE)
+    service = AsyncSearchService(es=es, index_name="items", cache=SearchCache(redis_backend(fake_redis_server), ttl=60))
+
+    async def run():
+        request = SearchRequest(query="프라다")
+        await service.search_items(request)
+        return await service.search_items(request)
+
+    assert asyncio.run(run())["total"] == 0
+    assert es.search.await_count == 1
+
+def test_backend_failure_falls_back_to_elasticsearch():
+    backend = MagicMock()
+    backend.generation.side_effect = ConnectionError("redis down")
+    es = MagicMock()
+    es.search.return_value = ES_RESPONSE
+    cache = SearchCache(backend, ttl=60)
+
+    SearchService(es=es, index_name="items", cache=cache).search_items(SearchRequest(query="프라다"))
+
+    assert es.search.call_count == 1
+    assert cache.errors == 1
@@ -0,0 +1,230 @@
+# tests/test_search_service.py
+
+import asyncio
+import pytest
+from pydantic import ValidationError
+from unittest.mock import MagicMock, AsyncMock
+from app.core.config import settings
+from app.schemas.search import SearchRequest, SearchResponse
+from app.services.search_cache import SearchCache
+from app.services.search_service import SearchService, AsyncSearchService, decode_cursor, encode_cursor
+
+def make_es_response(n: int = 2):
+    return {
+        "hits": {
+            "total": {"value": n, "relation": "eq"},
+            "hits": [
+                {
+                    "_id": str(i),
+                    "_source": {"category": "프라다", "title": f"프라다 가방 {i}", "price": 1000 * (i + 1)},
+                    "sort": [1000 * (i + 1), f"https://m.bunjang.co.kr/products/{i}"],
+                }
+                for i in range(n)
+            ],
+        }
+    }
+
+def test_sync_and_async_services_build_same_result():
+    request = SearchRequest(query="프라다", min_price=100, max_price=5000)
+
+    sync_es = MagicMock()
+    sync_es.search.return_value = make_es_response()
+    async_es = MagicMock()
+    async_es.search = AsyncMock(return_value=make_es_response())
+
+    sync_result = SearchService(es=sync_es, index_name="items").search_items(request)
+    async_result = asyncio.run(AsyncSearchService(es=async_es, index_name="items").search_items(request))
+
+    assert sync_result == async_result
+    assert async_result["total"] == 2
+    assert sync_es.search.call_args.kwargs["body"] == async_es.search.call_args.kwargs["body"]
+
+def test_shallow_page_uses_from_size_with_tiebreaker():
+    es = MagicMock()
+    es.search.return_value = make_es_response()
+
+    SearchService(es=es, index_name="items").search_items(SearchRequest(query="프라다", page=3, size=2))
+
+    body = es.search.call_args.kwargs["body"]
+    assert body["from"] == 4
+    assert body["sort"] == [{"price": {"order": "desc"}}, {"link": {"order": "asc"}}]
+
+def test_deep_page_beyond_window_is_rejected():
+    with pytest.raises(ValidationError):
+        SearchRequest(query="프라다", page=200, size=10)
+
+def make_pit_response(n: int = 2, pit_id: str = "pit-1"):
+    response = make_es_response(n)
+    for i, hit in enumerate(response["hits"]["hits"]):
+        hit["sort"].append(i)  # _shard_doc
+    response["pit_id"] = pit_id
+    return response
+
+def test_cursor_mode_opens_pit_on_first_page_and_reuses_it():
+    es = MagicMock()
+    es.search.return_value = make_pit_response(2)
+    es.open_point_in_time.return_value = {"id": "pit-1"}
+    service = SearchService(es=es, index_name="items")
+
+    first = service.search_items(SearchRequest(query="프라다", size=2, cursor_mode=True))
+
+    es.open_point_in_time.assert_called_once()
+    kwargs = es.search.call_args.kwargs
+    assert "index" not in kwargs and "search_after" not in kwargs["body"]
+    assert kwargs["body"]["pit"]["id"] == "pit-1"
+    assert kwargs["body"]["sort"][-1] == {"_shard_doc": {"order": "asc"}}
+    assert decode_cursor(first["next_cursor"]) == {"pit": "pit-1", "sort": [2000, "https://m.bunjang.co.kr/products/1", 1]}
+
+    es.search.return_value = make_pit_response(2, pit_id="pit-2")
+    second = service.search_items(SearchRequest(query="프라다", size=2, cursor=first["next_cursor"]))
+
+    es.open_point_in_time.assert_called_once()
+    body = es.search.call_args.kwargs["body"]
+    assert body["pit"]["id"] == "pit-1"
+    assert body["search_after"] == [2000, "https://m.bunjang.co.kr/products/1", 1]
+    assert second["page"] is None
+    assert decode_cursor(second["next_cursor"])["pit"] == "pit-2"
+
+def test_page_mode_does_not_open_pit_or_return_cursor():
+    es = MagicMock()
+    es.search.return_value = make_es_response(2)
+
+    result = SearchService(es=es, index_name="items").search_items(SearchRequest(query="프라다", size=2))
+
+    es.open_point_in_time.assert_not_called()
+    assert result["next_cursor"] is None
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(None, [1000]))
+
+def test_single_page_cursor_mode_closes_pit_immediately():
+    es = MagicMock()
+    es.search.return_value = make_pit_response(1)
+    es.open_point_in_time.return_value = {"id": "pit-1"}
+
+    result = SearchService(es=es, index_name="items").search_items(SearchRequest(query="프라다", size=2, cursor_mode=True))
+
+    assert result["next_cursor"] is None
+    es.close_point_in_time.assert_called_once_with(id="pit-1")
+
+def test_cursor_requests_bypass_result_cache():
+    es = MagicMock()
+    es.search.side_effect = lambda **kwargs: make_pit_response(2)
+    es.open_point_in_time.side_effect = [{"id": "pit-a"}, {"id": "pit-b"}]
+    service = SearchService(es=es, index_name="items", cache=SearchCache(ttl=60))
+    request = SearchRequest(query="프라다", size=2, cursor_mode=True)
+
+    first = service.search_items(request)
+    es.search.side_effect = lambda **kwargs: make_pit_response(2, pit_id=kwargs["body"]["pit"]["id"])
+    second = service.search_items(request)
+
+    assert decode_cursor(second["next_cursor"])["pit"] == "pit-b"
+    cursor = first["next_cursor"]
+    service.search_items(SearchRequest(query="프라다", size=2, cursor=cursor))
+    service.search_items(SearchRequest(query="프라다", size=2, cursor=cursor))
+    assert es.search.call_count == 4
+    assert service.cache.hits == service.cache.misses == 0
+
+def test_last_cursor_page_closes_pit():
+    es = MagicMock()
+    es.search.return_value = make_es_response(1)
+    service = SearchService(es=es, index_name="items")
+    cursor = "eyJwaXQiOiJwaXQtMSIsInNvcnQiOlsxMDAwLCJhIiwzXX0="  # {"pit":"pit-1","sort":[1000,"a",3]}
+
+    result = service.search_items(SearchRequest(query="프라다", size=2, cursor=cursor))
+
+    assert result["next_cursor"] is None
+    es.close_point_in_time.assert_called_once_with(id="pit-1")
+
+def test_text_match_in_must_and_filters_in_filter_context():
+    es = MagicMock()
+    es.search.return_value = make_es_response()
+    request = SearchRequest(query="프라다", min_price=100, category=["가방"], status="판매중")
+
+    SearchService(es=es, index_name="items").search_items(request)
+
+    body = es.search.call_args.kwargs["body"]
+    query = body["query"]["bool"]
+    assert "should" not in query
+    assert query["must"][0]["match"]["title"]["query"] == "프라다"
+    assert {"range": {"price": {"gte": 100}}} in query["filter"]
+    assert {"terms": {"category": ["가방"]}} in query["filter"]
+    assert {"term": {"status": "판매중"}} in query["filter"]
+    assert body["track_total_hits"] == settings.SEARCH_TRACK_TOTAL_HITS
+    assert "aggs" not in body and "post_filter" not in body
+
+def test_title_minimum_should_match_is_opt_in(monkeypatch):
+    es = MagicMock()
+    es.search.return_value = make_es_response()
+    service = SearchService(es=es, index_name="items")
+
+    service.search_items(SearchRequest(query="프라다 가방"))
+    assert es.search.call_args.kwargs["body"]["query"]["bool"]["must"][0] == {"match": {"title": {"query": "프라다 가방"}}}
+
+    monkeypatch.setattr(settings, "SEARCH_TITLE_MINIMUM_SHOULD_MATCH", "75%")
+    service.search_items(SearchRequest(query="프라다 지갑"))
+    assert es.search.call_args.kwargs["body"]["query"]["bool"]["must"][0]["match"]["title"]["minimum_should_match"] == "75%"
+
+def test_category_facets_use_post_filter():
+    es = MagicMock()
+    response = make_es_response()
+    response["hits"]["total"] = {"value": 1000, "relation": "gte"}
+    response["aggregations"] = {"category": {"buckets": [{"key": "가방", "doc_count": 7}, {"key": "지갑", "doc_count": 3}]}}
+    es.search.return_value = response
+
+    result = SearchService(es=es, index_name="items").search_items(SearchRequest(query="프라다", category=["가방"], facets=True))
+
+    body = es.search.call_args.kwargs["body"]
+    assert body["post_filter"] == {"terms": {"category": ["가방"]}}
+    assert body["aggs"]["category"]["terms"]["field"] == "category"
+    assert body["query"]["bool"]["filter"] == []
+    assert result["facets"] == {"category": [{"key": "가방", "count": 7}, {"key": "지갑", "count": 3}]}
+    assert (result["total"], result["total_relation"]) == (1000, "gte")
+    SearchResponse(**result)
+
+def test_cursor_page_skips_facet_aggregation():
+    es = MagicMock()
+    es.search.return_value = make_es_response(2)
+    service = SearchService(es=es, index_name="items")
+    first = service.search_items(SearchRequest(query="프라다", size=2, facets=True))
+
+    service.search_items(SearchRequest(query="프라다", size=2, facets=True, search_after=first["last_sort"]))
+
+    assert "aggs" not in es.search.call_args.kwargs["body"]
+
+def test_source_includes_response_fields_and_results_are_plain_dicts():
+    es = MagicMock()
+    response = make_es_response(1)
+    response["hits"]["hits"][0]["_source"]["fingerprint"] = "abc"
+    es.search.return_value = response
+
+    result = SearchService(es=es, index_name="items").search_items(SearchRequest(query="프라다"))
+
+    assert es.search.call_args.kwargs["body"]["_source"] == [
+        "category", "title", "price", "registration_date", "location", "link", "src", "status"
+    ]
+    item = result["results"][0]
+    assert type(item) is dict and "fingerprint" not in item
+    assert (item["title"], item["location"]) == ("프라다 가방 0", None)
+    SearchResponse(**result)
+
+def test_search_endpoint_serializes_with_orjson():
+    import httpx
+    from fastapi import FastAPI
+    from app.api.v1.endpoints.search import router
+    from app.dependencies import get_async_search_service
+
+    es = MagicMock()
+    es.search = AsyncMock(return_value=make_es_response(2))
+    app = FastAPI()
+    app.include_router(router, prefix="/search")
+    app.dependency_overrides[get_async_search_service] = lambda: AsyncSearchService(es=es, index_name="items")
+
+    async def post():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post("/search/", json={"query": "프라다", "size": 2})
+
+    response = asyncio.run(post())
+
+    assert response.status_code == 200
+    assert response.json() == SearchResponse(**response.json()).dict()
+    assert response.json()["results"][1]["price"] == 2000
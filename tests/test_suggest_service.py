@@ -0,0 +1,77 @@
+# tests/test_suggest_service.py
+
+import asyncio
+import pytest
+from elasticsearch import AsyncElasticsearch, Elasticsearch, helpers
+from benchmarks.stub_es import StubEsCluster
+from app.services.suggest_service import SuggestService, title_keys
+from app.utils.prefix_trie import PrefixTrie
+
+TITLES = ["프라다 가방"] * 5 + ["프라다 지갑"] * 3 + ["(정품) 프라이탁 가방"] * 2 + ["나이키 신발"]
+
+def test_trie_keeps_top_values_per_prefix():
+    trie = PrefixTrie(top_k=2, max_depth=4)
+    trie.insert("프라다 가방", "프라다 가방", 5)
+    trie.insert("프라다 지갑", "프라다 지갑", 3)
+    trie.insert("프라이탁", "프라이탁", 4)
+    trie.insert("프라다 가방", "프라다 가방", 1)  # 낮은 점수로 다시 넣어도 순위는 유지
+
+    assert trie.find("프라") == ["프라다 가방", "프라이탁"]
+    assert trie.find("프라다") == ["프라다 가방", "프라다 지갑"]
+    assert trie.find("나") is None
+    assert trie.find("프라다 가") is None  # max_depth보다 긴 접두어
+
+def test_title_keys_start_at_each_word():
+    assert title_keys("(정품) 프라이탁 가방", 3) == ["정품 프라이탁 가방", "프라이탁 가방", "가방"]
+    assert title_keys("Nike  Air", 1) == ["nike air"]
+
+@pytest.fixture
+def cluster():
+    with StubEsCluster() as stub:
+        es = Elasticsearch(stub.url)
+        helpers.bulk(es, ({"_index": "items", "_id": str(i), "_source": {"title": t}} for i, t in enumerate(TITLES)))
+        yield stub
+
+def test_hot_prefix_is_served_from_trie(cluster):
+    async def run():
+        es = AsyncElasticsearch(cluster.url)
+        service = SuggestService(es, index_name="items", top_k=3)
+        try:
+            await service.refresh()
+            searches = len(cluster.search_requests)
+            hot = await service.suggest("프라", size=2)
+            word = await service.suggest("가방", size=2)
+            rare = await service.suggest("없는상품", size=2)
+            return hot, word, rare, len(cluster.search_requests) - searches, service.stats()
+        finally:
+            await es.close()
+
+    hot, word, rare, es_searches, stats = asyncio.run(run())
+
+    assert hot == {"query": "프라", "suggestions": ["프라다 가방", "프라다 지갑"], "source": "trie"}
+    assert word["suggestions"] == ["프라다 가방", "(정품) 프라이탁 가방"]
+    assert rare["source"] == "es"
+    assert es_searches == 1
+    assert (stats["trie_hits"], stats["es_queries"]) == (2, 1)
+
+def test_refresh_builds_trie_from_terms_aggregation(cluster):
+    async def run():
+        es = AsyncElasticsearch(cluster.url)
+        service = SuggestService(es, index_name="items", trie_size=2, top_k=3)
+        try:
+            await service.refresh()
+            searches = len(cluster.search_requests)
+            partial = await service.suggest("프라", size=3)
+            return service, partial, len(cluster.search_requests) - searches
+        finally:
+            await es.close()
+
+    service, partial, es_searches = asyncio.run(run())
+
+    # 문서를 scroll로 읽지 않고 집계 요청 하나로 만듭니다.
+    assert not cluster._scrolls
+    assert service.trie.find("프") == ["프라다 가방", "프라다 지갑"]
+    assert service.trie_complete is False
+    # trie에서 모자란 제안은 Elasticsearch 결과로 채웁니다.
+    assert partial == {"query": "프라", "suggestions": ["프라다 가방", "프라다 지갑", "(정품) 프라이탁 가방"], "source": "trie+es"}
+    assert es_searches == 1